@@ -134,6 +134,14 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--log-no-color", action="store_true", help="Disable color logs"
     )
+    parser.add_argument(
+        "--startup-trace",
+        action="store_true",
+        help=(
+            "Write a timeline of the startup as Chrome trace events to"
+            " CONFIG/startup_trace.json"
+        ),
+    )
     parser.add_argument(
         "--script", nargs=argparse.REMAINDER, help="Run one of the embedded scripts"
     )
@@ -206,6 +214,7 @@ def main() -> int:
         safe_mode=args.safe_mode,
         debug=args.debug,
         open_ui=args.open_ui,
+        startup_trace=args.startup_trace,
     )
 
     fault_file_name = os.path.join(config_dir, FAULT_LOG_FILENAME)
@@ -15,6 +15,7 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.util import dt as dt_util
 
 from . import auth_store, jwt_wrapper, models
+from .access_token_cache import AccessTokenCache
 from .const import ACCESS_TOKEN_EXPIRATION, GROUP_ID_ADMIN
 from .mfa_modules import MultiFactorAuthModule, auth_mfa_module_from_config
 from .providers import AuthProvider, LoginFlow, auth_provider_from_config
@@ -158,6 +159,7 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, list[CALLBACK_TYPE]] = {}
+        self._access_token_cache = AccessTokenCache()
 
     @property
     def auth_providers(self) -> list[AuthProvider]:
@@ -310,6 +312,7 @@ class AuthManager:
             await asyncio.gather(*tasks)
 
         await self._store.async_remove_user(user)
+        self._access_token_cache.remove_user(user)
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -350,6 +353,7 @@ class AuthManager:
         if user.is_owner:
             raise ValueError("Unable to deactivate the owner")
         await self._store.async_deactivate_user(user)
+        self._access_token_cache.remove_user(user)
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
         """Remove credentials."""
@@ -359,6 +363,7 @@ class AuthManager:
             await provider.async_will_remove_credentials(credentials)
 
         await self._store.async_remove_credentials(credentials)
+        self._access_token_cache.remove_credentials(credentials)
 
     async def async_enable_user_mfa(
         self, user: models.User, mfa_module_id: str, data: Any
@@ -473,6 +478,7 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._access_token_cache.remove_refresh_token(refresh_token)
 
         callbacks = self._revoke_callbacks.pop(refresh_token.id, [])
         for revoke_callback in callbacks:
@@ -554,6 +560,9 @@ class AuthManager:
         self, token: str
     ) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        if (refresh_token := self._access_token_cache.get(token)) is not None:
+            return refresh_token if refresh_token.user.is_active else None
+
         try:
             unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
         except jwt.InvalidTokenError:
@@ -571,7 +580,7 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt_wrapper.verify_and_decode(
+            payload = jwt_wrapper.verify_and_decode(
                 token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
             )
         except jwt.InvalidTokenError:
@@ -580,8 +589,14 @@ class AuthManager:
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        self._access_token_cache.set(token, refresh_token, payload["exp"])
         return refresh_token
 
+    @callback
+    def async_get_access_token_cache_stats(self) -> dict[str, Any]:
+        """Return the statistics of the verified access token cache."""
+        return self._access_token_cache.as_dict()
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
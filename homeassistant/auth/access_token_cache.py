@@ -0,0 +1,95 @@
+"""Cache of validated access tokens."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+import time
+from typing import Any
+
+from . import models
+
+ACCESS_TOKEN_CACHE_SIZE = 256
+
+
+class AccessTokenCache:
+    """Bounded cache of verified access tokens.
+
+    Verifying an access token requires looking up its refresh token and
+    checking the HS256 signature and the claims. Tokens that passed are
+    cached with their refresh token until they expire, the least recently
+    used tokens are evicted when the cache is full.
+    """
+
+    def __init__(self, maxsize: int = ACCESS_TOKEN_CACHE_SIZE) -> None:
+        """Initialize the cache."""
+        self._maxsize = maxsize
+        self._tokens: OrderedDict[
+            str, tuple[models.RefreshToken, float]
+        ] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    def get(self, token: str) -> models.RefreshToken | None:
+        """Return the refresh token of a cached access token."""
+        if (cached := self._tokens.get(token)) is None:
+            self.misses += 1
+            return None
+        refresh_token, expire = cached
+        if time.time() >= expire:
+            del self._tokens[token]
+            self.expired += 1
+            self.misses += 1
+            return None
+        self._tokens.move_to_end(token)
+        self.hits += 1
+        return refresh_token
+
+    def set(
+        self, token: str, refresh_token: models.RefreshToken, expire: float
+    ) -> None:
+        """Cache a verified access token until it expires."""
+        self._tokens[token] = (refresh_token, expire)
+        self._tokens.move_to_end(token)
+        if len(self._tokens) > self._maxsize:
+            self._tokens.popitem(last=False)
+            self.evictions += 1
+
+    def _remove(self, matches: Callable[[models.RefreshToken], bool]) -> None:
+        """Remove the access tokens of refresh tokens that match."""
+        for token in [
+            token
+            for token, (refresh_token, _) in self._tokens.items()
+            if matches(refresh_token)
+        ]:
+            del self._tokens[token]
+
+    def remove_refresh_token(self, refresh_token: models.RefreshToken) -> None:
+        """Remove the access tokens of a refresh token."""
+        self._remove(lambda cached: cached.id == refresh_token.id)
+
+    def remove_credentials(self, credentials: models.Credentials) -> None:
+        """Remove the access tokens of refresh tokens bound to credentials."""
+        self._remove(lambda cached: cached.credential is credentials)
+
+    def remove_user(self, user: models.User) -> None:
+        """Remove the access tokens of a user."""
+        self._remove(lambda cached: cached.user is user)
+
+    def clear(self) -> None:
+        """Remove all access tokens."""
+        self._tokens.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics of the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._tokens),
+            "maxsize": self._maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+        }
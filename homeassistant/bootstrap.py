@@ -19,6 +19,7 @@ import yarl
 from . import config as conf_util, config_entries, core, loader
 from .components import http
 from .const import (
+    EVENT_HOMEASSISTANT_STARTED,
     FORMAT_DATETIME,
     REQUIRED_NEXT_PYTHON_HA_RELEASE,
     REQUIRED_NEXT_PYTHON_VER,
@@ -27,6 +28,7 @@ from .const import (
 from .exceptions import HomeAssistantError
 from .helpers import (
     area_registry,
+    config_per_platform,
     device_registry,
     entity,
     entity_registry,
@@ -36,8 +38,10 @@ from .helpers import (
     template,
 )
 from .helpers.dispatcher import async_dispatcher_send
+from .helpers.json import save_json
 from .helpers.typing import ConfigType
 from .setup import (
+    BASE_PLATFORMS,
     DATA_SETUP,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
@@ -45,8 +49,11 @@ from .setup import (
     async_setup_component,
 )
 from .util import dt as dt_util
+from .util.file import WriteError
+from .util.json import SerializationError
 from .util.logging import async_activate_log_queue_handler
 from .util.package import async_get_user_site, is_virtual_env
+from .util.timeline import Timeline
 
 if TYPE_CHECKING:
     from .runner import RuntimeConfig
@@ -54,6 +61,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 ERROR_LOG_FILENAME = "home-assistant.log"
+STARTUP_TRACE_FILENAME = "startup_trace.json"
 
 # hass.data key for logging information.
 DATA_LOGGING = "logging"
@@ -112,6 +120,8 @@ async def async_setup_hass(
     """Set up Home Assistant."""
     hass = core.HomeAssistant()
     hass.config.config_dir = runtime_config.config_dir
+    if runtime_config.startup_trace:
+        async_record_startup_timeline(hass)
 
     async_enable_logging(
         hass,
@@ -223,6 +233,32 @@ def open_hass_ui(hass: core.HomeAssistant) -> None:
         )
 
 
+@core.callback
+def async_record_startup_timeline(hass: core.HomeAssistant) -> None:
+    """Record the startup timeline and write it once Home Assistant has started.
+
+    The timeline is written as Chrome trace events to STARTUP_TRACE_FILENAME
+    in the config directory.
+    """
+    timeline = hass.data[loader.DATA_STARTUP_TIMELINE] = Timeline()
+
+    async def _async_write_startup_trace(_: core.Event) -> None:
+        """Write the startup timeline."""
+        timeline.add_span(
+            "startup", "bootstrap", "bootstrap", timeline.start, monotonic()
+        )
+        timeline.stop()
+        path = hass.config.path(STARTUP_TRACE_FILENAME)
+        try:
+            await hass.async_add_executor_job(save_json, path, timeline.as_trace())
+        except (SerializationError, WriteError) as err:
+            _LOGGER.error("Unable to write the startup trace: %s", err)
+            return
+        _LOGGER.info("Wrote the startup trace to %s", path)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_write_startup_trace)
+
+
 async def load_registries(hass: core.HomeAssistant) -> None:
     """Load the registries and cache the result of platform.uname().processor."""
     if DATA_REGISTRIES_LOADED in hass.data:
@@ -249,6 +285,7 @@ async def load_registries(hass: core.HomeAssistant) -> None:
         issue_registry.async_load(hass),
         hass.async_add_executor_job(_cache_uname_processor),
         template.async_load_custom_templates(hass),
+        template.async_load_bytecode_cache(hass),
         restore_state.async_load(hass),
     )
 
@@ -264,20 +301,25 @@ async def async_from_config_dict(
     start = monotonic()
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
-    await hass.config_entries.async_initialize()
-    await load_registries(hass)
+    with loader.async_startup_timeline_span(
+        hass, "load registries", "bootstrap", "bootstrap"
+    ):
+        await hass.config_entries.async_initialize()
+        await load_registries(hass)
 
     # Set up core.
     _LOGGER.debug("Setting up %s", CORE_INTEGRATIONS)
 
-    if not all(
-        await asyncio.gather(
+    with loader.async_startup_timeline_span(
+        hass, "core integrations", "bootstrap", "bootstrap"
+    ):
+        core_results = await asyncio.gather(
             *(
                 async_setup_component(hass, domain, config)
                 for domain in CORE_INTEGRATIONS
             )
         )
-    ):
+    if not all(core_results):
         _LOGGER.error("Home Assistant core failed to initialize. ")
         return None
 
@@ -516,15 +558,22 @@ async def async_setup_multi_components(
     hass: core.HomeAssistant,
     domains: set[str],
     config: dict[str, Any],
+    stage: str | None = None,
 ) -> None:
-    """Set up multiple domains. Log on failure."""
+    """Set up multiple domains. Log on failure.
+
+    The setup is recorded as stage in the startup timeline.
+    """
     futures = {
         domain: hass.async_create_task(
             async_setup_component(hass, domain, config), f"setup component {domain}"
         )
         for domain in domains
     }
-    results = await asyncio.gather(*futures.values(), return_exceptions=True)
+    with loader.async_startup_timeline_span(
+        hass, stage or "setup", "bootstrap", "bootstrap", {"domains": sorted(domains)}
+    ):
+        results = await asyncio.gather(*futures.values(), return_exceptions=True)
     for idx, domain in enumerate(futures):
         result = results[idx]
         if isinstance(result, BaseException):
@@ -535,6 +584,29 @@ async def async_setup_multi_components(
             )
 
 
+@core.callback
+def _async_get_integration_platforms(
+    hass: core.HomeAssistant, config: dict[str, Any]
+) -> dict[str, set[str]]:
+    """Return the entity platforms each integration is expected to set up.
+
+    These are the platforms of the entities the integration registered
+    before, and the platforms it is configured for in YAML.
+    """
+    platforms: dict[str, set[str]] = {}
+    registry: entity_registry.EntityRegistry | None = hass.data.get(
+        entity_registry.DATA_REGISTRY
+    )
+    if registry is not None:
+        for entry in registry.entities.values():
+            platforms.setdefault(entry.platform, set()).add(entry.domain)
+    for platform_domain in BASE_PLATFORMS:
+        for platform_name, _ in config_per_platform(config, platform_domain):
+            if platform_name is not None:
+                platforms.setdefault(platform_name, set()).add(platform_domain)
+    return platforms
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -550,35 +622,38 @@ async def _async_set_up_integrations(
     # that will have to be loaded and start rightaway
     integration_cache: dict[str, loader.Integration] = {}
     to_resolve: set[str] = domains_to_setup
-    while to_resolve:
-        old_to_resolve: set[str] = to_resolve
-        to_resolve = set()
-
-        integrations_to_process = [
-            int_or_exc
-            for int_or_exc in (
-                await loader.async_get_integrations(hass, old_to_resolve)
-            ).values()
-            if isinstance(int_or_exc, loader.Integration)
-        ]
-        resolve_dependencies_tasks = [
-            itg.resolve_dependencies()
-            for itg in integrations_to_process
-            if not itg.all_dependencies_resolved
-        ]
-
-        if resolve_dependencies_tasks:
-            await asyncio.gather(*resolve_dependencies_tasks)
-
-        for itg in integrations_to_process:
-            integration_cache[itg.domain] = itg
-
-            for dep in itg.all_dependencies:
-                if dep in domains_to_setup:
-                    continue
-
-                domains_to_setup.add(dep)
-                to_resolve.add(dep)
+    with loader.async_startup_timeline_span(
+        hass, "resolve dependencies", "bootstrap", "bootstrap"
+    ):
+        while to_resolve:
+            old_to_resolve: set[str] = to_resolve
+            to_resolve = set()
+
+            integrations_to_process = [
+                int_or_exc
+                for int_or_exc in (
+                    await loader.async_get_integrations(hass, old_to_resolve)
+                ).values()
+                if isinstance(int_or_exc, loader.Integration)
+            ]
+            resolve_dependencies_tasks = [
+                itg.resolve_dependencies()
+                for itg in integrations_to_process
+                if not itg.all_dependencies_resolved
+            ]
+
+            if resolve_dependencies_tasks:
+                await asyncio.gather(*resolve_dependencies_tasks)
+
+            for itg in integrations_to_process:
+                integration_cache[itg.domain] = itg
+
+                for dep in itg.all_dependencies:
+                    if dep in domains_to_setup:
+                        continue
+
+                    domains_to_setup.add(dep)
+                    to_resolve.add(dep)
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
@@ -589,22 +664,22 @@ async def _async_set_up_integrations(
     # Load logging as soon as possible
     if logging_domains := domains_to_setup & LOGGING_INTEGRATIONS:
         _LOGGER.info("Setting up logging: %s", logging_domains)
-        await async_setup_multi_components(hass, logging_domains, config)
+        await async_setup_multi_components(hass, logging_domains, config, "logging")
 
     # Setup frontend
     if frontend_domains := domains_to_setup & FRONTEND_INTEGRATIONS:
         _LOGGER.info("Setting up frontend: %s", frontend_domains)
-        await async_setup_multi_components(hass, frontend_domains, config)
+        await async_setup_multi_components(hass, frontend_domains, config, "frontend")
 
     # Setup recorder
     if recorder_domains := domains_to_setup & RECORDER_INTEGRATIONS:
         _LOGGER.info("Setting up recorder: %s", recorder_domains)
-        await async_setup_multi_components(hass, recorder_domains, config)
+        await async_setup_multi_components(hass, recorder_domains, config, "recorder")
 
     # Start up debuggers. Start these first in case they want to wait.
     if debuggers := domains_to_setup & DEBUGGER_INTEGRATIONS:
         _LOGGER.debug("Setting up debuggers: %s", debuggers)
-        await async_setup_multi_components(hass, debuggers, config)
+        await async_setup_multi_components(hass, debuggers, config, "debuggers")
 
     # calculate what components to setup in what stage
     stage_1_domains: set[str] = set()
@@ -637,6 +712,31 @@ async def _async_set_up_integrations(
         - stage_1_domains
     )
 
+    # Import the integrations of each stage in parallel instead of one at a
+    # time in the event loop while they are set up. Stage 2 is imported
+    # while stage 1 is set up so it does not delay stage 1.
+    platforms = _async_get_integration_platforms(hass, config)
+
+    async def _async_import_stage(domains: set[str], stage: str) -> None:
+        """Import the integrations of a stage in the executor."""
+        with loader.async_startup_timeline_span(
+            hass, f"import {stage} integrations", "bootstrap", "bootstrap"
+        ):
+            await loader.async_import_integrations_in_executor(
+                hass,
+                (
+                    integration_cache[domain]
+                    for domain in domains
+                    if domain in integration_cache
+                ),
+                platforms,
+            )
+
+    await _async_import_stage(stage_1_domains, "stage 1")
+    stage_2_import = hass.async_create_task(
+        _async_import_stage(stage_2_domains, "stage 2"), "import stage 2"
+    )
+
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
 
@@ -647,10 +747,14 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                await async_setup_multi_components(
+                    hass, stage_1_domains, config, "stage 1"
+                )
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 1 - moving forward")
 
+    await stage_2_import
+
     # Add after dependencies when setting up stage 2 domains
     async_set_domains_to_be_loaded(hass, stage_2_domains)
 
@@ -660,7 +764,9 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                await async_setup_multi_components(
+                    hass, stage_2_domains, config, "stage 2"
+                )
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 2 - moving forward")
 
@@ -668,7 +774,10 @@ async def _async_set_up_integrations(
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
         async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
-            await hass.async_block_till_done()
+            with loader.async_startup_timeline_span(
+                hass, "wrap up", "bootstrap", "bootstrap"
+            ):
+                await hass.async_block_till_done()
     except asyncio.TimeoutError:
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
 
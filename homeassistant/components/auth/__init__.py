@@ -115,6 +115,34 @@ Result will be a long-lived access token:
     "result": "ABCDEFGH"
 }
 
+## Get the access token cache statistics
+
+Send websocket command `auth/access_token_cache_stats` as an admin to get the
+statistics of the cache of verified access tokens. hit_rate is null until an
+access token was validated.
+
+{
+    "id": 12,
+    "type": "auth/access_token_cache_stats"
+}
+
+The result payload likes
+
+{
+    "id": 12,
+    "type": "result",
+    "success": true,
+    "result": {
+        "size": 3,
+        "maxsize": 256,
+        "hits": 120,
+        "misses": 5,
+        "expired": 2,
+        "evictions": 0,
+        "hit_rate": 0.96
+    }
+}
+
 
 # POST /auth/external/callback
 
@@ -189,6 +217,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     websocket_api.async_register_command(hass, websocket_refresh_tokens)
     websocket_api.async_register_command(hass, websocket_delete_refresh_token)
     websocket_api.async_register_command(hass, websocket_sign_path)
+    websocket_api.async_register_command(hass, websocket_access_token_cache_stats)
 
     await login_flow.async_setup(hass, store_result)
     await mfa_setup_flow.async_setup(hass)
@@ -623,3 +652,15 @@ def websocket_sign_path(
             },
         )
     )
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): "auth/access_token_cache_stats"}
+)
+@websocket_api.require_admin
+@callback
+def websocket_access_token_cache_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the statistics of the verified access token cache."""
+    connection.send_result(msg["id"], hass.auth.async_get_access_token_cache_stats())
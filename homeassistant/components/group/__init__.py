@@ -81,6 +81,7 @@ PLATFORMS = [
 ]
 
 REG_KEY = f"{DOMAIN}_registry"
+EXPAND_CACHE_KEY = f"{DOMAIN}_expand_cache"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -151,6 +152,30 @@ class GroupIntegrationRegistry:
         self.on_states_by_domain[current_domain.get()] = set(on_states)
 
 
+class GroupExpansionCache:
+    """Cache the members of groups expanded by expand_entity_ids.
+
+    An expansion is reused as long as the entity_id attribute of the
+    group and of all groups nested in it did not change, which only
+    needs a state lookup per group instead of expanding every member.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        # The expanded members and the entity_id attribute of each group
+        # they were expanded from, keyed by the group entity_id
+        self.expanded: dict[str, tuple[list[str], dict[str, Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+
+def _group_members_attribute(hass: HomeAssistant, entity_id: str) -> Any:
+    """Return the entity_id attribute of a group."""
+    if (state := hass.states.get(entity_id)) is None:
+        return None
+    return state.attributes.get(ATTR_ENTITY_ID)
+
+
 @bind_hass
 def is_on(hass: HomeAssistant, entity_id: str) -> bool:
     """Test if the group state is in its ON-state."""
@@ -171,6 +196,19 @@ def expand_entity_ids(hass: HomeAssistant, entity_ids: Iterable[Any]) -> list[st
 
     Async friendly.
     """
+    return _expand_entity_ids(hass, entity_ids, None)
+
+
+def _expand_entity_ids(
+    hass: HomeAssistant,
+    entity_ids: Iterable[Any],
+    groups_members: dict[str, Any] | None,
+) -> list[str]:
+    """Return entity_ids with group entity ids replaced by their members.
+
+    The entity_id attribute of each expanded group is added to
+    groups_members if it is not None.
+    """
     found_ids: list[str] = []
     for entity_id in entity_ids:
         if not isinstance(entity_id, str) or entity_id in (
@@ -186,13 +224,9 @@ def expand_entity_ids(hass: HomeAssistant, entity_ids: Iterable[Any]) -> list[st
             domain, _ = ha.split_entity_id(entity_id)
 
             if domain == DOMAIN:
-                child_entities = get_entity_ids(hass, entity_id)
-                if entity_id in child_entities:
-                    child_entities = list(child_entities)
-                    child_entities.remove(entity_id)
                 found_ids.extend(
                     ent_id
-                    for ent_id in expand_entity_ids(hass, child_entities)
+                    for ent_id in _expand_group(hass, entity_id, groups_members)
                     if ent_id not in found_ids
                 )
 
@@ -207,6 +241,46 @@ def expand_entity_ids(hass: HomeAssistant, entity_ids: Iterable[Any]) -> list[st
     return found_ids
 
 
+def _expand_group(
+    hass: HomeAssistant, entity_id: str, groups_members: dict[str, Any] | None
+) -> list[str]:
+    """Return the members of a group with nested groups replaced by their members.
+
+    The returned list must not be modified since it is cached.
+    """
+    cache: GroupExpansionCache | None = hass.data.get(EXPAND_CACHE_KEY)
+    if cache is None:
+        cache = hass.data.setdefault(EXPAND_CACHE_KEY, GroupExpansionCache())
+
+    if (cached := cache.expanded.get(entity_id)) is not None:
+        members, cached_groups_members = cached
+        for group_id, cached_members in cached_groups_members.items():
+            current_members = _group_members_attribute(hass, group_id)
+            # The attribute is the same object unless the members changed
+            if current_members is not cached_members and (
+                current_members != cached_members
+            ):
+                break
+        else:
+            cache.hits += 1
+            if groups_members is not None:
+                groups_members.update(cached_groups_members)
+            return members
+
+    cache.misses += 1
+    group_members = _group_members_attribute(hass, entity_id)
+    nested_groups_members: dict[str, Any] = {entity_id: group_members}
+    child_entities: Iterable[Any] = group_members or ()
+    if entity_id in child_entities:
+        child_entities = list(child_entities)
+        child_entities.remove(entity_id)
+    members = _expand_entity_ids(hass, child_entities, nested_groups_members)
+    cache.expanded[entity_id] = (members, nested_groups_members)
+    if groups_members is not None:
+        groups_members.update(nested_groups_members)
+    return members
+
+
 @bind_hass
 def get_entity_ids(
     hass: HomeAssistant, entity_id: str, domain_filter: str | None = None
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable, MutableMapping
+from collections.abc import Callable, Iterable, Mapping, MutableMapping
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
@@ -41,6 +41,8 @@ from .helpers import entities_may_have_state_changes_after
 
 _LOGGER = logging.getLogger(__name__)
 
+_HistoryStates = Mapping[str, list[dict[str, Any]] | history.ColumnarStates]
+
 
 @dataclass(slots=True)
 class HistoryLiveStream:
@@ -70,27 +72,67 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    columnar: bool,
 ) -> str:
     """Fetch history significant_states and convert them to json in the executor."""
     return JSON_DUMP(
         messages.result_message(
             msg_id,
-            history.get_significant_states(
+            _get_significant_states(
                 hass,
                 start_time,
                 end_time,
                 entity_ids,
-                None,
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
-                True,
+                columnar,
             ),
         )
     )
 
 
+def _get_significant_states(
+    hass: HomeAssistant,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    columnar: bool,
+) -> _HistoryStates:
+    """Fetch history significant_states as compressed states or columns."""
+    if columnar:
+        return history.get_significant_states_columnar(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+    return cast(
+        _HistoryStates,
+        history.get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ),
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -101,6 +143,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("columnar", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -164,12 +207,13 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg["columnar"],
         )
     )
 
 
 def _generate_stream_message(
-    states: MutableMapping[str, list[dict[str, Any]]],
+    states: _HistoryStates,
     start_day: dt,
     end_day: dt,
 ) -> dict[str, Any]:
@@ -197,7 +241,7 @@ def _generate_websocket_response(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    states: MutableMapping[str, list[dict[str, Any]]],
+    states: _HistoryStates,
 ) -> str:
     """Generate a websocket response."""
     return JSON_DUMP(
@@ -217,32 +261,31 @@ def _generate_historical_response(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    columnar: bool,
     send_empty: bool,
 ) -> tuple[float, dt | None, str | None]:
     """Generate a historical response."""
-    states = cast(
-        MutableMapping[str, list[dict[str, Any]]],
-        history.get_significant_states(
-            hass,
-            start_time,
-            end_time,
-            entity_ids,
-            None,
-            include_start_time_state,
-            significant_changes_only,
-            minimal_response,
-            no_attributes,
-            True,
-        ),
+    states = _get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        columnar,
     )
     last_time_ts = 0.0
     for state_list in states.values():
-        if (
-            state_list
-            and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
-            > last_time_ts
-        ):
-            last_time_ts = cast(float, state_last_time)
+        if not state_list:
+            continue
+        if isinstance(state_list, history.ColumnarStates):
+            state_last_time = state_list.last_updated[-1]
+        else:
+            state_last_time = state_list[-1][COMPRESSED_STATE_LAST_UPDATED]
+        if state_last_time > last_time_ts:
+            last_time_ts = state_last_time
 
     if last_time_ts == 0:
         # If we did not send any states ever, we need to send an empty response
@@ -272,6 +315,7 @@ async def _async_send_historical_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    columnar: bool,
     send_empty: bool,
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
@@ -287,6 +331,7 @@ async def _async_send_historical_states(
         significant_changes_only,
         minimal_response,
         no_attributes,
+        columnar,
         send_empty,
     )
     if payload:
@@ -323,12 +368,45 @@ def _events_to_compressed_states(
     return states_by_entity_ids
 
 
+def _events_to_columnar_states(
+    events: Iterable[Event], no_attributes: bool
+) -> dict[str, history.ColumnarStates]:
+    """Convert events to columnar states."""
+    states_by_entity_ids: dict[str, history.ColumnarStates] = {}
+    for event in events:
+        state: State = event.data["new_state"]
+        include_attributes = (
+            not no_attributes or state.domain in history.NEED_ATTRIBUTE_DOMAINS
+        )
+        if (columns := states_by_entity_ids.get(state.entity_id)) is None:
+            columns = states_by_entity_ids[state.entity_id] = history.ColumnarStates(
+                True, include_attributes
+            )
+        attributes_index = 0
+        if include_attributes:
+            # The events keep the attributes alive while converting
+            attributes_key = id(state.attributes)
+            if (index := columns.get_attributes_index(attributes_key)) is None:
+                index = columns.add_attributes(attributes_key, state.attributes)
+            attributes_index = index
+        columns.append(
+            state.state,
+            dt_util.utc_to_timestamp(state.last_updated),
+            dt_util.utc_to_timestamp(state.last_changed),
+            attributes_index,
+        )
+    for columns in states_by_entity_ids.values():
+        columns.compact()
+    return states_by_entity_ids
+
+
 async def _async_events_consumer(
     subscriptions_setup_complete_time: dt,
     connection: ActiveConnection,
     msg_id: int,
     stream_queue: asyncio.Queue[Event],
     no_attributes: bool,
+    columnar: bool,
 ) -> None:
     """Stream events from the queue."""
     while True:
@@ -345,7 +423,12 @@ async def _async_events_consumer(
         while not stream_queue.empty():
             events.append(stream_queue.get_nowait())
 
-        if history_states := _events_to_compressed_states(events, no_attributes):
+        history_states: _HistoryStates
+        if columnar:
+            history_states = _events_to_columnar_states(events, no_attributes)
+        else:
+            history_states = _events_to_compressed_states(events, no_attributes)
+        if history_states:
             connection.send_message(
                 JSON_DUMP(
                     messages.event_message(
@@ -404,6 +487,7 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("columnar", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -443,6 +527,7 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    columnar = msg["columnar"]
 
     if end_time and end_time <= utc_now:
         if (
@@ -468,6 +553,7 @@ async def ws_stream(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            columnar,
             True,
         )
         return
@@ -532,6 +618,7 @@ async def ws_stream(
         significant_changes_only,
         minimal_response,
         no_attributes,
+        columnar,
         True,
     )
 
@@ -546,6 +633,7 @@ async def ws_stream(
             msg_id,
             stream_queue,
             no_attributes,
+            columnar,
         )
     )
 
@@ -573,5 +661,6 @@ async def ws_stream(
         significant_changes_only,
         minimal_response,
         no_attributes,
+        columnar,
         send_empty=not last_event_time,
     )
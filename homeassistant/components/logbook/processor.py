@@ -5,11 +5,14 @@ from collections.abc import Callable, Generator, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime as dt
+from itertools import islice
 import logging
 from typing import Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -67,6 +70,12 @@ from .queries.common import PSEUDO_EVENT_STATE_CHANGED
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of events humanified at a time when streaming events
+STREAM_CHUNK_SIZE = 1000
+# Number of contexts remembered when streaming events, the least recently
+# used contexts are forgotten first
+STREAM_MAX_CONTEXTS = 20000
+
 
 @dataclass(slots=True)
 class LogbookRun:
@@ -135,6 +144,32 @@ class EventProcessor:
         self.logbook_run.context_lookup.clear()
         self.logbook_run.memoize_new_contexts = False
 
+    def _statement_for_request(
+        self, session: Session, start_day: dt, end_day: dt
+    ) -> StatementLambdaElement:
+        """Return the statement to select the events for a period of time."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
+            )
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
+            )
+        )
+        return statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+        )
+
     def get_events(
         self,
         start_day: dt,
@@ -142,33 +177,43 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
-                )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
-                )
-            )
-            stmt = statement_for_request(
-                start_day,
-                end_day,
-                event_type_ids,
-                self.entity_ids,
-                metadata_ids,
-                self.device_ids,
-                self.filters,
-                self.context_id,
-            )
+            stmt = self._statement_for_request(session, start_day, end_day)
             return self.humanify(
                 execute_stmt_lambda_element(session, stmt, orm_rows=False)
             )
 
+    def stream_events(
+        self,
+        start_day: dt,
+        end_day: dt,
+    ) -> Generator[list[dict[str, Any]], None, None]:
+        """Get events for a period of time in chunks.
+
+        Rows are fetched with yield_per for time windows longer than a day
+        and humanified STREAM_CHUNK_SIZE events at a time. The event cache is
+        cleared and the least recently used contexts are forgotten after each
+        chunk so memory stays bounded regardless of the time window. Events
+        caused by a forgotten context are returned without the context fields.
+
+        The generator must be consumed in the thread that started it.
+        """
+        logbook_run = self.logbook_run
+        with session_scope(hass=self.hass, read_only=True) as session:
+            stmt = self._statement_for_request(session, start_day, end_day)
+            rows = execute_stmt_lambda_element(
+                session, stmt, start_day, end_day, orm_rows=False
+            )
+            events = _humanify(
+                _touch_contexts(rows, logbook_run.context_lookup),
+                self.ent_reg,
+                logbook_run,
+                self.context_augmenter,
+            )
+            while chunk := list(islice(events, STREAM_CHUNK_SIZE)):
+                yield chunk
+                logbook_run.event_cache.clear()
+                _forget_oldest_contexts(logbook_run.context_lookup, STREAM_MAX_CONTEXTS)
+
     def humanify(
         self, rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result
     ) -> list[dict[str, str]]:
@@ -184,7 +229,7 @@ class EventProcessor:
 
 
 def _humanify(
-    rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result,
+    rows: Generator[EventAsRow | Row, None, None] | Sequence[Row] | Result,
     ent_reg: er.EntityRegistry,
     logbook_run: LogbookRun,
     context_augmenter: ContextAugmenter,
@@ -370,6 +415,36 @@ class ContextAugmenter:
             data[CONTEXT_ENTITY_ID_NAME] = self.entity_name_cache.get(attr_entity_id)
 
 
+def _touch_contexts(
+    rows: Sequence[Row] | Result,
+    context_lookup: dict[bytes | None, Row | EventAsRow | None],
+) -> Generator[Row, None, None]:
+    """Move the contexts used by the rows to the end of the context lookup.
+
+    This keeps the context lookup in least recently used order, so
+    _forget_oldest_contexts does not forget contexts which are still used.
+    """
+    for row in rows:
+        for context_id_bin in (row.context_id_bin, row.context_parent_id_bin):
+            if context_id_bin is not None and context_id_bin in context_lookup:
+                context_lookup[context_id_bin] = context_lookup.pop(context_id_bin)
+        yield row
+
+
+def _forget_oldest_contexts(
+    context_lookup: dict[bytes | None, Row | EventAsRow | None], max_contexts: int
+) -> None:
+    """Forget the least recently used contexts above max_contexts."""
+    if (excess := len(context_lookup) - max_contexts) <= 0:
+        return
+    for context_id_bin in [
+        context_id_bin
+        for context_id_bin in islice(context_lookup, excess + 1)
+        if context_id_bin is not None
+    ][:excess]:
+        del context_lookup[context_id_bin]
+
+
 def _rows_match(row: Row | EventAsRow, other_row: Row | EventAsRow) -> bool:
     """Check of rows match by using the same method as Events __hash__."""
     return bool(
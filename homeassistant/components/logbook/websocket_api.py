@@ -83,6 +83,7 @@ async def _async_send_historical_events(
     event_processor: EventProcessor,
     partial: bool,
     force_send: bool = False,
+    chunked: bool = False,
 ) -> dt | None:
     """Select historical data from the database and deliver it to the websocket.
 
@@ -92,6 +93,11 @@ async def _async_send_historical_events(
     they are not stuck at a loading screen and can start looking at
     the data right away.
 
+    If chunked is set the events are streamed from the database and
+    sent as partial messages as they are ready. Only the
+    STREAM_MAX_CONTEXTS most recently used contexts are remembered,
+    events caused by another context are sent without the context_ fields.
+
     This function returns the time of the most recent event we sent to the
     websocket.
     """
@@ -104,12 +110,14 @@ async def _async_send_historical_events(
     if not is_big_query:
         message, last_event_time = await _async_get_ws_stream_events(
             hass,
+            connection,
             msg_id,
             start_time,
             end_time,
             formatter,
             event_processor,
             partial,
+            chunked,
         )
         # If there is no last_event_time, there are no historical
         # results, but we still send an empty message
@@ -126,24 +134,28 @@ async def _async_send_historical_events(
     recent_query_start = end_time - timedelta(hours=BIG_QUERY_RECENT_HOURS)
     recent_message, recent_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         recent_query_start,
         end_time,
         formatter,
         event_processor,
         partial=True,
+        chunked=chunked,
     )
     if recent_query_last_event_time:
         connection.send_message(recent_message)
 
     older_message, older_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         start_time,
         recent_query_start,
         formatter,
         event_processor,
         partial,
+        chunked,
     )
     # If there is no last_event_time, there are no historical
     # results, but we still send an empty message
@@ -159,22 +171,40 @@ async def _async_send_historical_events(
 
 async def _async_get_ws_stream_events(
     hass: HomeAssistant,
+    connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
     formatter: Callable[[int, Any], dict[str, Any]],
     event_processor: EventProcessor,
     partial: bool,
+    chunked: bool = False,
 ) -> tuple[str, dt | None]:
-    """Async wrapper around _ws_formatted_get_events."""
+    """Async wrapper around _ws_stream_get_events."""
+    if not chunked:
+        return await get_instance(hass).async_add_executor_job(
+            _ws_stream_get_events,
+            msg_id,
+            start_time,
+            end_time,
+            formatter,
+            event_processor,
+            partial,
+        )
+
+    def _send_partial_message(message: str) -> None:
+        """Send a partial message from the executor."""
+        hass.loop.call_soon_threadsafe(connection.send_message, message)
+
     return await get_instance(hass).async_add_executor_job(
-        _ws_stream_get_events,
+        _ws_stream_get_events_chunked,
         msg_id,
         start_time,
         end_time,
         formatter,
         event_processor,
         partial,
+        _send_partial_message,
     )
 
 
@@ -212,6 +242,37 @@ def _ws_stream_get_events(
     return JSON_DUMP(formatter(msg_id, message)), last_time
 
 
+def _ws_stream_get_events_chunked(
+    msg_id: int,
+    start_day: dt,
+    end_day: dt,
+    formatter: Callable[[int, Any], dict[str, Any]],
+    event_processor: EventProcessor,
+    partial: bool,
+    send_partial_message: Callable[[str], None],
+) -> tuple[str, dt | None]:
+    """Stream events and send them as partial messages in the executor.
+
+    Every chunk but the last is sent as soon as it is ready, the last
+    chunk is returned so it can be sent like the result of
+    _ws_stream_get_events.
+    """
+    events: list[dict[str, Any]] = []
+    for chunk in event_processor.stream_events(start_day, end_day):
+        if events:
+            message = _generate_stream_message(events, start_day, end_day)
+            message["partial"] = True
+            send_partial_message(JSON_DUMP(formatter(msg_id, message)))
+        events = chunk
+    last_time = None
+    if events:
+        last_time = dt_util.utc_from_timestamp(events[-1]["when"])
+    message = _generate_stream_message(events, start_day, end_day)
+    if partial:
+        message["partial"] = True
+    return JSON_DUMP(formatter(msg_id, message)), last_time
+
+
 async def _async_events_consumer(
     subscriptions_setup_complete_time: dt,
     connection: ActiveConnection,
@@ -254,6 +315,10 @@ async def _async_events_consumer(
         vol.Optional("end_time"): str,
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
+        # Stream the history in partial messages, events caused by a context
+        # which is not one of the STREAM_MAX_CONTEXTS most recently used are
+        # sent without the context_ fields
+        vol.Optional("chunked", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -263,6 +328,7 @@ async def ws_event_stream(
     """Handle logbook stream events websocket command."""
     start_time_str = msg["start_time"]
     msg_id: int = msg["id"]
+    chunked: bool = msg["chunked"]
     utc_now = dt_util.utcnow()
 
     if start_time := dt_util.parse_datetime(start_time_str):
@@ -316,6 +382,7 @@ async def ws_event_stream(
             messages.event_message,
             event_processor,
             partial=False,
+            chunked=chunked,
         )
         return
 
@@ -388,6 +455,7 @@ async def ws_event_stream(
         # we want to make sure the client is not still spinning
         # because it is waiting for the first message
         force_send=True,
+        chunked=chunked,
     )
 
     if msg_id not in connection.subscriptions:
@@ -0,0 +1,119 @@
+"""Prefix tree to match MQTT topics against subscribed topic filters."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+MULTI_LEVEL_WILDCARD = "#"
+SINGLE_LEVEL_WILDCARD = "+"
+
+
+class _TopicTrieNode(Generic[_T]):
+    """Node of a TopicTrie, holds the values of the filter ending at the node."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode[_T]] = {}
+        self.values: list[_T] = []
+
+
+class TopicTrie(Generic[_T]):
+    """Prefix tree of MQTT topic filters with support for + and # wildcards.
+
+    Each topic filter is split into its levels and every level is a node in
+    the tree. Matching a topic walks the tree once, following the literal
+    level, the single level wildcard and collecting multi level wildcards
+    on the way. The memory used only depends on the subscribed topic
+    filters and not on the topics that are matched.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicTrieNode[_T] = _TopicTrieNode()
+        self._len = 0
+
+    def __len__(self) -> int:
+        """Return the number of values in the trie."""
+        return self._len
+
+    def __iter__(self) -> Iterator[_T]:
+        """Iterate over all values in the trie."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.values
+            nodes.extend(node.children.values())
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.values.append(value)
+        self._len += 1
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value for a topic filter.
+
+        Raises KeyError if the topic filter is unknown and ValueError if the
+        value is not stored for the topic filter.
+        """
+        path: list[tuple[_TopicTrieNode[_T], str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.values.remove(value)
+        self._len -= 1
+        # Prune the nodes which are no longer in use
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.values or child.children:
+                break
+            del parent.children[level]
+
+    def has_filter(self, topic_filter: str) -> bool:
+        """Return True if there are values stored for the exact topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of all topic filters matching a topic."""
+        levels = topic.split("/")
+        matches: list[_T] = []
+        # Topics starting with $ are not matched by wildcards on the first level
+        match_wildcards = not topic.startswith("$")
+        nodes = [self._root]
+        for level in levels:
+            next_nodes: list[_TopicTrieNode[_T]] = []
+            for node in nodes:
+                children = node.children
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+                if not match_wildcards:
+                    continue
+                if (child := children.get(SINGLE_LEVEL_WILDCARD)) is not None:
+                    next_nodes.append(child)
+                if (child := children.get(MULTI_LEVEL_WILDCARD)) is not None:
+                    matches.extend(child.values)
+            if not next_nodes:
+                return matches
+            nodes = next_nodes
+            match_wildcards = True
+
+        for node in nodes:
+            matches.extend(node.values)
+            # The multi level wildcard also matches the parent level
+            if (child := node.children.get(MULTI_LEVEL_WILDCARD)) is not None:
+                matches.extend(child.values)
+        return matches
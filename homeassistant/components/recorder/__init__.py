@@ -22,16 +22,19 @@ from homeassistant.loader import bind_hass
 
 from . import entity_registry, websocket_api
 from .const import (  # noqa: F401
+    CONF_AUTO_PURGE_MODE,
     CONF_DB_INTEGRITY_CHECK,
     DATA_INSTANCE,
     DOMAIN,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     EXCLUDE_ATTRIBUTES,
+    INTEGRATION_PLATFORM_ASYNC_SETUP,
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_EXCLUDE_ATTRIBUTES,
     INTEGRATION_PLATFORMS_LOAD_IN_RECORDER_THREAD,
     SQLITE_URL_PREFIX,
+    AutoPurgeMode,
     SupportedDialect,
 )
 from .core import Recorder
@@ -93,6 +96,9 @@ CONFIG_SCHEMA = vol.Schema(
                 {
                     vol.Optional(CONF_AUTO_PURGE, default=True): cv.boolean,
                     vol.Optional(CONF_AUTO_REPACK, default=True): cv.boolean,
+                    vol.Optional(
+                        CONF_AUTO_PURGE_MODE, default=AutoPurgeMode.NIGHTLY
+                    ): vol.Coerce(AutoPurgeMode),
                     vol.Optional(CONF_PURGE_KEEP_DAYS, default=10): vol.All(
                         vol.Coerce(int), vol.Range(min=1)
                     ),
@@ -138,6 +144,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     entity_filter = convert_include_exclude_filter(conf).get_filter()
     auto_purge = conf[CONF_AUTO_PURGE]
     auto_repack = conf[CONF_AUTO_REPACK]
+    auto_purge_mode = conf[CONF_AUTO_PURGE_MODE]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
@@ -154,6 +161,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         hass=hass,
         auto_purge=auto_purge,
         auto_repack=auto_repack,
+        auto_purge_mode=auto_purge_mode,
         keep_days=keep_days,
         commit_interval=commit_interval,
         uri=db_url,
@@ -197,6 +205,11 @@ async def _async_setup_integration_platform(
         ):
             exclude_attributes_by_domain[domain] = exclude_attributes(hass)
 
+        # The listeners the platform sets up in the event loop are
+        # cancelled when the recorder shuts down.
+        if async_setup := getattr(platform, INTEGRATION_PLATFORM_ASYNC_SETUP, None):
+            instance.async_add_platform_listener(async_setup(hass))
+
         # If the platform has a compile_statistics method, we need to
         # add it to the recorder queue to be processed.
         if any(
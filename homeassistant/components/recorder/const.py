@@ -18,6 +18,7 @@ EVENT_RECORDER_5MIN_STATISTICS_GENERATED = "recorder_5min_statistics_generated"
 EVENT_RECORDER_HOURLY_STATISTICS_GENERATED = "recorder_hourly_statistics_generated"
 
 CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
+CONF_AUTO_PURGE_MODE = "auto_purge_mode"
 
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 ESTIMATED_QUEUE_ITEM_SIZE = 10240
@@ -54,6 +55,7 @@ LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 
 
 INTEGRATION_PLATFORM_EXCLUDE_ATTRIBUTES = "exclude_attributes"
+INTEGRATION_PLATFORM_ASYNC_SETUP = "async_setup_recorder_platform"
 
 INTEGRATION_PLATFORM_COMPILE_STATISTICS = "compile_statistics"
 INTEGRATION_PLATFORM_VALIDATE_STATISTICS = "validate_statistics"
@@ -66,6 +68,13 @@ INTEGRATION_PLATFORMS_LOAD_IN_RECORDER_THREAD = {
 }
 
 
+class AutoPurgeMode(StrEnum):
+    """How the automatic purge runs."""
+
+    NIGHTLY = "nightly"
+    ADAPTIVE = "adaptive"
+
+
 class SupportedDialect(StrEnum):
     """Supported dialects."""
 
@@ -15,7 +15,7 @@ from typing import Any, TypeVar, cast
 
 import async_timeout
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select
+from sqlalchemy import Table, create_engine, event as sqlalchemy_event, exc, select
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
@@ -32,6 +32,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_time_change,
     async_track_time_interval,
     async_track_utc_time_change,
@@ -59,6 +60,7 @@ from .const import (
     SQLITE_URL_PREFIX,
     STATES_META_SCHEMA_VERSION,
     STATISTICS_ROWS_SCHEMA_VERSION,
+    AutoPurgeMode,
     SupportedDialect,
 )
 from .db_schema import (
@@ -78,7 +80,9 @@ from .db_schema import (
 )
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
+from .pending_rows import PendingEvent, PendingRows, PendingState
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge_scheduler import ADAPTIVE_PURGE_DEFER_TIME, AdaptivePurgeScheduler
 from .queries import (
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
@@ -92,7 +96,10 @@ from .table_managers.state_attributes import StateAttributesManager
 from .table_managers.states import StatesManager
 from .table_managers.states_meta import StatesMetaManager
 from .table_managers.statistics_meta import StatisticsMetaManager
+from .task_metrics import RecorderTaskMetrics
 from .tasks import (
+    AdaptivePurgeSliceTask,
+    AdaptivePurgeTask,
     AdjustLRUSizeTask,
     AdjustStatisticsTask,
     ChangeStatisticsUnitTask,
@@ -171,6 +178,7 @@ class Recorder(threading.Thread):
         hass: HomeAssistant,
         auto_purge: bool,
         auto_repack: bool,
+        auto_purge_mode: AutoPurgeMode,
         keep_days: int,
         commit_interval: int,
         uri: str,
@@ -187,6 +195,8 @@ class Recorder(threading.Thread):
         self.thread_id: int | None = None
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
+        self.auto_purge_mode = auto_purge_mode
+        self.purge_scheduler = AdaptivePurgeScheduler()
         self.keep_days = keep_days
         self._hass_started: asyncio.Future[object] = asyncio.Future()
         self.commit_interval = commit_interval
@@ -216,6 +226,8 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        self._pending_rows = PendingRows()
+        self.task_metrics = RecorderTaskMetrics()
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -243,6 +255,8 @@ class Recorder(threading.Thread):
         self._commit_listener: CALLBACK_TYPE | None = None
         self._periodic_listener: CALLBACK_TYPE | None = None
         self._nightly_listener: CALLBACK_TYPE | None = None
+        self._purge_slice_listener: CALLBACK_TYPE | None = None
+        self._platform_listeners: list[CALLBACK_TYPE] = []
         self._dialect_name: SupportedDialect | None = None
         self.enabled = True
 
@@ -441,6 +455,17 @@ class Recorder(threading.Thread):
         if self._periodic_listener:
             self._periodic_listener()
             self._periodic_listener = None
+        if self._purge_slice_listener:
+            self._purge_slice_listener()
+            self._purge_slice_listener = None
+        for platform_listener in self._platform_listeners:
+            platform_listener()
+        self._platform_listeners.clear()
+
+    @callback
+    def async_add_platform_listener(self, cancel: CALLBACK_TYPE) -> None:
+        """Add a listener of a recorder platform to cancel at shutdown."""
+        self._platform_listeners.append(cancel)
 
     async def _async_close(self, event: Event) -> None:
         """Empty the queue if its still present at close."""
@@ -537,10 +562,30 @@ class Recorder(threading.Thread):
             # until after the database is vacuumed
             repack = self.auto_repack and is_second_sunday(now)
             purge_before = dt_util.utcnow() - timedelta(days=self.keep_days)
-            self.queue_task(PurgeTask(purge_before, repack=repack, apply_filter=False))
+            if self.auto_purge_mode is AutoPurgeMode.ADAPTIVE:
+                self.queue_task(AdaptivePurgeTask(purge_before, repack=repack))
+            else:
+                self.queue_task(
+                    PurgeTask(purge_before, repack=repack, apply_filter=False)
+                )
         else:
             self.queue_task(PerodicCleanupTask())
 
+    @callback
+    def async_defer_purge_slice(self) -> None:
+        """Queue the next slice of the adaptive purge after a delay."""
+        if self._purge_slice_listener:
+            return
+        self._purge_slice_listener = async_call_later(
+            self.hass, ADAPTIVE_PURGE_DEFER_TIME, self._async_queue_purge_slice
+        )
+
+    @callback
+    def _async_queue_purge_slice(self, now: datetime) -> None:
+        """Queue the next slice of the adaptive purge."""
+        self._purge_slice_listener = None
+        self.queue_task(AdaptivePurgeSliceTask())
+
     @callback
     def _async_five_minute_tasks(self, now: datetime) -> None:
         """Run tasks every five minutes."""
@@ -703,6 +748,16 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_pending_event(self, pending_event: PendingEvent) -> None:
+        """Add an events row to insert at the next commit."""
+        self._event_session_has_pending_writes = True
+        self._pending_rows.add_event(pending_event)
+
+    def _add_pending_state(self, pending_state: PendingState) -> None:
+        """Add a states row to insert at the next commit."""
+        self._event_session_has_pending_writes = True
+        self._pending_rows.add_state(pending_state)
+
     def _run(self) -> None:
         """Start processing events to save."""
         self.thread_id = threading.get_ident()
@@ -889,10 +944,14 @@ class Recorder(threading.Thread):
     def _guarded_process_one_task_or_recover(self, task: RecorderTask) -> None:
         """Process a task, guarding against exceptions to ensure the loop does not collapse."""
         _LOGGER.debug("Processing task: %s", task)
+        start = time.monotonic()
         try:
             self._process_one_task_or_recover(task)
         except Exception as err:  # pylint: disable=broad-except
             _LOGGER.exception("Error while processing event %s: %s", task, err)
+        self.task_metrics.record_task(
+            type(task), start - task.queued_at, time.monotonic() - start
+        )
 
     def _process_one_task_or_recover(self, task: RecorderTask) -> None:
         """Process an event, reconnect, or recover a malformed database."""
@@ -1020,22 +1079,23 @@ class Recorder(threading.Thread):
         """Process any event into the session except state changed."""
         session = self.event_session
         assert session is not None
-        dbevent = Events.from_event(event)
+        dbevent = PendingEvent(Events.row_from_event(event))
+        row = dbevent.row
 
         # Map the event_type to the EventTypes table
         event_type_manager = self.event_type_manager
         if pending_event_types := event_type_manager.get_pending(event.event_type):
-            dbevent.event_type_rel = pending_event_types
+            dbevent.event_type = pending_event_types
         elif event_type_id := event_type_manager.get(event.event_type, session, True):
-            dbevent.event_type_id = event_type_id
+            row["event_type_id"] = event_type_id
         else:
             event_types = EventTypes(event_type=event.event_type)
             event_type_manager.add_pending(event_types)
             self._add_to_session(session, event_types)
-            dbevent.event_type_rel = event_types
+            dbevent.event_type = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_pending_event(dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1046,21 +1106,21 @@ class Recorder(threading.Thread):
         shared_data = shared_data_bytes.decode("utf-8")
         # Matching attributes found in the pending commit
         if pending_event_data := event_data_manager.get_pending(shared_data):
-            dbevent.event_data_rel = pending_event_data
+            dbevent.event_data = pending_event_data
         # Matching attributes id found in the cache
         elif (data_id := event_data_manager.get_from_cache(shared_data)) or (
             (hash_ := EventData.hash_shared_data_bytes(shared_data_bytes))
             and (data_id := event_data_manager.get(shared_data, hash_, session))
         ):
-            dbevent.data_id = data_id
+            row["data_id"] = data_id
         else:
             # No matching attributes found, save them in the DB
             dbevent_data = EventData(shared_data=shared_data, hash=hash_)
             event_data_manager.add_pending(dbevent_data)
             self._add_to_session(session, dbevent_data)
-            dbevent.event_data_rel = dbevent_data
+            dbevent.event_data = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_pending_event(dbevent)
 
     def _process_state_changed_event_into_session(self, event: Event) -> None:
         """Process a state_changed event into the session."""
@@ -1069,20 +1129,20 @@ class Recorder(threading.Thread):
         entity_removed = not event.data.get("new_state")
         entity_id = event.data["entity_id"]
 
-        dbstate = States.from_event(event)
+        row = States.row_from_event(event)
 
         states_manager = self.states_manager
-        if old_state := states_manager.pop_pending(entity_id):
-            dbstate.old_state = old_state
-        elif old_state_id := states_manager.pop_committed(entity_id):
-            dbstate.old_state_id = old_state_id
+        old_state = states_manager.pop_pending(entity_id)
+        dbstate = PendingState(row, old_state)
+        if not old_state and (old_state_id := states_manager.pop_committed(entity_id)):
+            row["old_state_id"] = old_state_id
         if entity_removed:
-            dbstate.state = None
+            row["state"] = None
         else:
             states_manager.add_pending(entity_id, dbstate)
 
         if states_meta_manager.active:
-            dbstate.entity_id = None
+            row["entity_id"] = None
 
         if entity_id is None or not (
             shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
@@ -1093,9 +1153,9 @@ class Recorder(threading.Thread):
         session = self.event_session
         # Map the entity_id to the StatesMeta table
         if pending_states_meta := states_meta_manager.get_pending(entity_id):
-            dbstate.states_meta_rel = pending_states_meta
+            dbstate.states_meta = pending_states_meta
         elif metadata_id := states_meta_manager.get(entity_id, session, True):
-            dbstate.metadata_id = metadata_id
+            row["metadata_id"] = metadata_id
         elif states_meta_manager.active and entity_removed:
             # If the entity was removed, we don't need to add it to the
             # StatesMeta table or record it in the pending commit
@@ -1106,11 +1166,10 @@ class Recorder(threading.Thread):
             states_meta = StatesMeta(entity_id=entity_id)
             states_meta_manager.add_pending(states_meta)
             self._add_to_session(session, states_meta)
-            dbstate.states_meta_rel = states_meta
+            dbstate.states_meta = states_meta
 
         # Map the event data to the StateAttributes table
         shared_attrs = shared_attrs_bytes.decode("utf-8")
-        dbstate.attributes = None
         # Matching attributes found in the pending commit
         if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
             dbstate.state_attributes = pending_event_data
@@ -1125,7 +1184,7 @@ class Recorder(threading.Thread):
                 )
             )
         ):
-            dbstate.attributes_id = attributes_id
+            row["attributes_id"] = attributes_id
         else:
             # No matching attributes found, save them in the DB
             dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
@@ -1133,7 +1192,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        self._add_pending_state(dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1171,9 +1230,29 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
-
+        start = time.monotonic()
+        pending_rows = self._pending_rows
+        rows = len(pending_rows) + len(session.new)
+
+        if pending_rows:
+            # Flush first so the rows can be linked to the ids of the
+            # new event types, event data, states meta and attributes
+            session.flush()
+            dialect = session.get_bind().dialect
+            # The rows are inserted in a savepoint so a failed attempt is
+            # rolled back before _commit_event_session_or_retry retries it,
+            # otherwise the rows inserted before the failure are duplicated
+            with session.begin_nested():
+                pending_rows.insert(
+                    session,
+                    cast(Table, Events.__table__),
+                    cast(Table, States.__table__),
+                    dialect.insert_executemany_returning_sort_by_parameter_order,
+                )
         session.commit()
+        pending_rows.clear()
         self._event_session_has_pending_writes = False
+        self.task_metrics.record_commit(time.monotonic() - start, rows)
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1204,6 +1283,7 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self._pending_rows.clear()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
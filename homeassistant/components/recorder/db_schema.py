@@ -288,19 +288,30 @@ class Events(Base):
     @staticmethod
     def from_event(event: Event) -> Events:
         """Create an event database object from a native event."""
-        return Events(
-            event_type=None,
-            event_data=None,
-            origin_idx=EVENT_ORIGIN_TO_IDX.get(event.origin),
-            time_fired=None,
-            time_fired_ts=dt_util.utc_to_timestamp(event.time_fired),
-            context_id=None,
-            context_id_bin=ulid_to_bytes_or_none(event.context.id),
-            context_user_id=None,
-            context_user_id_bin=uuid_hex_to_bytes_or_none(event.context.user_id),
-            context_parent_id=None,
-            context_parent_id_bin=ulid_to_bytes_or_none(event.context.parent_id),
-        )
+        return Events(**Events.row_from_event(event))
+
+    @staticmethod
+    def row_from_event(event: Event) -> dict[str, Any]:
+        """Create the column values of an events row from a native event.
+
+        Every row has the same keys so rows can be inserted in one
+        executemany batch.
+        """
+        return {
+            "event_type": None,
+            "event_data": None,
+            "origin_idx": EVENT_ORIGIN_TO_IDX.get(event.origin),
+            "time_fired": None,
+            "time_fired_ts": dt_util.utc_to_timestamp(event.time_fired),
+            "context_id": None,
+            "context_id_bin": ulid_to_bytes_or_none(event.context.id),
+            "context_user_id": None,
+            "context_user_id_bin": uuid_hex_to_bytes_or_none(event.context.user_id),
+            "context_parent_id": None,
+            "context_parent_id_bin": ulid_to_bytes_or_none(event.context.parent_id),
+            "event_type_id": None,
+            "data_id": None,
+        }
 
     def to_native(self, validate_entity_id: bool = True) -> Event | None:
         """Convert to a native HA Event."""
@@ -474,36 +485,47 @@ class States(Base):
     @staticmethod
     def from_event(event: Event) -> States:
         """Create object from a state_changed event."""
-        entity_id = event.data["entity_id"]
+        return States(**States.row_from_event(event))
+
+    @staticmethod
+    def row_from_event(event: Event) -> dict[str, Any]:
+        """Create the column values of a states row from a state_changed event.
+
+        Every row has the same keys so rows can be inserted in one
+        executemany batch.
+        """
         state: State | None = event.data.get("new_state")
-        dbstate = States(
-            entity_id=entity_id,
-            attributes=None,
-            context_id=None,
-            context_id_bin=ulid_to_bytes_or_none(event.context.id),
-            context_user_id=None,
-            context_user_id_bin=uuid_hex_to_bytes_or_none(event.context.user_id),
-            context_parent_id=None,
-            context_parent_id_bin=ulid_to_bytes_or_none(event.context.parent_id),
-            origin_idx=EVENT_ORIGIN_TO_IDX.get(event.origin),
-            last_updated=None,
-            last_changed=None,
-        )
+        row: dict[str, Any] = {
+            "entity_id": event.data["entity_id"],
+            "attributes": None,
+            "context_id": None,
+            "context_id_bin": ulid_to_bytes_or_none(event.context.id),
+            "context_user_id": None,
+            "context_user_id_bin": uuid_hex_to_bytes_or_none(event.context.user_id),
+            "context_parent_id": None,
+            "context_parent_id_bin": ulid_to_bytes_or_none(event.context.parent_id),
+            "origin_idx": EVENT_ORIGIN_TO_IDX.get(event.origin),
+            "last_updated": None,
+            "last_changed": None,
+            "old_state_id": None,
+            "attributes_id": None,
+            "metadata_id": None,
+        }
         # None state means the state was removed from the state machine
         if state is None:
-            dbstate.state = ""
-            dbstate.last_updated_ts = dt_util.utc_to_timestamp(event.time_fired)
-            dbstate.last_changed_ts = None
-            return dbstate
+            row["state"] = ""
+            row["last_updated_ts"] = dt_util.utc_to_timestamp(event.time_fired)
+            row["last_changed_ts"] = None
+            return row
 
-        dbstate.state = state.state
-        dbstate.last_updated_ts = dt_util.utc_to_timestamp(state.last_updated)
+        row["state"] = state.state
+        row["last_updated_ts"] = dt_util.utc_to_timestamp(state.last_updated)
         if state.last_updated == state.last_changed:
-            dbstate.last_changed_ts = None
+            row["last_changed_ts"] = None
         else:
-            dbstate.last_changed_ts = dt_util.utc_to_timestamp(state.last_changed)
+            row["last_changed_ts"] = dt_util.utc_to_timestamp(state.last_changed)
 
-        return dbstate
+        return row
 
     def to_native(self, validate_entity_id: bool = True) -> State | None:
         """Convert to an HA state object."""
@@ -3,30 +3,40 @@ from __future__ import annotations
 
 from collections.abc import MutableMapping
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant, State
 
 from ... import recorder
 from ..filters import Filters
+from .columnar import ColumnarStates
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_columnar as _modern_get_significant_states_columnar,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
 
 # These are the APIs of this package
 __all__ = [
+    "ColumnarStates",
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_columnar",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -115,6 +125,69 @@ def get_significant_states(
     )
 
 
+def get_significant_states_columnar(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> dict[str, ColumnarStates]:
+    """Return the significant states during a time period as columns."""
+    if recorder.get_instance(hass).states_meta_manager.active:
+        return _modern_get_significant_states_columnar(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states as _legacy_get_significant_states,
+    )
+
+    # The legacy schema is only used until the migration is done,
+    # convert the compressed states to columns
+    result: dict[str, ColumnarStates] = {}
+    for entity_id, states in _legacy_get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    ).items():
+        columns = result[entity_id] = ColumnarStates(
+            not significant_changes_only, not no_attributes
+        )
+        for state in cast(list[dict[str, Any]], states):
+            attributes_index = 0
+            if not no_attributes:
+                # With minimal_response only the first state has attributes
+                attributes = state.get(COMPRESSED_STATE_ATTRIBUTES)
+                attributes_key = None if attributes is None else id(attributes)
+                if (index := columns.get_attributes_index(attributes_key)) is None:
+                    index = columns.add_attributes(attributes_key, attributes or {})
+                attributes_index = index
+            columns.append(
+                state[COMPRESSED_STATE_STATE],
+                state[COMPRESSED_STATE_LAST_UPDATED],
+                state.get(COMPRESSED_STATE_LAST_CHANGED),
+                attributes_index,
+            )
+        columns.compact()
+    return result
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -0,0 +1,111 @@
+"""Columnar history of an entity."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Hashable
+import math
+from typing import Any
+
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
+
+COLUMNAR_STATE_ATTRIBUTES_INDEX = "ai"
+
+
+class ColumnarStates:
+    """The states of an entity stored as columns.
+
+    Instead of one State or dict per row the timestamps are kept in
+    arrays, the states are kept in an array when they are all numeric
+    and each distinct set of attributes is only stored once with
+    an index into them per row.
+    """
+
+    __slots__ = (
+        "states",
+        "last_updated",
+        "last_changed",
+        "attributes",
+        "attributes_index",
+        "_attributes_keys",
+    )
+
+    def __init__(self, include_last_changed: bool, include_attributes: bool) -> None:
+        """Initialize the columns."""
+        self.states: list[str] | array[float] = []
+        self.last_updated: array[float] = array("d")
+        self.last_changed: array[float] | None = (
+            array("d") if include_last_changed else None
+        )
+        self.attributes: list[dict[str, Any]] | None = (
+            [] if include_attributes else None
+        )
+        self.attributes_index: array[int] | None = (
+            array("I") if include_attributes else None
+        )
+        self._attributes_keys: dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of states."""
+        return len(self.last_updated)
+
+    def get_attributes_index(self, key: Hashable) -> int | None:
+        """Return the index of the attributes identified by key."""
+        return self._attributes_keys.get(key)
+
+    def add_attributes(self, key: Hashable, attributes: dict[str, Any]) -> int:
+        """Store attributes which are not yet stored and return their index."""
+        assert self.attributes is not None
+        index = self._attributes_keys[key] = len(self.attributes)
+        self.attributes.append(attributes)
+        return index
+
+    def append(
+        self,
+        state: str,
+        last_updated_ts: float,
+        last_changed_ts: float | None = None,
+        attributes_index: int = 0,
+    ) -> None:
+        """Append a state.
+
+        The state must be appended before compact is called.
+        """
+        assert isinstance(self.states, list)
+        self.states.append(state)
+        self.last_updated.append(last_updated_ts)
+        if self.last_changed is not None:
+            self.last_changed.append(last_changed_ts or last_updated_ts)
+        if self.attributes_index is not None:
+            self.attributes_index.append(attributes_index)
+
+    def compact(self) -> None:
+        """Store the states in an array if they are all numeric."""
+        if not isinstance(self.states, list):
+            return
+        try:
+            states = array("d", map(float, self.states))
+        except ValueError:
+            return
+        if all(map(math.isfinite, states)):
+            self.states = states
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the columns as a JSON serializable dict."""
+        states = self.states
+        columns: dict[str, Any] = {
+            COMPRESSED_STATE_STATE: states
+            if isinstance(states, list)
+            else states.tolist(),
+            COMPRESSED_STATE_LAST_UPDATED: self.last_updated.tolist(),
+        }
+        if self.last_changed is not None:
+            columns[COMPRESSED_STATE_LAST_CHANGED] = self.last_changed.tolist()
+        if self.attributes is not None and self.attributes_index is not None:
+            columns[COMPRESSED_STATE_ATTRIBUTES] = self.attributes
+            columns[COLUMNAR_STATE_ATTRIBUTES_INDEX] = self.attributes_index.tolist()
+        return columns
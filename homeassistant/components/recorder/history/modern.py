@@ -20,6 +20,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -35,7 +36,9 @@ from ..models import (
     process_timestamp,
     row_to_compressed_state,
 )
+from ..models.state_attributes import decode_attributes_from_source
 from ..util import execute_stmt_lambda_element, session_scope
+from .columnar import ColumnarStates
 from .const import (
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
@@ -50,45 +53,66 @@ _FIELD_MAP = {
 }
 
 
+def _selected_columns(
+    no_attributes: bool, include_last_changed: bool
+) -> tuple[str, ...]:
+    """Return the names of the columns the history statements select in order.
+
+    The first columns always match _FIELD_MAP.
+    """
+    columns: tuple[str, ...] = tuple(_FIELD_MAP)
+    if include_last_changed:
+        columns += ("last_changed_ts",)
+    if not no_attributes:
+        columns += ("attributes",)
+    return columns
+
+
+_STATES_COLUMNS: dict[str, Any] = {
+    "metadata_id": States.metadata_id,
+    "state": States.state,
+    "last_updated_ts": States.last_updated_ts,
+    "last_changed_ts": States.last_changed_ts,
+    "attributes": SHARED_ATTR_OR_LEGACY_ATTRIBUTES,
+}
+
+
 def _stmt_and_join_attributes(
     no_attributes: bool, include_last_changed: bool
 ) -> Select:
     """Return the statement and if StateAttributes should be joined."""
-    _select = select(States.metadata_id, States.state, States.last_updated_ts)
-    if include_last_changed:
-        _select = _select.add_columns(States.last_changed_ts)
-    if not no_attributes:
-        _select = _select.add_columns(SHARED_ATTR_OR_LEGACY_ATTRIBUTES)
-    return _select
+    return select(
+        *(
+            _STATES_COLUMNS[column]
+            for column in _selected_columns(no_attributes, include_last_changed)
+        )
+    )
 
 
 def _stmt_and_join_attributes_for_start_state(
     no_attributes: bool, include_last_changed: bool
 ) -> Select:
     """Return the statement and if StateAttributes should be joined."""
-    _select = select(States.metadata_id, States.state)
-    _select = _select.add_columns(literal(value=0).label("last_updated_ts"))
-    if include_last_changed:
-        _select = _select.add_columns(literal(value=0).label("last_changed_ts"))
-    if not no_attributes:
-        _select = _select.add_columns(SHARED_ATTR_OR_LEGACY_ATTRIBUTES)
-    return _select
+    return select(
+        *(
+            literal(value=0).label(column)
+            if column in ("last_updated_ts", "last_changed_ts")
+            else _STATES_COLUMNS[column]
+            for column in _selected_columns(no_attributes, include_last_changed)
+        )
+    )
 
 
 def _select_from_subquery(
     subquery: Subquery | CompoundSelect, no_attributes: bool, include_last_changed: bool
 ) -> Select:
     """Return the statement to select from the union."""
-    base_select = select(
-        subquery.c.metadata_id,
-        subquery.c.state,
-        subquery.c.last_updated_ts,
+    return select(
+        *(
+            subquery.c[column]
+            for column in _selected_columns(no_attributes, include_last_changed)
+        )
     )
-    if include_last_changed:
-        base_select = base_select.add_columns(subquery.c.last_changed_ts)
-    if no_attributes:
-        return base_select
-    return base_select.add_columns(subquery.c.attributes)
 
 
 def get_significant_states(
@@ -183,34 +207,24 @@ def _significant_states_stmt(
     ).order_by(unioned_subquery.c.metadata_id, unioned_subquery.c.last_updated_ts)
 
 
-def get_significant_states_with_session(
+def _significant_states_stmt_for_entities(
     hass: HomeAssistant,
     session: Session,
     start_time: datetime,
-    end_time: datetime | None = None,
-    entity_ids: list[str] | None = None,
-    filters: Filters | None = None,
-    include_start_time_state: bool = True,
-    significant_changes_only: bool = True,
-    minimal_response: bool = False,
-    no_attributes: bool = False,
-    compressed_state_format: bool = False,
-) -> MutableMapping[str, list[State | dict[str, Any]]]:
-    """Return states changes during UTC period start_time - end_time.
-
-    entity_ids is an optional iterable of entities to include in the results.
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[StatementLambdaElement, dict[str, int | None], float | None] | None:
+    """Return the statement to query the significant states of entity_ids.
 
-    filters is an optional SQLAlchemy filter which will be applied to the database
-    queries unless entity_ids is given, in which case its ignored.
+    The metadata_ids of the entities and the start time timestamp to use
+    for the start time states are returned with the statement. The start
+    time timestamp is None if the start time states are not included.
 
-    Significant states are all states where there is a state change,
-    as well as all states from certain domains (for instance
-    thermostat so that we get current temperature in our graphs).
+    None is returned if none of the entities have states.
     """
-    if filters is not None:
-        raise NotImplementedError("Filters are no longer supported")
-    if not entity_ids:
-        raise ValueError("entity_ids must be provided")
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -219,7 +233,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -257,9 +271,58 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
+    return (
+        stmt,
+        entity_id_to_metadata_id,
+        start_time_ts if include_start_time_state else None,
+    )
+
+
+def get_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    filters: Filters | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+) -> MutableMapping[str, list[State | dict[str, Any]]]:
+    """Return states changes during UTC period start_time - end_time.
+
+    entity_ids is an optional iterable of entities to include in the results.
+
+    filters is an optional SQLAlchemy filter which will be applied to the database
+    queries unless entity_ids is given, in which case its ignored.
+
+    Significant states are all states where there is a state change,
+    as well as all states from certain domains (for instance
+    thermostat so that we get current temperature in our graphs).
+    """
+    if filters is not None:
+        raise NotImplementedError("Filters are no longer supported")
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if not (
+        significant_states := _significant_states_stmt_for_entities(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, entity_id_to_metadata_id, start_time_ts = significant_states
     return _sorted_states_to_dict(
         execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
+        start_time_ts,
         entity_ids,
         entity_id_to_metadata_id,
         minimal_response,
@@ -268,6 +331,53 @@ def get_significant_states_with_session(
     )
 
 
+def get_significant_states_columnar(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> dict[str, ColumnarStates]:
+    """Return the significant states during UTC period start_time - end_time as columns.
+
+    The columns are built directly from the database rows. With
+    minimal_response states which only changed attributes are left out.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            significant_states := _significant_states_stmt_for_entities(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ):
+            return {}
+        stmt, entity_id_to_metadata_id, start_time_ts = significant_states
+        # Long periods are fetched with yield_per since the rows are
+        # converted to columns as they are fetched
+        return _sorted_states_to_columnar(
+            execute_stmt_lambda_element(
+                session, stmt, start_time, end_time, orm_rows=False
+            ),
+            start_time_ts,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            not significant_changes_only,
+            no_attributes,
+        )
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -768,3 +878,69 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_columnar(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    include_last_changed: bool,
+    no_attributes: bool,
+) -> dict[str, ColumnarStates]:
+    """Convert SQL results into columns per entity.
+
+    States must be sorted by entity_id and last_updated.
+    """
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    field_map = {
+        column: idx
+        for idx, column in enumerate(
+            _selected_columns(no_attributes, include_last_changed)
+        )
+    }
+    state_idx = field_map["state"]
+    last_updated_ts_idx = field_map["last_updated_ts"]
+    last_changed_ts_idx = field_map.get("last_changed_ts", -1)
+    attributes_idx = field_map.get("attributes", -1)
+    attr_cache: dict[str, dict[str, Any]] = {}
+    result: dict[str, ColumnarStates] = {}
+
+    for metadata_id, group in groupby(states, itemgetter(field_map["metadata_id"])):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        columns = ColumnarStates(include_last_changed, not no_attributes)
+        skip_unchanged = (
+            minimal_response
+            and split_entity_id(entity_id)[0] not in NEED_ATTRIBUTE_DOMAINS
+        )
+        prev_state: str | None = None
+        for row in group:
+            state = row[state_idx]
+            if skip_unchanged:
+                if state == prev_state:
+                    continue
+                prev_state = state
+            attributes_index = 0
+            if not no_attributes:
+                source = row[attributes_idx]
+                if (index := columns.get_attributes_index(source)) is None:
+                    index = columns.add_attributes(
+                        source, decode_attributes_from_source(source, attr_cache)
+                    )
+                attributes_index = index
+            columns.append(
+                state,
+                row[last_updated_ts_idx] or start_time_ts,  # type: ignore[arg-type]
+                row[last_changed_ts_idx] if include_last_changed else None,
+                attributes_index,
+            )
+        columns.compact()
+        result[entity_id] = columns
+
+    # Keep the order of the entity_ids
+    return {
+        entity_id: result[entity_id] for entity_id in entity_ids if entity_id in result
+    }
@@ -0,0 +1,200 @@
+"""Buffer events and states rows between commits and insert them in batches."""
+from __future__ import annotations
+
+from typing import Any, cast
+
+from sqlalchemy import Table, insert, select
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.orm.session import Session
+
+from .const import SQLITE_MAX_BIND_VARS
+from .db_schema import EventData, EventTypes, StateAttributes, StatesMeta
+from .util import chunked
+
+
+class PendingEvent:
+    """An events row waiting for the next commit."""
+
+    __slots__ = ("row", "event_type", "event_data")
+
+    def __init__(self, row: dict[str, Any]) -> None:
+        """Initialize the pending event.
+
+        event_type and event_data are set when the row refers to
+        EventTypes or EventData which are not yet committed and
+        have no ids yet.
+        """
+        self.row = row
+        self.event_type: EventTypes | None = None
+        self.event_data: EventData | None = None
+
+
+class PendingState:
+    """A states row waiting for the next commit."""
+
+    __slots__ = (
+        "row",
+        "generation",
+        "old_state",
+        "states_meta",
+        "state_attributes",
+        "state_id",
+    )
+
+    def __init__(self, row: dict[str, Any], old_state: PendingState | None) -> None:
+        """Initialize the pending state.
+
+        old_state is the previous pending state of the same entity, it is
+        inserted before this state so its state_id can be linked. The
+        generation is the number of pending states of the entity before
+        this one.
+        """
+        self.row = row
+        self.old_state = old_state
+        self.generation: int = 0 if old_state is None else old_state.generation + 1
+        self.states_meta: StatesMeta | None = None
+        self.state_attributes: StateAttributes | None = None
+        self.state_id: int | None = None
+
+
+class PendingRows:
+    """Rows of the events and states tables waiting for the next commit.
+
+    The rows are plain column dicts instead of ORM objects and are
+    inserted with Core executemany statements when the event session
+    is committed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the pending rows."""
+        self._events: list[PendingEvent] = []
+        # States grouped by generation, a state is always inserted
+        # after the pending state it links to with old_state_id
+        self._states: list[list[PendingState]] = []
+
+    def __bool__(self) -> bool:
+        """Return if there are rows waiting to be inserted."""
+        return bool(self._events or self._states)
+
+    def __len__(self) -> int:
+        """Return the number of rows waiting to be inserted."""
+        return len(self._events) + sum(len(states) for states in self._states)
+
+    def add_event(self, pending_event: PendingEvent) -> None:
+        """Add an events row to insert at the next commit."""
+        self._events.append(pending_event)
+
+    def add_state(self, pending_state: PendingState) -> None:
+        """Add a states row to insert at the next commit."""
+        generation = pending_state.generation
+        while len(self._states) <= generation:
+            self._states.append([])
+        self._states[generation].append(pending_state)
+
+    def clear(self) -> None:
+        """Drop all pending rows after they are committed or rolled back."""
+        self._events.clear()
+        self._states.clear()
+
+    def insert(
+        self,
+        session: Session,
+        events_table: Table,
+        states_table: Table,
+        returning: bool,
+    ) -> None:
+        """Insert the pending rows in batches.
+
+        The session must be flushed first so the pending EventTypes,
+        EventData, StatesMeta and StateAttributes have ids.
+
+        If returning is True the dialect can return the state_ids of an
+        executemany in parameter order. The MySQL and MariaDB drivers
+        cannot do this, and the ids of a multi row insert cannot be
+        derived from lastrowid as auto increment values may have gaps
+        with interleaved lock mode or auto_increment_increment. Their
+        states are still inserted in one executemany and the state_ids
+        are selected afterwards by metadata_id and last_updated_ts.
+        States without a metadata_id, before the entity_id migration,
+        are inserted one at a time instead.
+        """
+        if self._events:
+            event_rows: list[dict[str, Any]] = []
+            for pending_event in self._events:
+                row = pending_event.row
+                if event_types := pending_event.event_type:
+                    row["event_type_id"] = event_types.event_type_id
+                if event_data := pending_event.event_data:
+                    row["data_id"] = event_data.data_id
+                event_rows.append(row)
+            session.execute(insert(events_table), event_rows)
+
+        for generation in self._states:
+            if not generation:
+                continue
+            state_rows: list[dict[str, Any]] = []
+            for pending_state in generation:
+                row = pending_state.row
+                if old_state := pending_state.old_state:
+                    row["old_state_id"] = old_state.state_id
+                if states_meta := pending_state.states_meta:
+                    row["metadata_id"] = states_meta.metadata_id
+                if state_attributes := pending_state.state_attributes:
+                    row["attributes_id"] = state_attributes.attributes_id
+                state_rows.append(row)
+            if returning:
+                result = session.execute(
+                    insert(states_table).returning(
+                        states_table.c.state_id, sort_by_parameter_order=True
+                    ),
+                    state_rows,
+                )
+                for pending_state, state_id in zip(generation, result.scalars()):
+                    pending_state.state_id = state_id
+                continue
+            if all(row.get("metadata_id") is not None for row in state_rows):
+                session.execute(insert(states_table), state_rows)
+                _select_state_ids(session, states_table, generation)
+                continue
+            for pending_state, row in zip(generation, state_rows):
+                cursor_result = cast(
+                    CursorResult, session.execute(insert(states_table), row)
+                )
+                pending_state.state_id = cursor_result.inserted_primary_key[0]
+
+
+def _select_state_ids(
+    session: Session, states_table: Table, generation: list[PendingState]
+) -> None:
+    """Select the state_ids of states inserted without returning.
+
+    An entity has one state per generation, so metadata_id and
+    last_updated_ts identify a state of the generation. If an older
+    state has the same metadata_id and last_updated_ts the highest
+    state_id is the one just inserted.
+    """
+    metadata_id_column = states_table.c.metadata_id
+    last_updated_ts_column = states_table.c.last_updated_ts
+    # Both columns are filtered with an IN clause
+    for pending_states in chunked(generation, SQLITE_MAX_BIND_VARS // 2):
+        pending_by_key = {
+            (
+                pending_state.row["metadata_id"],
+                pending_state.row["last_updated_ts"],
+            ): pending_state
+            for pending_state in pending_states
+        }
+        state_ids: dict[tuple[int, float], int] = {}
+        for state_id, metadata_id, last_updated_ts in session.execute(
+            select(
+                states_table.c.state_id, metadata_id_column, last_updated_ts_column
+            ).where(
+                metadata_id_column.in_({key[0] for key in pending_by_key}),
+                last_updated_ts_column.in_({key[1] for key in pending_by_key}),
+            )
+        ):
+            key = (metadata_id, last_updated_ts)
+            if key in pending_by_key and state_id > state_ids.get(key, 0):
+                state_ids[key] = state_id
+        for key, pending_state in pending_by_key.items():
+            pending_state.state_id = state_ids.get(key)
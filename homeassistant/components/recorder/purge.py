@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
 from itertools import zip_longest
 import logging
@@ -54,6 +55,13 @@ DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
 
+@dataclass(slots=True)
+class PurgeProgress:
+    """Number of rows deleted by a purge."""
+
+    rows: int = 0
+
+
 @retryable_database_job("purge")
 def purge_old_data(
     instance: Recorder,
@@ -62,11 +70,16 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+    The number of deleted states, events, attributes, event data and
+    statistics rows is added to progress when it is passed.
     """
+    if progress is None:
+        progress = PurgeProgress()
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
@@ -79,7 +92,9 @@ def purge_old_data(
                 "Purge running in legacy format as there are states with event_id"
                 " remaining"
             )
-            has_more_to_purge |= _purge_legacy_format(instance, session, purge_before)
+            has_more_to_purge |= _purge_legacy_format(
+                instance, session, purge_before, progress
+            )
         else:
             _LOGGER.debug(
                 "Purge running in new format as there are NO states with event_id"
@@ -87,10 +102,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, progress
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, progress
             )
 
         statistics_runs = _select_statistics_runs_to_purge(session, purge_before)
@@ -102,6 +117,7 @@ def purge_old_data(
 
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
+        progress.rows += len(statistics_runs) + len(short_term_statistics)
 
         if has_more_to_purge or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
@@ -132,7 +148,10 @@ def _purging_legacy_format(session: Session) -> bool:
 
 
 def _purge_legacy_format(
-    instance: Recorder, session: Session, purge_before: datetime
+    instance: Recorder,
+    session: Session,
+    purge_before: datetime,
+    progress: PurgeProgress,
 ) -> bool:
     """Purge rows that are still linked by the event_ids."""
     (
@@ -144,9 +163,10 @@ def _purge_legacy_format(
         session, purge_before
     )
     _purge_state_ids(instance, session, state_ids)
-    _purge_unused_attributes_ids(instance, session, attributes_ids)
+    progress.rows += len(state_ids) + len(event_ids)
+    progress.rows += _purge_unused_attributes_ids(instance, session, attributes_ids)
     _purge_event_ids(session, event_ids)
-    _purge_unused_data_ids(instance, session, data_ids)
+    progress.rows += _purge_unused_data_ids(instance, session, data_ids)
 
     # The database may still have some rows that have an event_id but are not
     # linked to any event. These rows are not linked to any event because the
@@ -160,7 +180,10 @@ def _purge_legacy_format(
         session, purge_before
     )
     _purge_state_ids(instance, session, detached_state_ids)
-    _purge_unused_attributes_ids(instance, session, detached_attributes_ids)
+    progress.rows += len(detached_state_ids)
+    progress.rows += _purge_unused_attributes_ids(
+        instance, session, detached_attributes_ids
+    )
     return bool(
         event_ids
         or state_ids
@@ -176,6 +199,7 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -197,9 +221,12 @@ def _purge_states_and_attributes_ids(
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
+        progress.rows += len(state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
 
-    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+    progress.rows += _purge_unused_attributes_ids(
+        instance, session, attributes_ids_batch
+    )
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
@@ -212,6 +239,7 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -229,9 +257,10 @@ def _purge_events_and_data_ids(
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
+        progress.rows += len(event_ids)
         data_ids_batch = data_ids_batch | data_ids
 
-    _purge_unused_data_ids(instance, session, data_ids_batch)
+    progress.rows += _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
         has_remaining_event_ids_to_purge,
@@ -351,14 +380,15 @@ def _purge_unused_attributes_ids(
     instance: Recorder,
     session: Session,
     attributes_ids_batch: set[int],
-) -> None:
-    """Purge unused attributes ids."""
+) -> int:
+    """Purge unused attributes ids and return how many were purged."""
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_attribute_ids_set := _select_unused_attributes_ids(
         session, attributes_ids_batch, database_engine
     ):
         _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
+    return len(unused_attribute_ids_set)
 
 
 def _select_unused_event_data_ids(
@@ -395,13 +425,15 @@ def _select_unused_event_data_ids(
 
 def _purge_unused_data_ids(
     instance: Recorder, session: Session, data_ids_batch: set[int]
-) -> None:
+) -> int:
+    """Purge unused event data ids and return how many were purged."""
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_data_ids_set := _select_unused_event_data_ids(
         session, data_ids_batch, database_engine
     ):
         _purge_batch_data_ids(instance, session, unused_data_ids_set)
+    return len(unused_data_ids_set)
 
 
 def _select_statistics_runs_to_purge(
@@ -0,0 +1,148 @@
+"""Spread the automatic purge over the day in time budgeted slices."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+import homeassistant.util.dt as dt_util
+
+from .purge import DEFAULT_EVENTS_BATCHES_PER_PURGE, DEFAULT_STATES_BATCHES_PER_PURGE
+
+_LOGGER = logging.getLogger(__name__)
+
+# The purge has until the next nightly run to finish
+ADAPTIVE_PURGE_WINDOW = timedelta(hours=23)
+# The time a single slice of the purge should block the recorder queue
+ADAPTIVE_PURGE_SLICE_TIME = 0.25
+# Slices are deferred while the queue holds more tasks than this
+ADAPTIVE_PURGE_MAX_BACKLOG = 250
+# How long a deferred slice waits before it is queued again
+ADAPTIVE_PURGE_DEFER_TIME = 5
+
+
+class AdaptivePurgeScheduler:
+    """Track an adaptive purge and size its slices.
+
+    The purge runs in slices between commits. The number of batches
+    purged in a slice shrinks when a slice takes longer than the time
+    budget and grows again when slices are fast and the queue is short.
+    Slices are deferred while the queue has a backlog, unless the purge
+    window has passed, in which case the purge catches up.
+
+    The scheduler is only updated from the recorder thread, readers
+    in the event loop take a copy with as_dict.
+    """
+
+    def __init__(
+        self,
+        slice_time: float = ADAPTIVE_PURGE_SLICE_TIME,
+        max_backlog: int = ADAPTIVE_PURGE_MAX_BACKLOG,
+        window: timedelta = ADAPTIVE_PURGE_WINDOW,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.slice_time = slice_time
+        self.max_backlog = max_backlog
+        self.window = window
+        self.active = False
+        self.purge_before: datetime | None = None
+        self.repack = False
+        self.window_start: datetime | None = None
+        self.window_end: datetime | None = None
+        self.states_batch_size = 1
+        self.events_batch_size = 1
+        self.rows_purged = 0
+        self.purge_time = 0.0
+        self.slices = 0
+        self.deferred_slices = 0
+        self.last_slice_time = 0.0
+        self.last_completed: datetime | None = None
+
+    def start(self, purge_before: datetime, repack: bool) -> bool:
+        """Start a new purge window.
+
+        Returns False if a purge was already running, it continues with
+        the new purge_before instead of starting another chain of slices.
+        """
+        was_active = self.active
+        now = dt_util.utcnow()
+        self.active = True
+        self.purge_before = purge_before
+        self.repack = repack
+        self.window_start = now
+        self.window_end = now + self.window
+        self.rows_purged = 0
+        self.purge_time = 0.0
+        self.slices = 0
+        self.deferred_slices = 0
+        if was_active:
+            _LOGGER.warning(
+                "The previous purge did not finish in its window, continuing"
+                " with the new window"
+            )
+        return not was_active
+
+    @property
+    def window_remaining(self) -> float:
+        """Return the seconds left in the purge window."""
+        if not self.active or self.window_end is None:
+            return 0.0
+        return max((self.window_end - dt_util.utcnow()).total_seconds(), 0.0)
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the rows purged per second spent purging."""
+        if not self.purge_time:
+            return 0.0
+        return self.rows_purged / self.purge_time
+
+    def should_defer(self, backlog: int) -> bool:
+        """Return if the next slice should wait for the backlog to drain."""
+        if backlog <= self.max_backlog or not self.window_remaining:
+            return False
+        self.deferred_slices += 1
+        self.states_batch_size = self.events_batch_size = 1
+        return True
+
+    def record_slice(self, run_time: float, rows: int, backlog: int) -> None:
+        """Record a purged slice and size the next one."""
+        self.slices += 1
+        self.rows_purged += rows
+        self.purge_time += run_time
+        self.last_slice_time = run_time
+        if run_time > self.slice_time:
+            self.states_batch_size = max(self.states_batch_size // 2, 1)
+            self.events_batch_size = max(self.events_batch_size // 2, 1)
+        elif run_time < self.slice_time / 2 and backlog < self.max_backlog / 2:
+            self.states_batch_size = min(
+                self.states_batch_size + 1, DEFAULT_STATES_BATCHES_PER_PURGE
+            )
+            self.events_batch_size = min(
+                self.events_batch_size + 1, DEFAULT_EVENTS_BATCHES_PER_PURGE
+            )
+
+    def finish(self) -> None:
+        """Finish the purge window."""
+        self.active = False
+        self.last_completed = dt_util.utcnow()
+        _LOGGER.debug(
+            "Purged %s rows in %s slices, %.1f rows per second",
+            self.rows_purged,
+            self.slices,
+            self.rows_per_second,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress of the purge."""
+        return {
+            "active": self.active,
+            "rows_purged": self.rows_purged,
+            "rows_per_second": round(self.rows_per_second, 1),
+            "slices": self.slices,
+            "deferred_slices": self.deferred_slices,
+            "last_slice_time": round(self.last_slice_time * 1000, 3),
+            "states_batch_size": self.states_batch_size,
+            "events_batch_size": self.events_batch_size,
+            "window_remaining": round(self.window_remaining),
+            "last_completed": self.last_completed,
+        }
@@ -54,6 +54,32 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_task_metrics_info(instance: Recorder) -> dict[str, Any]:
+    """Get the recorder queue and commit metrics."""
+    task_metrics = instance.task_metrics
+    task_metrics_info: dict[str, Any] = {
+        "backlog": instance.backlog,
+        "average_commit_time": f"{task_metrics.average_commit_time * 1000:.2f} ms",
+        "average_rows_per_commit": round(task_metrics.average_commit_rows, 1),
+    }
+    if busiest_task_type := task_metrics.busiest_task_type():
+        task_metrics_info["busiest_task"] = busiest_task_type
+    return task_metrics_info
+
+
+@callback
+def _async_get_purge_info(instance: Recorder) -> dict[str, Any]:
+    """Get the progress of a running adaptive purge."""
+    purge_scheduler = instance.purge_scheduler
+    if not purge_scheduler.active:
+        return {}
+    return {
+        "purge_rows_per_second": round(purge_scheduler.rows_per_second, 1),
+        "purge_window_remaining": f"{purge_scheduler.window_remaining / 3600:.1f} h",
+    }
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -61,6 +87,8 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     recorder_runs_manager = instance.recorder_runs_manager
     database_name = urlparse(instance.db_url).path.lstrip("/")
     db_engine_info = _async_get_db_engine_info(instance)
+    task_metrics_info = _async_get_task_metrics_info(instance)
+    purge_info = _async_get_purge_info(instance)
     db_stats: dict[str, Any] = {}
 
     if instance.async_db_ready.done():
@@ -71,4 +99,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | task_metrics_info | purge_info
@@ -1,7 +1,7 @@
 """Support managing States."""
 from __future__ import annotations
 
-from ..db_schema import States
+from ..pending_rows import PendingState
 
 
 class StatesManager:
@@ -9,10 +9,10 @@ class StatesManager:
 
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
-        self._pending: dict[str, States] = {}
+        self._pending: dict[str, PendingState] = {}
         self._last_committed_id: dict[str, int] = {}
 
-    def pop_pending(self, entity_id: str) -> States | None:
+    def pop_pending(self, entity_id: str) -> PendingState | None:
         """Pop a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -33,7 +33,7 @@ class StatesManager:
         """
         return self._last_committed_id.pop(entity_id, None)
 
-    def add_pending(self, entity_id: str, state: States) -> None:
+    def add_pending(self, entity_id: str, state: PendingState) -> None:
         """Add a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -49,8 +49,9 @@ class StatesManager:
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        for entity_id, db_states in self._pending.items():
-            self._last_committed_id[entity_id] = db_states.state_id
+        for entity_id, pending_state in self._pending.items():
+            if (state_id := pending_state.state_id) is not None:
+                self._last_committed_id[entity_id] = state_id
         self._pending.clear()
 
     def reset(self) -> None:
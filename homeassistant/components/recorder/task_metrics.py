@@ -0,0 +1,134 @@
+"""Track how long recorder tasks wait and run, and the cost of commits."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .tasks import RecorderTask
+
+
+def _ms(seconds: float) -> float:
+    """Convert seconds to rounded milliseconds."""
+    return round(seconds * 1000, 3)
+
+
+@dataclass(slots=True)
+class TaskTypeMetrics:
+    """Time in queue and processing time of one recorder task type."""
+
+    count: int = 0
+    total_queue_time: float = 0.0
+    max_queue_time: float = 0.0
+    total_run_time: float = 0.0
+    max_run_time: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics in milliseconds."""
+        count = self.count or 1
+        return {
+            "count": self.count,
+            "queue_time": {
+                "average": _ms(self.total_queue_time / count),
+                "max": _ms(self.max_queue_time),
+            },
+            "run_time": {
+                "average": _ms(self.total_run_time / count),
+                "max": _ms(self.max_run_time),
+                "total": _ms(self.total_run_time),
+            },
+        }
+
+
+class RecorderTaskMetrics:
+    """Metrics of the tasks processed by the recorder thread.
+
+    The metrics are only updated from the recorder thread, readers
+    in the event loop take a copy with as_dict.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self._task_types: dict[type[RecorderTask], TaskTypeMetrics] = {}
+        self.commits = 0
+        self.total_commit_time = 0.0
+        self.max_commit_time = 0.0
+        self.last_commit_time = 0.0
+        self.total_commit_rows = 0
+        self.max_commit_rows = 0
+        self.last_commit_rows = 0
+
+    def record_task(
+        self, task_type: type[RecorderTask], queue_time: float, run_time: float
+    ) -> None:
+        """Record a processed task.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (metrics := self._task_types.get(task_type)) is None:
+            metrics = self._task_types[task_type] = TaskTypeMetrics()
+        metrics.count += 1
+        metrics.total_queue_time += queue_time
+        metrics.total_run_time += run_time
+        if queue_time > metrics.max_queue_time:
+            metrics.max_queue_time = queue_time
+        if run_time > metrics.max_run_time:
+            metrics.max_run_time = run_time
+
+    def record_commit(self, commit_time: float, rows: int) -> None:
+        """Record a commit of the event session.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self.commits += 1
+        self.total_commit_time += commit_time
+        self.last_commit_time = commit_time
+        self.total_commit_rows += rows
+        self.last_commit_rows = rows
+        if commit_time > self.max_commit_time:
+            self.max_commit_time = commit_time
+        if rows > self.max_commit_rows:
+            self.max_commit_rows = rows
+
+    @property
+    def average_commit_time(self) -> float:
+        """Return the average commit time in seconds."""
+        return self.total_commit_time / (self.commits or 1)
+
+    @property
+    def average_commit_rows(self) -> float:
+        """Return the average number of rows written per commit."""
+        return self.total_commit_rows / (self.commits or 1)
+
+    def busiest_task_type(self) -> str | None:
+        """Return the name of the task type which used the most time."""
+        # Copy first since the recorder thread may add new task types
+        task_types = self._task_types.copy()
+        if not task_types:
+            return None
+        task_type = max(task_types, key=lambda key: task_types[key].total_run_time)
+        return task_type.__name__
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics with times in milliseconds."""
+        # Copy first since the recorder thread may add new task types
+        task_types = self._task_types.copy()
+        return {
+            "commits": self.commits,
+            "commit_time": {
+                "average": _ms(self.average_commit_time),
+                "max": _ms(self.max_commit_time),
+                "last": _ms(self.last_commit_time),
+            },
+            "rows_per_commit": {
+                "average": round(self.average_commit_rows, 1),
+                "max": self.max_commit_rows,
+                "last": self.last_commit_rows,
+            },
+            "tasks": {
+                task_type.__name__: metrics.as_dict()
+                for task_type, metrics in task_types.items()
+            },
+        }
@@ -4,10 +4,11 @@ from __future__ import annotations
 import abc
 import asyncio
 from collections.abc import Callable, Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 import threading
+import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import Event
@@ -31,6 +32,11 @@ class RecorderTask:
     """ABC for recorder tasks."""
 
     commit_before = True
+    # Tasks are queued right after they are created, the creation
+    # time is used to measure how long they wait in the queue
+    queued_at: float = field(
+        default_factory=time.monotonic, init=False, repr=False, compare=False
+    )
 
     @abc.abstractmethod
     def run(self, instance: Recorder) -> None:
@@ -126,6 +132,56 @@ class PurgeTask(RecorderTask):
         )
 
 
+@dataclass(slots=True)
+class AdaptivePurgeTask(RecorderTask):
+    """Object to start a purge which runs in slices between commits."""
+
+    purge_before: datetime
+    repack: bool
+
+    def run(self, instance: Recorder) -> None:
+        """Start the purge window and queue the first slice."""
+        if instance.purge_scheduler.start(self.purge_before, self.repack):
+            instance.queue_task(AdaptivePurgeSliceTask())
+
+
+@dataclass(slots=True)
+class AdaptivePurgeSliceTask(RecorderTask):
+    """Object to purge one time budgeted slice of the database."""
+
+    def run(self, instance: Recorder) -> None:
+        """Purge a slice of the database."""
+        scheduler = instance.purge_scheduler
+        if not scheduler.active:
+            return
+        assert scheduler.purge_before is not None
+        if scheduler.should_defer(instance.backlog):
+            # Give the events in the queue a chance to be committed first
+            instance.hass.add_job(instance.async_defer_purge_slice)
+            return
+        progress = purge.PurgeProgress()
+        start = time.monotonic()
+        finished = purge.purge_old_data(
+            instance,
+            scheduler.purge_before,
+            scheduler.repack,
+            events_batch_size=scheduler.events_batch_size,
+            states_batch_size=scheduler.states_batch_size,
+            progress=progress,
+        )
+        scheduler.record_slice(
+            time.monotonic() - start, progress.rows, instance.backlog
+        )
+        if finished:
+            scheduler.finish()
+            with instance.get_session() as session:
+                instance.recorder_runs_manager.load_from_db(session)
+            periodic_db_cleanups(instance)
+            return
+        # Queue the next slice behind the events that arrived meanwhile
+        instance.queue_task(AdaptivePurgeSliceTask())
+
+
 @dataclass(slots=True)
 class PurgeEntitiesTask(RecorderTask):
     """Object to store entity information about purge task."""
@@ -6,11 +6,13 @@ from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.trace import (
+    CONF_LAZY_VARIABLES,
     CONF_STORED_TRACES,
     ActionTrace,
     async_store_trace,
 )
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import trace_lazy_variables
 
 from .const import DOMAIN
 
@@ -35,7 +37,8 @@ def trace_script(
     async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
 
     try:
-        yield trace
+        with trace_lazy_variables(trace_config[CONF_LAZY_VARIABLES]):
+            yield trace
     except Exception as ex:
         if item_id:
             trace.set_error(ex)
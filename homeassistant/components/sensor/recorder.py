@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from collections.abc import Iterable, MutableMapping
+from dataclasses import dataclass
 import datetime
 import itertools
 import logging
@@ -25,14 +26,23 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, callback, split_entity_id
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
+from homeassistant.helpers.event import async_track_utc_time_change
 from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
@@ -70,6 +80,13 @@ WARN_UNSUPPORTED_UNIT = "sensor_warn_unsupported_unit"
 WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# Keep running statistics of the sensors in memory
+STATISTICS_TRACKER = "sensor_statistics_tracker"
+STATISTICS_PERIOD = datetime.timedelta(minutes=5)
+# How many periods a snapshot of the statistics is kept for if it is not compiled
+MAX_TRACKED_PERIODS = 12
+
+_SENSOR_ENTITY_ID_PREFIX = f"{DOMAIN}."
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -84,6 +101,63 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     ]
 
 
+class _TimeWeightedAverage:
+    """Calculate the time weighted average of states added in order."""
+
+    __slots__ = (
+        "_start",
+        "_first_start_time",
+        "_start_time",
+        "_fstate",
+        "_accumulated",
+    )
+
+    def __init__(self, start: datetime.datetime) -> None:
+        """Initialize the average."""
+        self._start = start
+        self._first_start_time: datetime.datetime | None = None
+        self._start_time: datetime.datetime | None = None
+        self._fstate: float | None = None
+        self._accumulated = 0.0
+
+    def add(self, fstate: float, last_updated: datetime.datetime) -> None:
+        """Add a state."""
+        # The recorder will give us the last known state, which may be well
+        # before the requested start time for the statistics
+        start_time = self._start if last_updated < self._start else last_updated
+        if self._start_time is None:
+            # Adjust start time, if there was no last known state
+            self._first_start_time = start_time
+        else:
+            duration = start_time - self._start_time
+            # Accumulate the value, weighted by duration until next state change
+            assert self._fstate is not None
+            self._accumulated += self._fstate * duration.total_seconds()
+
+        self._fstate = fstate
+        self._start_time = start_time
+
+    def mean(self, end: datetime.datetime) -> float:
+        """Return the average until end."""
+        accumulated = self._accumulated
+        if self._fstate is not None:
+            # Accumulate the value, weighted by duration until end of the period
+            assert self._start_time is not None
+            duration = end - self._start_time
+            accumulated += self._fstate * duration.total_seconds()
+
+        period_seconds = (end - (self._first_start_time or self._start)).total_seconds()
+        if period_seconds == 0:
+            # If the only state changed that happened was at the exact moment
+            # at the end of the period, we can't calculate a meaningful average
+            # so we return 0.0 since it represents a time duration smaller than
+            # we can measure. This probably means the precision of statistics
+            # column schema in the database is incorrect but it is actually possible
+            # to happen if the state change event fired at the exact microsecond
+            return 0.0
+        return accumulated / period_seconds
+
+
 def _time_weighted_average(
     fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
 ) -> float:
@@ -93,42 +167,10 @@ def _time_weighted_average(
     state changes.
     Note: there's no interpolation of values between state changes.
     """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
-    accumulated = 0.0
-
+    average = _TimeWeightedAverage(start)
     for fstate, state in fstates:
-        # The recorder will give us the last known state, which may be well
-        # before the requested start time for the statistics
-        start_time = start if state.last_updated < start else state.last_updated
-        if old_start_time is None:
-            # Adjust start time, if there was no last known state
-            start = start_time
-        else:
-            duration = start_time - old_start_time
-            # Accumulate the value, weighted by duration until next state change
-            assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
-
-        old_fstate = fstate
-        old_start_time = start_time
-
-    if old_fstate is not None:
-        # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
-
-    period_seconds = (end - start).total_seconds()
-    if period_seconds == 0:
-        # If the only state changed that happened was at the exact moment
-        # at the end of the period, we can't calculate a meaningful average
-        # so we return 0.0 since it represents a time duration smaller than
-        # we can measure. This probably means the precision of statistics
-        # column schema in the database is incorrect but it is actually possible
-        # to happen if the state change event fired at the exact microsecond
-        return 0.0
-    return accumulated / period_seconds
+        average.add(fstate, state.last_updated)
+    return average.mean(end)
 
 
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
@@ -386,6 +428,254 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
+@dataclass(slots=True)
+class _PeriodStatistics:
+    """The statistics of a sensor which was observed during a whole period.
+
+    float_states holds the states with the min and the max of a sensor
+    with a mean, or the first and the last state of each run of a sensor
+    with a sum.
+    """
+
+    state_class: str
+    float_states: list[tuple[float, State]]
+    mean: float | None
+
+
+class _StatisticsAccumulator:
+    """Running statistics of a sensor during a statistics period.
+
+    Sensors with a mean keep the time weighted average, min and max of
+    their significant states. Sensors with a sum keep runs of states, a
+    state with the same unit and last_reset as the previous state which
+    did not decrease can not start a new cycle, so only the first and the
+    last state of a run are needed to compile the sum.
+    """
+
+    __slots__ = (
+        "state_class",
+        "last_state",
+        "_complete",
+        "_average",
+        "_unit",
+        "_min",
+        "_max",
+        "_runs",
+    )
+
+    def __init__(
+        self,
+        state_class: str,
+        start: datetime.datetime,
+        state: State,
+        complete: bool,
+    ) -> None:
+        """Initialize the accumulator with the last known state."""
+        self.state_class = state_class
+        self.last_state: State | None = None
+        # If the sensor was observed during the whole period
+        self._complete = complete
+        self._average = _TimeWeightedAverage(start)
+        self._unit: str | None = None
+        self._min: tuple[float, State] | None = None
+        self._max: tuple[float, State] | None = None
+        self._runs: list[list[tuple[float, State]]] = []
+        self.add(state, True)
+
+    def add(self, state: State, start_state: bool = False) -> None:
+        """Add a state of the sensor."""
+        if (
+            self.last_state is not None
+            and state.last_updated < self.last_state.last_updated
+        ) or state.attributes.get(ATTR_STATE_CLASS) != self.state_class:
+            self._complete = False
+        self.last_state = state
+        if (fstate := _float_or_none(state.state)) is None:
+            return
+        if self.state_class != SensorStateClass.MEASUREMENT:
+            self._add_sum_state(fstate, state)
+        # The history of sensors without a sum only has significant states
+        elif start_state or state.last_changed == state.last_updated:
+            self._add_mean_state(fstate, state)
+
+    def _add_mean_state(self, fstate: float, state: State) -> None:
+        """Add a state to the average, min and max."""
+        unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if self._min is None:
+            self._unit = unit
+        elif unit != self._unit:
+            # Changing units are left to the history which warns about them
+            self._complete = False
+        if self._min is None or fstate < self._min[0]:
+            self._min = (fstate, state)
+        if self._max is None or fstate > self._max[0]:
+            self._max = (fstate, state)
+        self._average.add(fstate, state.last_updated)
+
+    def _add_sum_state(self, fstate: float, state: State) -> None:
+        """Add a state to the runs."""
+        if self._runs:
+            run = self._runs[-1]
+            last_fstate, last_state = run[-1]
+            attributes = last_state.attributes
+            if attributes.get(ATTR_UNIT_OF_MEASUREMENT) == state.attributes.get(
+                ATTR_UNIT_OF_MEASUREMENT
+            ) and (
+                0 <= last_fstate <= fstate
+                if self.state_class == SensorStateClass.TOTAL_INCREASING
+                else attributes.get(ATTR_LAST_RESET)
+                == state.attributes.get(ATTR_LAST_RESET)
+            ):
+                if len(run) == 1:
+                    run.append((fstate, state))
+                else:
+                    run[1] = (fstate, state)
+                return
+        self._runs.append([(fstate, state)])
+
+    def remove(self) -> None:
+        """Remove the sensor."""
+        self._complete = False
+        self.last_state = None
+
+    def snapshot(self, end: datetime.datetime) -> _PeriodStatistics | None:
+        """Return the statistics of the period until end.
+
+        Returns None if the sensor was not observed during the whole period.
+        """
+        if not self._complete:
+            return None
+        if self.state_class != SensorStateClass.MEASUREMENT:
+            return _PeriodStatistics(
+                self.state_class, list(itertools.chain(*self._runs)), None
+            )
+        if self._min is None or self._max is None:
+            return _PeriodStatistics(self.state_class, [], None)
+        return _PeriodStatistics(
+            self.state_class, [self._min, self._max], self._average.mean(end)
+        )
+
+
+class StatisticsTracker:
+    """Keep running statistics of the sensors in memory.
+
+    The statistics are updated from state_changed events and a snapshot
+    of them is taken at the end of every statistics period, which saves
+    querying the history of all sensors from the database every time
+    statistics are compiled. The database is still queried for sensors
+    which were not observed during the whole period, like the period
+    Home Assistant started in.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the tracker."""
+        self._hass = hass
+        self._start = _period_start(dt_util.utcnow())
+        self._accumulators: dict[str, _StatisticsAccumulator] = {}
+        # The snapshots are taken in the event loop and popped when
+        # compiling statistics in the recorder thread
+        self._periods: dict[datetime.datetime, dict[str, _PeriodStatistics]] = {}
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start tracking the sensors and return a callback to stop."""
+        for state in self._hass.states.async_all(DOMAIN):
+            if (state_class := state.attributes.get(ATTR_STATE_CLASS)) not in (
+                DEFAULT_STATISTICS
+            ):
+                continue
+            # Earlier states of the sensor in this period are unknown
+            self._accumulators[state.entity_id] = _StatisticsAccumulator(
+                state_class, self._start, state, False
+            )
+        cancel_state_changed = self._hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+        )
+        cancel_time_change = async_track_utc_time_change(
+            self._hass,
+            self._async_end_periods,
+            minute=range(0, 60, 5),
+            second=0,
+        )
+
+        @callback
+        def _async_stop() -> None:
+            cancel_state_changed()
+            cancel_time_change()
+
+        return _async_stop
+
+    @callback
+    def _async_end_periods(self, now: datetime.datetime) -> None:
+        """Take a snapshot of the statistics of the periods which ended by now."""
+        while now >= (end := self._start + STATISTICS_PERIOD):
+            self._periods[self._start] = {
+                entity_id: period
+                for entity_id, accumulator in self._accumulators.items()
+                if (period := accumulator.snapshot(end)) is not None
+            }
+            # Snapshots which were not compiled in time are compiled from
+            # the database history
+            for start in list(self._periods):
+                if start <= end - MAX_TRACKED_PERIODS * STATISTICS_PERIOD:
+                    self._periods.pop(start, None)
+            self._start = end
+            self._accumulators = {
+                entity_id: _StatisticsAccumulator(state_class, end, state, True)
+                for entity_id, accumulator in self._accumulators.items()
+                if (state := accumulator.last_state) is not None
+                and (state_class := state.attributes.get(ATTR_STATE_CLASS))
+                in DEFAULT_STATISTICS
+            }
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Add a sensor state to the statistics."""
+        entity_id: str = event.data["entity_id"]
+        if not entity_id.startswith(_SENSOR_ENTITY_ID_PREFIX):
+            return
+        new_state: State | None = event.data["new_state"]
+        self._async_end_periods(
+            new_state.last_updated if new_state else event.time_fired
+        )
+        if (accumulator := self._accumulators.get(entity_id)) is not None:
+            if new_state is None:
+                accumulator.remove()
+            else:
+                accumulator.add(new_state)
+            return
+        if (
+            new_state is None
+            or (state_class := new_state.attributes.get(ATTR_STATE_CLASS))
+            not in DEFAULT_STATISTICS
+        ):
+            return
+        # The history of a new sensor starts with its first state
+        self._accumulators[entity_id] = _StatisticsAccumulator(
+            state_class, self._start, new_state, event.data["old_state"] is None
+        )
+
+    def pop_period(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> dict[str, _PeriodStatistics]:
+        """Return the statistics of the sensors observed during start-end."""
+        if end - start != STATISTICS_PERIOD:
+            return {}
+        return self._periods.pop(start, {})
+
+
+def _period_start(now: datetime.datetime) -> datetime.datetime:
+    """Return the start of the statistics period now is in."""
+    return now.replace(minute=now.minute - now.minute % 5, second=0, microsecond=0)
+
+
+@callback
+def async_setup_recorder_platform(hass: HomeAssistant) -> CALLBACK_TYPE:
+    """Start keeping the statistics of the sensors in memory."""
+    tracker = hass.data[STATISTICS_TRACKER] = StatisticsTracker(hass)
+    return tracker.async_start()
+
+
 def compile_statistics(
     hass: HomeAssistant, start: datetime.datetime, end: datetime.datetime
 ) -> statistics.PlatformCompiledStatistics:
@@ -406,20 +696,16 @@ def compile_statistics(
     return compiled
 
 
-def _compile_statistics(  # noqa: C901
+def _get_history(
     hass: HomeAssistant,
     session: Session,
     start: datetime.datetime,
     end: datetime.datetime,
-) -> statistics.PlatformCompiledStatistics:
-    """Compile statistics for all entities during start-end."""
-    result: list[StatisticResult] = []
-
-    sensor_states = _get_sensor_states(hass)
-    wanted_statistics = _wanted_statistics(sensor_states)
-    # Get history between start and end
+    wanted_statistics: dict[str, set[str]],
+) -> MutableMapping[str, list[State]]:
+    """Get the history of the sensors between start and end from the database."""
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        entity_id for entity_id, wanted in wanted_statistics.items() if "sum" in wanted
     ]
     history_list: MutableMapping[str, list[State]] = {}
     if entities_full_history:
@@ -432,9 +718,9 @@ def _compile_statistics(  # noqa: C901
             significant_changes_only=False,
         )
     entities_significant_history = [
-        i.entity_id
-        for i in sensor_states
-        if "sum" not in wanted_statistics[i.entity_id]
+        entity_id
+        for entity_id, wanted in wanted_statistics.items()
+        if "sum" not in wanted
     ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
@@ -445,15 +731,55 @@ def _compile_statistics(  # noqa: C901
             entity_ids=entities_significant_history,
         )
         history_list = {**history_list, **_history_list}
+    return history_list
+
+
+def _compile_statistics(  # noqa: C901
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> statistics.PlatformCompiledStatistics:
+    """Compile statistics for all entities during start-end."""
+    result: list[StatisticResult] = []
+
+    sensor_states = _get_sensor_states(hass)
+    wanted_statistics = _wanted_statistics(sensor_states)
+    # Statistics of the sensors the tracker observed during the whole period
+    periods: dict[str, _PeriodStatistics] = {}
+    if tracker := hass.data.get(STATISTICS_TRACKER):
+        tracked_periods = tracker.pop_period(start, end)
+        periods = {
+            _state.entity_id: period
+            for _state in sensor_states
+            if (period := tracked_periods.get(_state.entity_id))
+            and period.state_class == _state.attributes[ATTR_STATE_CLASS]
+        }
+    # Get history between start and end of the other sensors
+    history_list = _get_history(
+        hass,
+        session,
+        start,
+        end,
+        {
+            entity_id: wanted
+            for entity_id, wanted in wanted_statistics.items()
+            if entity_id not in periods
+        },
+    )
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if (period := periods.get(entity_id)) is not None:
+            float_states = period.float_states
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
-        if not (entity_history := history_list.get(entity_id, [_state])):
+        elif not (entity_history := history_list.get(entity_id, [_state])):
             continue
-        if not (float_states := _entity_history_to_float_and_state(entity_history)):
+        else:
+            float_states = _entity_history_to_float_and_state(entity_history)
+        if not float_states:
             continue
         entities_with_float_states[entity_id] = float_states
 
@@ -545,7 +871,20 @@ def _compile_statistics(  # noqa: C901
             )
 
         if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            if (period := periods.get(entity_id)) is None or period.mean is None:
+                stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            elif (
+                state_unit := valid_float_states[0][1].attributes.get(
+                    ATTR_UNIT_OF_MEASUREMENT
+                )
+            ) != statistics_unit:
+                # The tracker only has the mean in the unit of the states
+                converter = statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER[statistics_unit]
+                stat["mean"] = converter.convert(
+                    period.mean, from_unit=state_unit, to_unit=statistics_unit
+                )
+            else:
+                stat["mean"] = period.mean
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
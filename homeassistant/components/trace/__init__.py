@@ -18,6 +18,7 @@ from homeassistant.util.limited_size_dict import LimitedSizeDict
 
 from . import websocket_api
 from .const import (
+    CONF_LAZY_VARIABLES,
     CONF_STORED_TRACES,
     DATA_TRACE,
     DATA_TRACE_STORE,
@@ -34,7 +35,10 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    # Compare variables when the trace is serialized, variables which are
+    # mutated in place instead of replaced are not reported as changed
+    vol.Optional(CONF_LAZY_VARIABLES, default=False): cv.boolean,
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -1,5 +1,6 @@
 """Shared constants for script and automation tracing and debugging."""
 
+CONF_LAZY_VARIABLES = "lazy_variables"
 CONF_STORED_TRACES = "stored_traces"
 DATA_TRACE = "trace"
 DATA_TRACE_STORE = "trace_store"
@@ -42,7 +42,15 @@ DOMAIN: Final = const.DOMAIN
 
 DEPENDENCIES: Final[tuple[str]] = ("http",)
 
-CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN): vol.Any(
+            None,
+            vol.Schema({vol.Optional(const.CONF_LARGE_MESSAGE_SIZE): cv.positive_int}),
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
 
 
 @bind_hass
@@ -68,6 +76,11 @@ def async_register_command(
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the websocket API."""
+    conf = config.get(DOMAIN) or {}
+    hass.data[const.DATA_LARGE_MESSAGE_SIZE] = conf.get(
+        const.CONF_LARGE_MESSAGE_SIZE, const.DEFAULT_LARGE_MESSAGE_SIZE
+    )
+    hass.data[const.DATA_SEND_STATS] = http.WebSocketSendStats()
     hass.http.register_view(http.WebsocketAPIView())
     commands.async_register_commands(hass, async_register_command)
     return True
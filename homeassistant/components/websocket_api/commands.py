@@ -50,6 +50,7 @@ from . import const, decorators, messages
 from .connection import ActiveConnection
 from .const import ERR_NOT_FOUND
 from .messages import construct_event_message, construct_result_message
+from .state_hub import async_get_state_diff_hub
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
 
@@ -81,6 +82,7 @@ def async_register_commands(
     async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_supported_features)
     async_reg(hass, handle_integration_descriptions)
+    async_reg(hass, handle_send_stats)
 
 
 def pong_message(iden: int) -> dict[str, Any]:
@@ -292,29 +294,14 @@ def handle_subscribe_entities(
 ) -> None:
     """Handle subscribe entities command."""
     entity_ids = set(msg.get("entity_ids", []))
-    user = connection.user
-
-    @callback
-    def forward_entity_changes(event: Event) -> None:
-        """Forward entity state changed events to websocket."""
-        entity_id = event.data["entity_id"]
-        if entity_ids and entity_id not in entity_ids:
-            return
-        # We have to lookup the permissions again because the user might have
-        # changed since the subscription was created.
-        permissions = user.permissions
-        if not permissions.access_all_entities(
-            POLICY_READ
-        ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
-            return
-        connection.send_message(messages.cached_state_diff_message(msg["id"], event))
+    hub = async_get_state_diff_hub(hass)
 
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED, forward_entity_changes, run_immediately=True
+    connection.subscriptions[msg["id"]] = hub.async_subscribe(
+        connection, msg["id"], entity_ids
     )
     connection.send_result(msg["id"])
 
@@ -758,3 +745,26 @@ async def handle_integration_descriptions(
 ) -> None:
     """Get metadata for all brands and integrations."""
     connection.send_result(msg["id"], await async_get_integration_descriptions(hass))
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "send_stats"})
+def handle_send_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle the statistics of the messages sent to websocket clients.
+
+    Returns the large_message_size and the counters of WebSocketSendStats
+    for all connections since Home Assistant started. compressed_bytes,
+    saved_bytes, compression_ratio and compress_time_ms are estimated from
+    every SEND_STATS_SAMPLE_INTERVAL compressed message, they are None
+    until a message was compressed.
+    """
+    connection.send_result(
+        msg["id"],
+        {
+            "large_message_size": hass.data[const.DATA_LARGE_MESSAGE_SIZE],
+            **hass.data[const.DATA_SEND_STATS].as_dict(),
+        },
+    )
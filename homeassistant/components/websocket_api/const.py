@@ -48,4 +48,23 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
+# Data used to store the large message size
+DATA_LARGE_MESSAGE_SIZE: Final = f"{DOMAIN}.large_message_size"
+
+# Data used to store the send statistics of all connections
+DATA_SEND_STATS: Final = f"{DOMAIN}.send_stats"
+
+# Data used to store the hub of the subscribe_entities subscriptions
+DATA_STATE_DIFF_HUB: Final = f"{DOMAIN}.state_diff_hub"
+
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_BINARY_LARGE_MESSAGES = "binary_large_messages"
+
+CONF_LARGE_MESSAGE_SIZE: Final = "large_message_size"
+# Messages of at least this many characters are compressed when the client
+# negotiated permessage-deflate and sent as binary frames when the client
+# supports FEATURE_BINARY_LARGE_MESSAGES.
+DEFAULT_LARGE_MESSAGE_SIZE: Final = 1024
+# Every this many compressed messages one is compressed again to measure
+# the compression for the send statistics
+SEND_STATS_SAMPLE_INTERVAL: Final = 10
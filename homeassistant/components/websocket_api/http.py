@@ -4,9 +4,12 @@ from __future__ import annotations
 import asyncio
 from collections import deque
 from collections.abc import Callable
+from dataclasses import dataclass
 import datetime as dt
 import logging
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
 import async_timeout
@@ -21,9 +24,12 @@ from homeassistant.util.json import json_loads
 from .auth import AuthPhase, auth_required_message
 from .const import (
     DATA_CONNECTIONS,
+    DATA_LARGE_MESSAGE_SIZE,
+    DATA_SEND_STATS,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
+    SEND_STATS_SAMPLE_INTERVAL,
     SIGNAL_WEBSOCKET_CONNECTED,
     SIGNAL_WEBSOCKET_DISCONNECTED,
     URL,
@@ -37,6 +43,8 @@ if TYPE_CHECKING:
 
 
 _WS_LOGGER: Final = logging.getLogger(f"{__name__}.connection")
+# Stripped from the end of compressed frames
+_WS_DEFLATE_TRAILING: Final = b"\x00\x00\xff\xff"
 
 
 class WebsocketAPIView(HomeAssistantView):
@@ -51,6 +59,85 @@ class WebsocketAPIView(HomeAssistantView):
         return await WebSocketHandler(request.app["hass"], request).async_handle()
 
 
+@dataclass(slots=True)
+class WebSocketSendStats:
+    """Statistics of the messages sent to all websocket clients.
+
+    The bytes saved by compressing large messages can be compared with
+    the time spent compressing them to tune the large message size.
+    aiohttp does not report the size of a compressed frame, so every
+    SEND_STATS_SAMPLE_INTERVAL compressed message is compressed again
+    with the same settings to measure the ratio and time of compression.
+    """
+
+    messages: int = 0
+    large_messages: int = 0
+    binary_messages: int = 0
+    compressed_messages: int = 0
+    uncompressed_bytes: int = 0
+    sampled_messages: int = 0
+    sampled_bytes: int = 0
+    sampled_compressed_bytes: int = 0
+    sampled_compress_time: float = 0.0
+
+    def record_compressed(self, data: bytes, compress: int) -> None:
+        """Record a message sent compressed with the given window bits."""
+        self.compressed_messages += 1
+        self.uncompressed_bytes += len(data)
+        if self.compressed_messages % SEND_STATS_SAMPLE_INTERVAL != 1:
+            return
+        # Compress like aiohttp does for a single frame
+        start = perf_counter()
+        compressobj = zlib.compressobj(level=zlib.Z_BEST_SPEED, wbits=-compress)
+        compressed_size = (
+            len(compressobj.compress(data))
+            + len(compressobj.flush(zlib.Z_SYNC_FLUSH))
+            - len(_WS_DEFLATE_TRAILING)
+        )
+        self.sampled_compress_time += perf_counter() - start
+        self.sampled_messages += 1
+        self.sampled_bytes += len(data)
+        self.sampled_compressed_bytes += compressed_size
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict.
+
+        The compressed bytes and compress time are estimated from the
+        sampled messages.
+        """
+        result: dict[str, Any] = {
+            "messages": self.messages,
+            "large_messages": self.large_messages,
+            "binary_messages": self.binary_messages,
+            "compressed_messages": self.compressed_messages,
+            "sampled_messages": self.sampled_messages,
+            "uncompressed_bytes": self.uncompressed_bytes,
+            "compressed_bytes": None,
+            "saved_bytes": None,
+            "compression_ratio": None,
+            "compress_time_ms": None,
+            "saved_bytes_per_ms": None,
+        }
+        if not (sampled_bytes := self.sampled_bytes):
+            return result
+        ratio = self.sampled_compressed_bytes / sampled_bytes
+        compressed_bytes = round(self.uncompressed_bytes * ratio)
+        saved_bytes = self.uncompressed_bytes - compressed_bytes
+        compress_time_ms = (
+            self.sampled_compress_time / sampled_bytes * self.uncompressed_bytes * 1000
+        )
+        result |= {
+            "compressed_bytes": compressed_bytes,
+            "saved_bytes": saved_bytes,
+            "compression_ratio": round(ratio, 3),
+            "compress_time_ms": round(compress_time_ms, 3),
+            "saved_bytes_per_ms": round(saved_bytes / compress_time_ms)
+            if compress_time_ms
+            else None,
+        }
+        return result
+
+
 class WebSocketAdapter(logging.LoggerAdapter):
     """Add connection id to websocket messages."""
 
@@ -75,6 +162,10 @@ class WebSocketHandler:
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
         self._peak_checker_unsub: Callable[[], None] | None = None
         self._connection: ActiveConnection | None = None
+        self._large_message_size: int = hass.data[DATA_LARGE_MESSAGE_SIZE]
+        self._send_stats: WebSocketSendStats = hass.data[DATA_SEND_STATS]
+        # The window bits of the negotiated permessage-deflate extension
+        self._compress = 0
 
         # The WebSocketHandler has a single consumer and path
         # to where messages are queued. This allows the implementation
@@ -108,6 +199,8 @@ class WebSocketHandler:
         logger = self._logger
         wsock = self._wsock
         send_str = wsock.send_str
+        large_message_size = self._large_message_size
+        send_stats = self._send_stats
         loop = self._hass.loop
         debug = logger.debug
         is_enabled_for = logger.isEnabledFor
@@ -135,7 +228,11 @@ class WebSocketHandler:
                 ):
                     if debug_enabled:
                         debug("%s: Sending %s", self.description, message)
-                    await send_str(message)
+                    send_stats.messages += 1
+                    if len(message) < large_message_size:
+                        await send_str(message)
+                    else:
+                        await self._async_send_large_message(message)
                     continue
 
                 messages: list[str] = [message]
@@ -150,7 +247,11 @@ class WebSocketHandler:
                 coalesced_messages = f"[{joined_messages}]"
                 if debug_enabled:
                     debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_str(coalesced_messages)
+                send_stats.messages += 1
+                if len(coalesced_messages) < large_message_size:
+                    await send_str(coalesced_messages)
+                else:
+                    await self._async_send_large_message(coalesced_messages)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -161,6 +262,28 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    async def _async_send_large_message(self, message: str) -> None:
+        """Send a large message.
+
+        The message is compressed when the client negotiated compression and
+        sent as a binary frame when the client supports binary large messages.
+        """
+        send_stats = self._send_stats
+        send_stats.large_messages += 1
+        # aiohttp annotates compress as a bool but uses it as the window bits
+        compress: Any = self._compress
+        if (connection := self._connection) is None or not connection.can_send_binary:
+            await self._wsock.send_str(message, compress=compress)
+            if compress:
+                send_stats.record_compressed(message.encode("utf-8"), compress)
+            return
+
+        send_stats.binary_messages += 1
+        data = message.encode("utf-8")
+        await self._wsock.send_bytes(data, compress=compress)
+        if compress:
+            send_stats.record_compressed(data, compress)
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -265,6 +388,15 @@ class WebSocketHandler:
             return wsock
 
         debug("%s: Connected from %s", self.description, request.remote)
+        # Compression is negotiated with the client but only used for large
+        # messages since compressing small ones costs more time than it saves
+        if compress := wsock.compress:
+            # wsock.compress holds the window bits of the negotiated extension
+            self._compress = int(compress)
+            # aiohttp has no API to turn off the default compression of the writer
+            frame_writer = wsock._writer  # pylint: disable=protected-access
+            assert frame_writer is not None
+            frame_writer.compress = 0
         self._handle_task = asyncio.current_task()
 
         @callback
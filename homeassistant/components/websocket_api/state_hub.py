@@ -0,0 +1,187 @@
+"""Fan out state changed events to subscribe_entities subscriptions."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.auth import EVENT_USER_REMOVED, EVENT_USER_UPDATED
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions import AbstractPermissions
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
+
+from .const import DATA_STATE_DIFF_HUB
+from .messages import IDEN_JSON_TEMPLATE, _cached_state_diff_message
+
+if TYPE_CHECKING:
+    from .connection import ActiveConnection
+
+
+class _Subscription:
+    """A subscribe_entities subscription of a connection."""
+
+    __slots__ = ("connection", "msg_id")
+
+    def __init__(self, connection: ActiveConnection, msg_id: int) -> None:
+        """Initialize the subscription."""
+        self.connection = connection
+        self.msg_id = msg_id
+
+
+class _UserReadPermissions:
+    """Cache of the entities a user is allowed to read."""
+
+    __slots__ = ("permissions", "all_entities", "entities")
+
+    def __init__(self, permissions: AbstractPermissions) -> None:
+        """Initialize the cache."""
+        self.permissions = permissions
+        self.all_entities = permissions.access_all_entities(POLICY_READ)
+        self.entities: dict[str, bool] = {}
+
+    def can_read(self, entity_id: str) -> bool:
+        """Return if the user may read the entity."""
+        if self.all_entities:
+            return True
+        if (allowed := self.entities.get(entity_id)) is None:
+            allowed = self.entities[entity_id] = self.permissions.check_entity(
+                entity_id, POLICY_READ
+            )
+        return allowed
+
+
+class StateDiffHub:
+    """Send state changed events to all subscribe_entities subscriptions.
+
+    A single state changed listener serializes the state diff of an event
+    once and routes it to the subscriptions of that entity and to the
+    subscriptions of all entities. The read permissions of users are
+    cached and invalidated when users or the registries the permissions
+    depend on change.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self._all_entities: dict[_Subscription, None] = {}
+        self._by_entity_id: dict[str, dict[_Subscription, None]] = {}
+        self._permissions: dict[str, _UserReadPermissions] = {}
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_subscribe(
+        self, connection: ActiveConnection, msg_id: int, entity_ids: set[str]
+    ) -> CALLBACK_TYPE:
+        """Subscribe a connection to state changes of entities.
+
+        All entities are subscribed when entity_ids is empty.
+        """
+        subscription = _Subscription(connection, msg_id)
+        if not self._unsubs:
+            self._async_listen()
+        if entity_ids:
+            for entity_id in entity_ids:
+                self._by_entity_id.setdefault(entity_id, {})[subscription] = None
+        else:
+            self._all_entities[subscription] = None
+
+        @callback
+        def _async_unsubscribe() -> None:
+            """Unsubscribe the connection."""
+            if entity_ids:
+                for entity_id in entity_ids:
+                    subscriptions = self._by_entity_id[entity_id]
+                    del subscriptions[subscription]
+                    if not subscriptions:
+                        del self._by_entity_id[entity_id]
+            else:
+                del self._all_entities[subscription]
+            if not self._all_entities and not self._by_entity_id:
+                self._async_stop_listening()
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_listen(self) -> None:
+        """Start listening for state changes and permission changes."""
+        bus = self.hass.bus
+        self._unsubs = [
+            bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_forward_state_changed,
+                run_immediately=True,
+            ),
+            *(
+                bus.async_listen(
+                    event_type, self._async_user_changed, run_immediately=True
+                )
+                for event_type in (EVENT_USER_UPDATED, EVENT_USER_REMOVED)
+            ),
+            *(
+                bus.async_listen(
+                    event_type, self._async_registry_updated, run_immediately=True
+                )
+                for event_type in (
+                    EVENT_DEVICE_REGISTRY_UPDATED,
+                    EVENT_ENTITY_REGISTRY_UPDATED,
+                )
+            ),
+        ]
+
+    @callback
+    def _async_stop_listening(self) -> None:
+        """Stop listening when there are no subscriptions left."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+        self._permissions.clear()
+
+    @callback
+    def _async_user_changed(self, event: Event) -> None:
+        """Drop the cached permissions of a changed or removed user."""
+        self._permissions.pop(event.data["user_id"], None)
+
+    @callback
+    def _async_registry_updated(self, event: Event) -> None:
+        """Drop the cached entity permissions, they depend on the registries."""
+        self._permissions.clear()
+
+    @callback
+    def _async_can_read(self, user: User, entity_id: str) -> bool:
+        """Return if a user may read an entity."""
+        # The permissions of the user are replaced when its groups or
+        # owner status change, which invalidates the cache as well.
+        permissions = user.permissions
+        cache = self._permissions.get(user.id)
+        if cache is None or cache.permissions is not permissions:
+            cache = self._permissions[user.id] = _UserReadPermissions(permissions)
+        return cache.can_read(entity_id)
+
+    @callback
+    def _async_forward_state_changed(self, event: Event) -> None:
+        """Forward a state changed event to the subscriptions."""
+        entity_id: str = event.data["entity_id"]
+        subscriptions: list[_Subscription] = [*self._all_entities]
+        if by_entity_id := self._by_entity_id.get(entity_id):
+            subscriptions.extend(by_entity_id)
+        message: str | None = None
+        for subscription in subscriptions:
+            connection = subscription.connection
+            if not self._async_can_read(connection.user, entity_id):
+                continue
+            if message is None:
+                message = _cached_state_diff_message(event)
+            connection.send_message(
+                message.replace(IDEN_JSON_TEMPLATE, str(subscription.msg_id), 1)
+            )
+
+
+@callback
+def async_get_state_diff_hub(hass: HomeAssistant) -> StateDiffHub:
+    """Return the state diff hub."""
+    hub: StateDiffHub | None = hass.data.get(DATA_STATE_DIFF_HUB)
+    if hub is None:
+        hub = hass.data[DATA_STATE_DIFF_HUB] = StateDiffHub(hass)
+    return hub
@@ -386,8 +386,24 @@ class ConfigEntry:
 
         error_reason = None
 
+        if self.domain == integration.domain:
+            timeline_span = loader.async_startup_timeline_span(
+                hass,
+                "async_setup_entry",
+                "config_entry",
+                f"{self.domain}: {self.title}",
+            )
+        else:
+            timeline_span = loader.async_startup_timeline_span(
+                hass,
+                f"{integration.domain} async_setup_entry",
+                "platform",
+                f"{self.domain}: {self.title} {integration.domain}",
+            )
+
         try:
-            result = await component.async_setup_entry(hass, self)
+            with timeline_span:
+                result = await component.async_setup_entry(hass, self)
 
             if not isinstance(result, bool):
                 _LOGGER.error(  # type: ignore[unreachable]
@@ -6,13 +6,16 @@ of entities and react to changes.
 from __future__ import annotations
 
 import asyncio
+from collections import UserDict, defaultdict
 from collections.abc import (
     Awaitable,
     Callable,
     Collection,
     Coroutine,
     Iterable,
+    KeysView,
     Mapping,
+    ValuesView,
 )
 import concurrent.futures
 from contextlib import suppress
@@ -24,6 +27,7 @@ import logging
 import os
 import pathlib
 import re
+import sys
 import threading
 import time
 from time import monotonic
@@ -38,6 +42,7 @@ from typing import (
     overload,
 )
 from urllib.parse import urlparse
+import weakref
 
 import async_timeout
 from typing_extensions import Self
@@ -156,6 +161,9 @@ MAX_EXPECTED_ENTITY_IDS = 16384
 
 _LOGGER = logging.getLogger(__name__)
 
+# Types of attribute values which can be shared between states
+_INTERNABLE_TYPES = {str, int, float, bool, type(None)}
+
 _cv_hass: ContextVar[HomeAssistant] = ContextVar("hass")
 
 
@@ -980,6 +988,11 @@ class EventBus:
         self._listeners: dict[str, list[_FilterableJob]] = {}
         self._match_all_listeners: list[_FilterableJob] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # The MATCH_ALL and event_type listeners an event is dispatched to,
+        # built when an event_type is first fired after its listeners changed.
+        # The tuples are not changed by listeners that subscribe or unsubscribe
+        # while an event is being dispatched.
+        self._dispatch_listeners: dict[str, tuple[_FilterableJob, ...]] = {}
         self._hass = hass
 
     @callback
@@ -1025,15 +1038,10 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
-        match_all_listeners = self._match_all_listeners
-
-        if not listeners and not match_all_listeners:
-            return
-
-        # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
-        if event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        if (listeners := self._dispatch_listeners.get(event_type)) is None:
+            listeners = self._async_build_dispatch_listeners(event_type)
+            if not listeners:
+                return
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
@@ -1115,6 +1123,7 @@ class EventBus:
         self, event_type: str, filterable_job: _FilterableJob
     ) -> CALLBACK_TYPE:
         self._listeners.setdefault(event_type, []).append(filterable_job)
+        self._async_listeners_changed(event_type)
 
         def remove_listener() -> None:
             """Remove the listener."""
@@ -1122,6 +1131,34 @@ class EventBus:
 
         return remove_listener
 
+    @callback
+    def _async_build_dispatch_listeners(
+        self, event_type: str
+    ) -> tuple[_FilterableJob, ...]:
+        """Build the listeners an event_type is dispatched to.
+
+        The result is cached until the listeners of the event_type or
+        the MATCH_ALL listeners change. Event types without listeners
+        are not cached.
+        """
+        listeners = self._listeners.get(event_type, ())
+        # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
+        if event_type != EVENT_HOMEASSISTANT_CLOSE:
+            dispatch_listeners = (*self._match_all_listeners, *listeners)
+        else:
+            dispatch_listeners = tuple(listeners)
+        if dispatch_listeners:
+            self._dispatch_listeners[event_type] = dispatch_listeners
+        return dispatch_listeners
+
+    @callback
+    def _async_listeners_changed(self, event_type: str) -> None:
+        """Drop the dispatch listeners that include an event_type."""
+        if event_type == MATCH_ALL:
+            self._dispatch_listeners.clear()
+        else:
+            self._dispatch_listeners.pop(event_type, None)
+
     def listen_once(
         self,
         event_type: str,
@@ -1203,6 +1240,7 @@ class EventBus:
             # delete event_type list if empty
             if not self._listeners[event_type] and event_type != MATCH_ALL:
                 self._listeners.pop(event_type)
+            self._async_listeners_changed(event_type)
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
@@ -1222,6 +1260,8 @@ class State:
     context: Context in which it was created
     domain: Domain of this state.
     object_id: Object id of this state.
+
+    Attributes passed as a ReadOnlyDict are shared instead of copied.
     """
 
     __slots__ = (
@@ -1232,7 +1272,6 @@ class State:
         "last_updated",
         "context",
         "domain",
-        "object_id",
         "_as_dict",
         "_as_dict_json",
         "_as_compressed_state_json",
@@ -1265,15 +1304,25 @@ class State:
 
         self.entity_id = entity_id.lower()
         self.state = state
-        self.attributes = ReadOnlyDict(attributes or {})
+        self.attributes: ReadOnlyDict[str, Any] = (
+            attributes
+            if type(attributes) is ReadOnlyDict  # pylint: disable=unidiomatic-typecheck
+            else ReadOnlyDict(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
-        self.domain, self.object_id = split_entity_id(self.entity_id)
+        # Domains are shared by many states
+        self.domain = sys.intern(split_entity_id(self.entity_id)[0])
         self._as_dict: ReadOnlyDict[str, Collection[Any]] | None = None
         self._as_dict_json: str | None = None
         self._as_compressed_state_json: str | None = None
 
+    @property
+    def object_id(self) -> str:
+        """Object id of this state."""
+        return self.entity_id[len(self.domain) + 1 :]
+
     @property
     def name(self) -> str:
         """Name of this state."""
@@ -1411,15 +1460,64 @@ class State:
         )
 
 
+class States(UserDict[str, State]):
+    """Container for states, maps entity_id -> State.
+
+    Maintains an additional index:
+    - domain -> dict[str, State]
+    """
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+
+    def values(self) -> ValuesView[State]:
+        """Return the underlying values to avoid __iter__ overhead."""
+        return self.data.values()
+
+    def __setitem__(self, key: str, entry: State) -> None:
+        """Add an item."""
+        self.data[key] = entry
+        self._domain_index[entry.domain][entry.entity_id] = entry
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an item."""
+        entry = self[key]
+        del self._domain_index[entry.domain][entry.entity_id]
+        super().__delitem__(key)
+
+    def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
+        """Get all entity_ids for a domain."""
+        # Avoid polluting _domain_index with non-existing domains
+        if key not in self._domain_index:
+            return ()
+        return self._domain_index[key].keys()
+
+    def domain_states(self, key: str) -> ValuesView[State] | tuple[()]:
+        """Get all states for a domain."""
+        # Avoid polluting _domain_index with non-existing domains
+        if key not in self._domain_index:
+            return ()
+        return self._domain_index[key].values()
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
-        self._states: dict[str, State] = {}
+        self._states = States()
+        # _states_data is used to access the States backing dict directly to speed
+        # up read operations
+        self._states_data = self._states.data
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # Identical attributes of different states share one ReadOnlyDict
+        self._attributes: weakref.WeakValueDictionary[
+            int, ReadOnlyDict[str, Any]
+        ] = weakref.WeakValueDictionary()
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -1437,16 +1535,15 @@ class StateMachine:
         This method must be run in the event loop.
         """
         if domain_filter is None:
-            return list(self._states)
+            return list(self._states.data)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._states.domain_entity_ids(domain_filter.lower()))
 
-        return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain in domain_filter
-        ]
+        entity_ids: list[str] = []
+        for domain in domain_filter:
+            entity_ids.extend(self._states.domain_entity_ids(domain))
+        return entity_ids
 
     @callback
     def async_entity_ids_count(
@@ -1460,10 +1557,10 @@ class StateMachine:
             return len(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return len(self._states.domain_entity_ids(domain_filter.lower()))
 
-        return len(
-            [None for state in self._states.values() if state.domain in domain_filter]
+        return sum(
+            len(self._states.domain_entity_ids(domain)) for domain in domain_filter
         )
 
     def all(self, domain_filter: str | Iterable[str] | None = None) -> list[State]:
@@ -1484,18 +1581,19 @@ class StateMachine:
             return list(self._states.values())
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._states.domain_states(domain_filter.lower()))
 
-        return [
-            state for state in self._states.values() if state.domain in domain_filter
-        ]
+        states: list[State] = []
+        for domain in domain_filter:
+            states.extend(self._states.domain_states(domain))
+        return states
 
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
         Async friendly.
         """
-        return self._states.get(entity_id.lower())
+        return self._states_data.get(entity_id.lower())
 
     def is_state(self, entity_id: str, state: str) -> bool:
         """Test if entity exists and is in specified state.
@@ -1575,7 +1673,7 @@ class StateMachine:
         entity_id are added.
         """
         entity_id = entity_id.lower()
-        if entity_id in self._states or entity_id in self._reservations:
+        if entity_id in self._states_data or entity_id in self._reservations:
             raise HomeAssistantError(
                 "async_reserve must not be called once the state is in the state"
                 " machine."
@@ -1587,7 +1685,9 @@ class StateMachine:
     def async_available(self, entity_id: str) -> bool:
         """Check to see if an entity_id is available to be used."""
         entity_id = entity_id.lower()
-        return entity_id not in self._states and entity_id not in self._reservations
+        return (
+            entity_id not in self._states_data and entity_id not in self._reservations
+        )
 
     @callback
     def async_set(
@@ -1605,12 +1705,57 @@ class StateMachine:
         If you just update the attributes and not the state, last changed will
         not be affected.
 
+        This method must be run in the event loop.
+        """
+        self._async_set_state(
+            entity_id, new_state, attributes, force_update, context, None
+        )
+
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+    ) -> None:
+        """Set the state of multiple entities in one pass.
+
+        States is an iterable of (entity_id, new_state, attributes) tuples.
+
+        All states written in the batch share the same context and timestamp.
+        A state_changed event is still fired for each changed entity.
+
+        This method must be run in the event loop.
+        """
+        timestamp = time.time()
+        now = dt_util.utc_from_timestamp(timestamp)
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+        for entity_id, new_state, attributes in states:
+            self._async_set_state(
+                entity_id, new_state, attributes, force_update, context, now
+            )
+
+    @callback
+    def _async_set_state(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any] | None,
+        force_update: bool,
+        context: Context | None,
+        now: datetime.datetime | None,
+    ) -> None:
+        """Set the state of an entity, add entity if it does not exist.
+
+        If now is passed, context must be passed as well.
+
         This method must be run in the event loop.
         """
         entity_id = entity_id.lower()
         new_state = str(new_state)
         attributes = attributes or {}
-        if (old_state := self._states.get(entity_id)) is None:
+        if (old_state := self._states_data.get(entity_id)) is None:
             same_state = False
             same_attr = False
             last_changed = None
@@ -1622,23 +1767,30 @@ class StateMachine:
         if same_state and same_attr:
             return
 
-        if context is None:
-            # It is much faster to convert a timestamp to a utc datetime object
-            # than converting a utc datetime object to a timestamp since cpython
-            # does not have a fast path for handling the UTC timezone and has to do
-            # multiple local timezone conversions.
-            #
-            # from_timestamp implementation:
-            # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
-            #
-            # timestamp implementation:
-            # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
-            # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
-            timestamp = time.time()
-            now = dt_util.utc_from_timestamp(timestamp)
-            context = Context(id=ulid_at_time(timestamp))
+        if same_attr:
+            assert old_state is not None
+            attributes = old_state.attributes
         else:
-            now = dt_util.utcnow()
+            attributes = self._async_intern_attributes(attributes)
+
+        if now is None:
+            if context is None:
+                # It is much faster to convert a timestamp to a utc datetime object
+                # than converting a utc datetime object to a timestamp since cpython
+                # does not have a fast path for handling the UTC timezone and has to do
+                # multiple local timezone conversions.
+                #
+                # from_timestamp implementation:
+                # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
+                #
+                # timestamp implementation:
+                # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
+                # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
+                timestamp = time.time()
+                now = dt_util.utc_from_timestamp(timestamp)
+                context = Context(id=ulid_at_time(timestamp))
+            else:
+                now = dt_util.utcnow()
 
         state = State(
             entity_id,
@@ -1660,6 +1812,32 @@ class StateMachine:
             time_fired=now,
         )
 
+    @callback
+    def _async_intern_attributes(
+        self, attributes: Mapping[str, Any]
+    ) -> ReadOnlyDict[str, Any]:
+        """Return a shared ReadOnlyDict of the attributes if possible.
+
+        Only attributes with values of immutable types are shared. The
+        pool is keyed by the hash of the attributes to keep its entries
+        small, a shared dict is only returned if it has the same keys in
+        the same order with values of the same types.
+        """
+        if not all(type(value) in _INTERNABLE_TYPES for value in attributes.values()):
+            return ReadOnlyDict(attributes)
+        key = hash(tuple(attributes.items()))
+        if (shared := self._attributes.get(key)) is not None:
+            if shared == attributes and all(
+                name == shared_name and type(value) is type(shared_value)
+                for (name, value), (shared_name, shared_value) in zip(
+                    attributes.items(), shared.items()
+                )
+            ):
+                return shared
+            return ReadOnlyDict(attributes)
+        shared = self._attributes[key] = ReadOnlyDict(attributes)
+        return shared
+
 
 class SupportsResponse(StrEnum):
     """Service call response configuration."""
@@ -680,6 +680,12 @@ class Entity(ABC):
     @callback
     def async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
+        self._async_verify_state_writable()
+        self._async_write_ha_state()
+
+    @callback
+    def _async_verify_state_writable(self) -> None:
+        """Verify the entity is in a writable state."""
         if self.hass is None:
             raise RuntimeError(f"Attribute hass is None for {self}")
 
@@ -704,8 +710,6 @@ class Entity(ABC):
                 f"No entity id specified for entity {self.name}"
             )
 
-        self._async_write_ha_state()
-
     def _stringify_state(self, available: bool) -> str:
         """Convert state to string."""
         if not available:
@@ -744,9 +748,21 @@ class Entity(ABC):
     @callback
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
+        if (calculated_state := self._async_calculate_state()) is None:
+            return
+        self.hass.states.async_set(
+            self.entity_id, *calculated_state, self.force_update, self._context
+        )
+
+    @callback
+    def _async_calculate_state(self) -> tuple[str, dict[str, Any]] | None:
+        """Calculate the state and attributes to write to the state machine.
+
+        Returns None if the state should not be written.
+        """
         if self._platform_state == EntityPlatformState.REMOVED:
             # Polling returned after the entity has already been removed
-            return
+            return None
 
         hass = self.hass
         entity_id = self.entity_id
@@ -763,7 +779,7 @@ class Entity(ABC):
                     entity_id,
                     self.platform.platform_name,
                 )
-            return
+            return None
 
         start = timer()
 
@@ -828,7 +844,7 @@ class Entity(ABC):
             self._context = None
             self._context_set = None
 
-        hass.states.async_set(entity_id, state, attr, self.force_update, self._context)
+        return state, attr
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
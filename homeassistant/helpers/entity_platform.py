@@ -19,6 +19,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import (
     CALLBACK_TYPE,
+    Context,
     CoreState,
     HomeAssistant,
     ServiceCall,
@@ -804,6 +805,48 @@ class EntityPlatform:
             self._async_unsub_polling()
             self._async_unsub_polling = None
 
+    @callback
+    def async_write_ha_states(self, entities: Iterable[Entity]) -> None:
+        """Write the state of multiple entities to the state machine.
+
+        Entities sharing the same context and force_update setting are written
+        in a single batch, which shares the context and timestamp of the
+        state changes.
+
+        All entities are verified to be writable before any state is
+        calculated. An entity whose state fails to calculate is logged and
+        skipped, the other entities are still written.
+
+        This method must be run in the event loop.
+        """
+        entities = list(entities)
+        batches: dict[
+            tuple[bool, int],
+            tuple[Context | None, list[tuple[str, str, dict[str, Any]]]],
+        ] = {}
+        # pylint: disable=protected-access
+        for entity in entities:
+            entity._async_verify_state_writable()
+        for entity in entities:
+            try:
+                calculated_state = entity._async_calculate_state()
+            except Exception:  # pylint: disable=broad-except
+                self.logger.exception(
+                    "Error calculating the state of %s", entity.entity_id
+                )
+                continue
+            if calculated_state is None:
+                continue
+            # The context may be reset when the state is calculated
+            context = entity._context
+            key = (entity.force_update, id(context))
+            if (batch := batches.get(key)) is None:
+                batch = batches[key] = (context, [])
+            batch[1].append((entity.entity_id, *calculated_state))
+
+        for (force_update, _), (context, states) in batches.items():
+            self.hass.states.async_set_many(states, force_update, context)
+
     async def async_extract_from_service(
         self, service_call: ServiceCall, expand_group: bool = True
     ) -> list[Entity]:
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Iterable, Sequence
+from collections.abc import Callable, Coroutine, Hashable, Iterable, Sequence
 import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -26,6 +26,7 @@ from homeassistant.core import (
     CALLBACK_TYPE,
     Event,
     HassJob,
+    HassJobType,
     HomeAssistant,
     State,
     callback,
@@ -45,6 +46,8 @@ from .typing import TemplateVarsType
 
 TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
 TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
+TRACK_STATE_CHANGE_INDEX = "track_state_change_index"
+TRACK_STATE_CHANGE_STATS = "track_state_change_stats"
 
 TRACK_STATE_ADDED_DOMAIN_CALLBACKS = "track_state_added_domain_callbacks"
 TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
@@ -58,6 +61,8 @@ TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener
 TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS = "track_device_registry_updated_callbacks"
 TRACK_DEVICE_REGISTRY_UPDATED_LISTENER = "track_device_registry_updated_listener"
 
+SHARED_TEMPLATE_RENDERS = "shared_template_renders"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -260,24 +265,145 @@ def async_track_state_change_event(
     return _async_track_state_change_event(hass, entity_ids, action)
 
 
+@dataclass(slots=True)
+class EntityDispatchStats:
+    """Time spent dispatching the state changes of an entity."""
+
+    dispatches: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    def record(self, dispatch_time: float) -> None:
+        """Record a dispatch."""
+        self.dispatches += 1
+        self.total_time += dispatch_time
+        if dispatch_time > self.max_time:
+            self.max_time = dispatch_time
+
+
+@dataclass(slots=True)
+class _EntityListeners:
+    """The state change listeners of an entity split by job type."""
+
+    callbacks: tuple[HassJob[[Event], Any], ...]
+    jobs: tuple[HassJob[[Event], Any], ...]
+    stats: EntityDispatchStats | None
+
+    @classmethod
+    def from_jobs(
+        cls,
+        jobs: Iterable[HassJob[[Event], Any]],
+        stats: EntityDispatchStats | None = None,
+    ) -> _EntityListeners:
+        """Split the jobs into callbacks and other jobs."""
+        callbacks: list[HassJob[[Event], Any]] = []
+        other_jobs: list[HassJob[[Event], Any]] = []
+        for job in jobs:
+            if job.job_type == HassJobType.Callback:
+                callbacks.append(job)
+            else:
+                other_jobs.append(job)
+        return cls(tuple(callbacks), tuple(other_jobs), stats)
+
+
+@callback
+def async_enable_state_change_dispatch_stats(hass: HomeAssistant) -> CALLBACK_TYPE:
+    """Record the dispatch times of tracked entities until disabled.
+
+    The dispatch of state changes is not timed by default to keep it
+    cheap. Call the returned callback to stop recording and drop the stats.
+    """
+    hass.data[TRACK_STATE_CHANGE_STATS] = {}
+    # Cached listeners are created again with their stats
+    if index := hass.data.get(TRACK_STATE_CHANGE_INDEX):
+        index.clear()
+
+    @callback
+    def _async_disable_stats() -> None:
+        """Stop recording the dispatch times."""
+        hass.data.pop(TRACK_STATE_CHANGE_STATS, None)
+        if index := hass.data.get(TRACK_STATE_CHANGE_INDEX):
+            index.clear()
+
+    return _async_disable_stats
+
+
+@callback
+def async_get_state_change_dispatch_diagnostics(
+    hass: HomeAssistant,
+) -> dict[str, dict[str, Any]]:
+    """Return the listeners and dispatch times of each tracked entity.
+
+    Dispatch times are only recorded while enabled with
+    async_enable_state_change_dispatch_stats.
+    """
+    callbacks: dict[str, list[HassJob[[Event], Any]]] = hass.data.get(
+        TRACK_STATE_CHANGE_CALLBACKS, {}
+    )
+    all_stats: dict[str, EntityDispatchStats] = hass.data.get(
+        TRACK_STATE_CHANGE_STATS, {}
+    )
+    diagnostics: dict[str, dict[str, Any]] = {}
+    for entity_id, jobs in callbacks.items():
+        stats = all_stats.get(entity_id) or EntityDispatchStats()
+        listeners = _EntityListeners.from_jobs(jobs)
+        diagnostics[entity_id] = {
+            "listeners": len(jobs),
+            "callbacks": len(listeners.callbacks),
+            "dispatches": stats.dispatches,
+            "dispatch_time": {
+                "average": round(stats.total_time / (stats.dispatches or 1) * 1000, 3),
+                "max": round(stats.max_time * 1000, 3),
+                "total": round(stats.total_time * 1000, 3),
+            },
+        }
+    return diagnostics
+
+
 @callback
 def _async_dispatch_entity_id_event(
     hass: HomeAssistant,
     callbacks: dict[str, list[HassJob[[Event], Any]]],
     event: Event,
 ) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["entity_id"])):
+    """Dispatch to listeners.
+
+    The listeners of an entity are split by job type when they are first
+    dispatched to and cached until they change. All callbacks run inline
+    in one pass, the other jobs are scheduled after them.
+    """
+    entity_id = event.data["entity_id"]
+    if not (callbacks_list := callbacks.get(entity_id)):
         return
-    for job in callbacks_list[:]:
+    index: dict[str, _EntityListeners] = hass.data[TRACK_STATE_CHANGE_INDEX]
+    if (listeners := index.get(entity_id)) is None:
+        all_stats: dict[str, EntityDispatchStats] | None = hass.data.get(
+            TRACK_STATE_CHANGE_STATS
+        )
+        listeners = index[entity_id] = _EntityListeners.from_jobs(
+            callbacks_list,
+            None
+            if all_stats is None
+            else all_stats.setdefault(entity_id, EntityDispatchStats()),
+        )
+    if (stats := listeners.stats) is not None:
+        start = time.perf_counter()
+    for job in listeners.callbacks:
         try:
-            hass.async_run_hass_job(job, event)
+            job.target(event)
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["entity_id"],
-                job,
+                "Error while dispatching event for %s to %s", entity_id, job
             )
+    for job in listeners.jobs:
+        try:
+            hass.async_add_hass_job(job, event)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception(
+                "Error while dispatching event for %s to %s", entity_id, job
+            )
+    if stats is not None:
+        stats.record(time.perf_counter() - start)
 
 
 @callback
@@ -295,7 +421,13 @@ def _async_track_state_change_event(
     action: Callable[[Event], Any],
 ) -> CALLBACK_TYPE:
     """async_track_state_change_event without lowercasing."""
-    return _async_track_event(
+    if isinstance(entity_ids, str):
+        entity_ids = [entity_ids]
+    hass_data = hass.data
+    index: dict[str, _EntityListeners] = hass_data.setdefault(
+        TRACK_STATE_CHANGE_INDEX, {}
+    )
+    remove = _async_track_event(
         hass,
         entity_ids,
         TRACK_STATE_CHANGE_CALLBACKS,
@@ -305,6 +437,22 @@ def _async_track_state_change_event(
         _async_state_change_filter,
         action,
     )
+    for entity_id in entity_ids:
+        index.pop(entity_id, None)
+
+    @callback
+    def _remove_state_change_listener() -> None:
+        """Remove the listener and drop the cached listeners."""
+        remove()
+        callbacks = hass_data[TRACK_STATE_CHANGE_CALLBACKS]
+        for entity_id in entity_ids:
+            index.pop(entity_id, None)
+        if (all_stats := hass_data.get(TRACK_STATE_CHANGE_STATS)) is not None:
+            for entity_id in entity_ids:
+                if entity_id not in callbacks:
+                    all_stats.pop(entity_id, None)
+
+    return _remove_state_change_listener
 
 
 @callback
@@ -835,6 +983,92 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+class SharedTemplateRenders:
+    """Share the renders of identical templates triggered by the same event.
+
+    Template entities and automations often track the same template
+    with the same variables, the template is only rendered once per
+    state_changed event and the RenderInfo is shared by all trackers.
+    The renders are only shared until the event loop runs the next
+    scheduled callbacks.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the shared renders."""
+        self._loop = hass.loop
+        self._event: Event | None = None
+        self._render_infos: dict[
+            tuple[str, bool | None, bool | None, Hashable], RenderInfo
+        ] = {}
+        self.renders = 0
+        self.saved_renders = 0
+
+    @callback
+    def async_render_to_info(
+        self, event: Event | None, track_template_: TrackTemplate
+    ) -> RenderInfo:
+        """Render a template or return the render of an identical template."""
+        template = track_template_.template
+        if (
+            event is None
+            or (variables_key := _template_variables_key(track_template_.variables))
+            is None
+        ):
+            self.renders += 1
+            return template.async_render_to_info(track_template_.variables)
+
+        if event is not self._event:
+            if self._event is None:
+                self._loop.call_soon(self._async_clear)
+            self._event = event
+            self._render_infos.clear()
+
+        # Limited and strict templates render in their own environment
+        key = (
+            template.template,
+            template._limited,  # pylint: disable=protected-access
+            template._strict,  # pylint: disable=protected-access
+            variables_key,
+        )
+        if (info := self._render_infos.get(key)) is not None:
+            self.saved_renders += 1
+            return info
+
+        self.renders += 1
+        info = self._render_infos[key] = template.async_render_to_info(
+            track_template_.variables
+        )
+        return info
+
+    @callback
+    def _async_clear(self) -> None:
+        """Forget the renders of the last event."""
+        self._event = None
+        self._render_infos.clear()
+
+
+def _template_variables_key(variables: TemplateVarsType) -> Hashable | None:
+    """Return a key for the variables or None if they are not hashable.
+
+    The type of each value is part of the key, 1, 1.0 and True are equal
+    but render differently.
+    """
+    if not variables:
+        return ()
+    try:
+        return frozenset((key, type(value), value) for key, value in variables.items())
+    except TypeError:
+        return None
+
+
+@callback
+def _async_get_shared_template_renders(hass: HomeAssistant) -> SharedTemplateRenders:
+    """Return the shared template renders."""
+    if (shared := hass.data.get(SHARED_TEMPLATE_RENDERS)) is None:
+        shared = hass.data[SHARED_TEMPLATE_RENDERS] = SharedTemplateRenders(hass)
+    return cast(SharedTemplateRenders, shared)
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -857,6 +1091,7 @@ class TrackTemplateResultInfo:
         self._last_result: dict[Template, bool | str | TemplateError] = {}
 
         self._rate_limit = KeyedRateLimit(hass)
+        self._shared_renders = _async_get_shared_template_renders(hass)
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
@@ -980,6 +1215,7 @@ class TrackTemplateResultInfo:
         track_template_: TrackTemplate,
         now: datetime,
         event: Event | None,
+        replayed: bool | None = False,
     ) -> bool | TrackTemplateResult:
         """Re-render the template if conditions match.
 
@@ -1019,8 +1255,10 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
+        # States may have changed since a rate limited event fired
+        # so the render can't be shared with other trackers
+        self._info[template] = info = self._shared_renders.async_render_to_info(
+            None if replayed else event, track_template_
         )
 
         try:
@@ -1091,7 +1329,9 @@ class TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = self._render_template_if_ready(
+                super_template, now, event, replayed
+            )
             info_changed |= _apply_update(update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1122,7 +1362,9 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = self._render_template_if_ready(
+                    track_template_, now, event, replayed
+                )
                 info_changed |= _apply_update(update, track_template_.template)
 
         if info_changed:
@@ -1,6 +1,6 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
 from collections import deque
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 import datetime
 from functools import partial
 import json
@@ -10,7 +10,12 @@ from typing import TYPE_CHECKING, Any, Final
 
 import orjson
 
-from homeassistant.util.file import write_utf8_file, write_utf8_file_atomic
+from homeassistant.util.file import (
+    write_utf8_chunks,
+    write_utf8_chunks_atomic,
+    write_utf8_file,
+    write_utf8_file_atomic,
+)
 from homeassistant.util.json import (  # pylint: disable=unused-import # noqa: F401
     JSON_DECODE_EXCEPTIONS,
     JSON_ENCODE_EXCEPTIONS,
@@ -185,6 +190,80 @@ def save_json(
         write_utf8_file(filename, json_data, private)
 
 
+# Containers nested less deep are written piece by piece by save_json_chunked
+_CHUNKED_CONTAINER_DEPTH = 3
+
+
+def _orjson_key(key: Any) -> bytes:
+    """Serialize a dict key the same way as orjson.OPT_NON_STR_KEYS."""
+    if isinstance(key, str):
+        return orjson.dumps(key)
+    # Strip the braces and ":null" of the single key dict
+    return orjson.dumps({key: None}, option=orjson.OPT_NON_STR_KEYS)[1:-6]
+
+
+def _orjson_indented_chunks(data: Any, depth: int = 0) -> Iterator[bytes]:
+    """Yield the same JSON as _orjson_default_encoder in chunks.
+
+    The outer containers are written piece by piece and anything nested
+    deeper than _CHUNKED_CONTAINER_DEPTH is serialized in one chunk, so
+    the whole document is never held in memory.
+    """
+    if depth < _CHUNKED_CONTAINER_DEPTH and data and isinstance(data, (dict, list)):
+        indent = b"\n" + b"  " * (depth + 1)
+        if isinstance(data, dict):
+            yield b"{"
+            for index, (key, value) in enumerate(data.items()):
+                yield indent if index == 0 else b"," + indent
+                yield _orjson_key(key)
+                yield b": "
+                yield from _orjson_indented_chunks(value, depth + 1)
+            yield b"\n" + b"  " * depth + b"}"
+            return
+        yield b"["
+        for index, value in enumerate(data):
+            yield indent if index == 0 else b"," + indent
+            yield from _orjson_indented_chunks(value, depth + 1)
+        yield b"\n" + b"  " * depth + b"]"
+        return
+
+    chunk = orjson.dumps(
+        data,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        default=json_encoder_default,
+    )
+    if depth:
+        chunk = chunk.replace(b"\n", b"\n" + b"  " * depth)
+    yield chunk
+
+
+def save_json_chunked(
+    filename: str,
+    data: list | dict,
+    private: bool = False,
+    *,
+    atomic_writes: bool = False,
+) -> None:
+    """Save JSON data to a file while serializing it in chunks.
+
+    Writes the same file as save_json with the default encoder without
+    holding the serialized document in memory.
+    """
+    chunks = _orjson_indented_chunks(data)
+    try:
+        if atomic_writes:
+            write_utf8_chunks_atomic(filename, chunks, private)
+        else:
+            write_utf8_chunks(filename, chunks, private)
+    except TypeError as error:
+        formatted_data = format_unserializable_data(
+            find_paths_unserializable_data(data, dump=_orjson_default_encoder)
+        )
+        msg = f"Failed to serialize to JSON: {filename}. Bad data at {formatted_data}"
+        _LOGGER.error(msg)
+        raise SerializationError(msg) from error
+
+
 def find_paths_unserializable_data(
     bad_data: Any, *, dump: Callable[[Any], str] = json.dumps
 ) -> dict[str, Any]:
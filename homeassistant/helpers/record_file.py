@@ -0,0 +1,223 @@
+"""Binary storage files made of length-prefixed JSON records.
+
+A record file starts with a magic number and a header record holding
+everything of the stored document except its data. When the data is
+a list each item is written as a record of its own, otherwise the
+data is a single record. Every record is prefixed with the length of
+its key and of its orjson encoded value, so the file can be indexed
+without decoding the records, which are only decoded when accessed.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+import logging
+from os import PathLike
+import struct
+from typing import Any, overload
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.file import write_utf8_chunks, write_utf8_chunks_atomic
+from homeassistant.util.json import (
+    SerializationError,
+    format_unserializable_data,
+    json_loads,
+    json_loads_object,
+)
+
+from .json import _orjson_default_encoder, find_paths_unserializable_data, json_bytes
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"HARECORD"
+FORMAT_VERSION = 1
+
+_FORMAT = struct.Struct(">B")
+# Length of the key and length of the value
+_RECORD = struct.Struct(">HI")
+
+RECORDS_LIST = "list"
+RECORDS_VALUE = "value"
+
+
+class RecordFileError(HomeAssistantError):
+    """Error reading a record file."""
+
+
+class LazyRecords(Sequence[Any]):
+    """The records of a record file which are decoded when accessed."""
+
+    __slots__ = ("_buffer", "_spans", "_keys", "_decoded")
+
+    def __init__(
+        self, buffer: bytes, keys: list[str], spans: list[tuple[int, int]]
+    ) -> None:
+        """Initialize the records."""
+        self._buffer = memoryview(buffer)
+        self._keys = keys
+        self._spans = spans
+        self._decoded: dict[int, Any] = {}
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return len(self._spans)
+
+    @overload
+    def __getitem__(self, index: int) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Any]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """Return a record, decoding it on first access."""
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self._spans)
+        if index in self._decoded:
+            return self._decoded[index]
+        start, end = self._spans[index]
+        value = self._decoded[index] = json_loads(self._buffer[start:end])
+        return value
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate the records, decoding all of them."""
+        for index in range(len(self._spans)):
+            yield self[index]
+
+    def keys(self) -> list[str]:
+        """Return the keys of the records in order."""
+        return self._keys
+
+
+def _record_chunks(
+    header: dict[str, Any],
+    records: Iterable[tuple[str, Any]],
+) -> Iterator[bytes]:
+    """Produce the chunks of a record file."""
+    yield MAGIC + _FORMAT.pack(FORMAT_VERSION)
+    for key, value in ((RECORDS_VALUE, header), *records):
+        key_bytes = key.encode("utf-8")
+        value_bytes = json_bytes(value)
+        yield _RECORD.pack(len(key_bytes), len(value_bytes)) + key_bytes + value_bytes
+
+
+def save_records(
+    filename: str,
+    data: dict[str, Any],
+    private: bool = False,
+    *,
+    atomic_writes: bool = False,
+    record_key: Callable[[Any], str] | None = None,
+) -> None:
+    """Save a stored document as a record file.
+
+    If data["data"] is a list its items are written as separate records
+    keyed by record_key, so they can be decoded one by one.
+    """
+    value = data["data"]
+    header = {key: val for key, val in data.items() if key != "data"}
+    records: Iterable[tuple[str, Any]]
+    if isinstance(value, list):
+        header["records"] = RECORDS_LIST
+        records = ((record_key(item) if record_key else "", item) for item in value)
+    else:
+        header["records"] = RECORDS_VALUE
+        records = ((RECORDS_VALUE, value),)
+
+    chunks = _record_chunks(header, records)
+    try:
+        if atomic_writes:
+            write_utf8_chunks_atomic(filename, chunks, private)
+        else:
+            write_utf8_chunks(filename, chunks, private)
+    except TypeError as error:
+        formatted_data = format_unserializable_data(
+            find_paths_unserializable_data(data, dump=_orjson_default_encoder)
+        )
+        msg = f"Failed to serialize to JSON: {filename}. Bad data at {formatted_data}"
+        _LOGGER.error(msg)
+        raise SerializationError(msg) from error
+
+
+def parse_records(buffer: bytes) -> dict[str, Any]:
+    """Parse the records of a record file.
+
+    Returns the stored document with data as LazyRecords if it was
+    written from a list.
+    """
+    if not buffer.startswith(MAGIC):
+        raise RecordFileError("Not a record file")
+    offset = len(MAGIC)
+    (format_version,) = _FORMAT.unpack_from(buffer, offset)
+    if format_version != FORMAT_VERSION:
+        raise RecordFileError(f"Unsupported record file version {format_version}")
+    offset += _FORMAT.size
+
+    keys: list[str] = []
+    spans: list[tuple[int, int]] = []
+    size = len(buffer)
+    while offset < size:
+        if offset + _RECORD.size > size:
+            raise RecordFileError("Truncated record file")
+        key_length, value_length = _RECORD.unpack_from(buffer, offset)
+        offset += _RECORD.size
+        start = offset + key_length
+        end = start + value_length
+        if end > size:
+            raise RecordFileError("Truncated record file")
+        keys.append(buffer[offset:start].decode("utf-8"))
+        spans.append((start, end))
+        offset = end
+
+    if not spans:
+        raise RecordFileError("Record file without header")
+    records = LazyRecords(buffer, keys[1:], spans[1:])
+    try:
+        data: dict[str, Any] = json_loads_object(memoryview(buffer)[slice(*spans[0])])
+        if data.pop("records") == RECORDS_LIST:
+            data["data"] = records
+        else:
+            data["data"] = records[0]
+    except (ValueError, KeyError, IndexError, TypeError) as error:
+        raise RecordFileError(error) from error
+    return data
+
+
+def _parse_file(filename: str | PathLike, buffer: bytes) -> dict[str, Any]:
+    """Parse the records of a record file read from filename."""
+    try:
+        return parse_records(buffer)
+    except RecordFileError:
+        _LOGGER.exception("Could not parse record file: %s", filename)
+        raise
+    except (struct.error, UnicodeDecodeError) as error:
+        _LOGGER.exception("Could not parse record file: %s", filename)
+        raise RecordFileError(error) from error
+
+
+def load_file(filename: str | PathLike) -> Any:
+    """Load a record file or a JSON file.
+
+    The file is read once and parsed as a record file if it starts
+    with the magic number. Like load_json, returns an empty dict if
+    the file is not found.
+    """
+    try:
+        with open(filename, "rb") as fdesc:
+            buffer = fdesc.read()
+    except FileNotFoundError:
+        # This is not a fatal error
+        _LOGGER.debug("Storage file not found: %s", filename)
+        return {}
+    except OSError as error:
+        _LOGGER.exception("Storage file reading failed: %s", filename)
+        raise HomeAssistantError(error) from error
+    if buffer.startswith(MAGIC):
+        return _parse_file(filename, buffer)
+    try:
+        return json_loads(buffer)
+    except ValueError as error:
+        _LOGGER.exception("Could not parse JSON content: %s", filename)
+        raise HomeAssistantError(error) from error
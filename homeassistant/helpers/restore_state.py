@@ -8,8 +8,19 @@ from typing import Any, cast
 
 from typing_extensions import Self
 
-from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
+from homeassistant.const import (
+    ATTR_RESTORED,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    State,
+    callback,
+    valid_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 
@@ -26,10 +37,16 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
 STORAGE_VERSION = 1
+JOURNAL_STORAGE_KEY = "core.restore_state.journal"
+JOURNAL_STORAGE_VERSION = 1
 
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long between rewriting all states, in between only the states
+# which changed are written to the journal
+JOURNAL_COMPACT_INTERVAL = timedelta(hours=6)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -135,10 +152,28 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass,
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            encoder=JSONEncoder,
+            chunked_writes=True,
+        )
+        self.journal_store = Store[list[dict[str, Any]]](
+            hass,
+            JOURNAL_STORAGE_VERSION,
+            JOURNAL_STORAGE_KEY,
+            encoder=JSONEncoder,
+            chunked_writes=True,
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # Stored states written to the journal since the last full dump
+        self._journal: dict[str, dict[str, Any]] = {}
+        # Entities which changed since the last dump
+        self._changed_entity_ids: set[str] = set()
+        # The last written extra data of the entities and its dict
+        self._extra_data: dict[str, tuple[ExtraStoredData, dict[str, Any]]] = {}
+        self._last_compacted = dt_util.utcnow()
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -151,23 +186,45 @@ class RestoreStateData:
         start.async_at_start(self.hass, hass_start)
 
     async def async_load(self) -> None:
-        """Load the instance of this data helper."""
+        """Load the instance of this data helper.
+
+        The states of the last full dump are loaded first, then the
+        states written to the journal since are replayed on top.
+        """
         try:
             stored_states = await self.store.async_load()
         except HomeAssistantError as exc:
             _LOGGER.error("Error loading last states", exc_info=exc)
             stored_states = None
 
-        if stored_states is None:
+        try:
+            journal = await self.journal_store.async_load()
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error loading last states journal", exc_info=exc)
+            journal = None
+
+        if stored_states is None and not journal:
             _LOGGER.debug("Not creating cache - no saved states found")
             self.last_states = {}
-        else:
-            self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
-                for item in stored_states
-                if valid_entity_id(item["state"]["entity_id"])
-            }
-            _LOGGER.debug("Created cache with %s", list(self.last_states))
+            return
+
+        self.last_states = {
+            item["state"]["entity_id"]: StoredState.from_dict(item)
+            for item in stored_states or ()
+            if valid_entity_id(item["state"]["entity_id"])
+        }
+        for item in journal or ():
+            entity_id = item["state"]["entity_id"]
+            if not valid_entity_id(entity_id):
+                continue
+            stored_state = StoredState.from_dict(item)
+            # The journal may be older than the full dump if Home Assistant
+            # stopped before the journal was removed after a full dump
+            if (
+                last_state := self.last_states.get(entity_id)
+            ) is None or stored_state.last_seen >= last_state.last_seen:
+                self.last_states[entity_id] = stored_state
+        _LOGGER.debug("Created cache with %s", list(self.last_states))
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -216,39 +273,145 @@ class RestoreStateData:
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        stored_states = self.async_get_stored_states()
+        changed_entity_ids = self._changed_entity_ids
+        self._changed_entity_ids = set()
+        data: list[dict[str, Any]] = []
+        extra_data: dict[str, tuple[ExtraStoredData, dict[str, Any]]] = {}
+        for stored_state in stored_states:
+            data.append(stored_state_dict := stored_state.as_dict())
+            if stored_state.extra_data:
+                extra_data[stored_state.state.entity_id] = (
+                    stored_state.extra_data,
+                    stored_state_dict["extra_data"],
+                )
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save(data)
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            # Write the changes with the next dump instead
+            self._changed_entity_ids |= changed_entity_ids
+            return
+
+        self._extra_data = extra_data
+        self._last_compacted = dt_util.utcnow()
+        if not self._journal:
+            return
+        self._journal = {}
+        try:
+            await self.journal_store.async_remove()
+        except OSError as exc:
+            _LOGGER.error("Error removing last states journal", exc_info=exc)
+
+    @callback
+    def _async_get_changed_stored_states(self) -> list[StoredState]:
+        """Get the stored states which changed since the last dump.
+
+        States change with state_changed events, the extra data of an
+        entity can change without its state changing and is compared
+        with the extra data written by the last dump. Extra data which
+        compares equal to the last written extra data is not converted
+        to a dict again.
+        """
+        now = dt_util.utcnow()
+        changed_entity_ids = self._changed_entity_ids
+        self._changed_entity_ids = set()
+        extra_data_cache = self._extra_data
+        stored_states: list[StoredState] = []
+
+        for entity_id, entity in self.entities.items():
+            extra_data = entity.extra_restore_state_data
+            if extra_data is None:
+                if extra_data_cache.pop(entity_id, None) is not None:
+                    changed_entity_ids.add(entity_id)
+            elif (
+                cached := extra_data_cache.get(entity_id)
+            ) is None or not _extra_data_equal(cached, extra_data):
+                extra_data_dict = extra_data.as_dict()
+                if cached is None or extra_data_dict != cached[1]:
+                    changed_entity_ids.add(entity_id)
+                extra_data_cache[entity_id] = (extra_data, extra_data_dict)
+            if entity_id not in changed_entity_ids:
+                continue
+            if (
+                state := self.hass.states.get(entity_id)
+            ) is not None and not state.attributes.get(ATTR_RESTORED):
+                stored_states.append(StoredState(state, extra_data, now))
+            changed_entity_ids.discard(entity_id)
+
+        # Entities removed since the last dump
+        for entity_id in changed_entity_ids:
+            if (stored_state := self.last_states.get(entity_id)) is not None:
+                stored_states.append(stored_state)
+
+        return stored_states
+
+    async def async_dump_journal(self) -> None:
+        """Save the states which changed since the last dump to the journal.
+
+        Writes all states instead when the journal was last compacted
+        longer than JOURNAL_COMPACT_INTERVAL ago, or when it holds the
+        states of more than half of the entities.
+        """
+        if dt_util.utcnow() - self._last_compacted >= JOURNAL_COMPACT_INTERVAL or len(
+            self._journal
+        ) * 2 > len(self.entities):
+            await self.async_dump_states()
+            return
+
+        if not (stored_states := self._async_get_changed_stored_states()):
+            _LOGGER.debug("No states changed since the last dump")
+            return
+
+        _LOGGER.debug("Dumping %s changed states", len(stored_states))
+        for stored_state in stored_states:
+            self._journal[stored_state.state.entity_id] = stored_state.as_dict()
+        try:
+            await self.journal_store.async_save(list(self._journal.values()))
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving changed states", exc_info=exc)
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Remember that the state of an entity changed."""
+        self._changed_entity_ids.add(event.data["entity_id"])
+
+    @callback
+    def _async_state_changed_filter(self, event: Event) -> bool:
+        """Filter state changes of entities which are not restored."""
+        return event.data["entity_id"] in self.entities
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
 
-        async def _async_dump_states(*_: Any) -> None:
-            await self.async_dump_states()
+        async def _async_dump_journal(*_: Any) -> None:
+            await self.async_dump_journal()
+
+        cancel_state_changed: CALLBACK_TYPE = self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=self._async_state_changed_filter,
+            run_immediately=True,
+        )
 
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
-        self.hass.async_create_task(_async_dump_states(), "RestoreStateData dump")
+        self.hass.async_create_task(self.async_dump_states(), "RestoreStateData dump")
 
-        # Dump states periodically
+        # Dump changed states periodically
         cancel_interval = async_track_time_interval(
             self.hass,
-            _async_dump_states,
+            _async_dump_journal,
             STATE_DUMP_INTERVAL,
             name="RestoreStateData dump states",
         )
 
         async def _async_dump_states_at_stop(*_: Any) -> None:
             cancel_interval()
-            await self.async_dump_states()
+            cancel_state_changed()
+            await self.async_dump_journal()
 
         # Dump states when stopping hass
         self.hass.bus.async_listen_once(
@@ -277,8 +440,25 @@ class RestoreStateData:
             self.last_states[entity_id] = StoredState(
                 state, extra_data, dt_util.utcnow()
             )
+            self._changed_entity_ids.add(entity_id)
 
         self.entities.pop(entity_id)
+        self._extra_data.pop(entity_id, None)
+
+
+def _extra_data_equal(
+    cached: tuple[ExtraStoredData, dict[str, Any]], extra_data: ExtraStoredData
+) -> bool:
+    """Return if extra data compares equal to the last written extra data.
+
+    Only extra data which compares by value, like dataclasses, is compared,
+    the same object may have been changed in place since it was written.
+    """
+    return (
+        cached[0] is not extra_data
+        and type(extra_data).__eq__ is not object.__eq__
+        and cached[0] == extra_data
+    )
 
 
 def _encode(value: Any) -> Any:
@@ -5,10 +5,12 @@ import asyncio
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from dataclasses import dataclass
 import inspect
 from json import JSONEncoder
 import logging
 import os
+import time
 from typing import Any, Generic, TypeVar
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
@@ -17,7 +19,7 @@ from homeassistant.loader import MAX_LOAD_CONCURRENTLY, bind_hass
 from homeassistant.util import json as json_util
 from homeassistant.util.file import WriteError
 
-from . import json as json_helper
+from . import json as json_helper, record_file
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-warn-return-any
 # mypy: no-check-untyped-defs
@@ -26,10 +28,38 @@ STORAGE_DIR = ".storage"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
+STORAGE_WRITE_TIMINGS = "storage_write_timings"
 
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
 
+@dataclass(slots=True)
+class StoreWriteTiming:
+    """Time spent serializing and writing the data of a store."""
+
+    writes: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    last_time: float = 0.0
+
+    def record(self, write_time: float) -> None:
+        """Record a write."""
+        self.writes += 1
+        self.total_time += write_time
+        self.last_time = write_time
+        if write_time > self.max_time:
+            self.max_time = write_time
+
+
+@callback
+def async_get_write_timings(hass: HomeAssistant) -> dict[str, StoreWriteTiming]:
+    """Return the write timings of each store key."""
+    timings: dict[str, StoreWriteTiming] = hass.data.setdefault(
+        STORAGE_WRITE_TIMINGS, {}
+    )
+    return timings
+
+
 @bind_hass
 async def async_migrator(
     hass: HomeAssistant,
@@ -84,8 +114,24 @@ class Store(Generic[_T]):
         atomic_writes: bool = False,
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
+        chunked_writes: bool = False,
+        binary_format: bool = False,
+        record_key: Callable[[Any], str] | None = None,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        Stores with chunked_writes serialize and write their data in chunks
+        in the executor instead of serializing the whole document first,
+        which needs less memory for large stores. It is only used with the
+        default encoder.
+
+        Stores with binary_format are written as record files instead of
+        JSON. If their data is a list it is loaded as LazyRecords which
+        decodes the items when they are accessed, record_key returns the
+        key the items can be found by without decoding them. Existing JSON
+        files are still loaded and both formats are loaded regardless of
+        binary_format. It is only used with the default encoder.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -98,6 +144,10 @@ class Store(Generic[_T]):
         self._load_task: asyncio.Future[_T | None] | None = None
         self._encoder = encoder
         self._atomic_writes = atomic_writes
+        default_encoder = encoder is None or encoder is json_helper.JSONEncoder
+        self._chunked_writes = chunked_writes and default_encoder
+        self._binary_format = binary_format and default_encoder
+        self._record_key = record_key
 
     @property
     def path(self):
@@ -147,7 +197,7 @@ class Store(Generic[_T]):
             data = deepcopy(data)
         else:
             data = await self.hass.async_add_executor_job(
-                json_util.load_json, self.path
+                record_file.load_file, self.path
             )
 
             if data == {}:
@@ -163,6 +213,8 @@ class Store(Generic[_T]):
         ):
             stored = data["data"]
         else:
+            if isinstance(data["data"], record_file.LazyRecords):
+                data["data"] = list(data["data"])
             _LOGGER.info(
                 "Migrating %s storage from %s.%s to %s.%s",
                 self.key,
@@ -294,13 +346,33 @@ class Store(Generic[_T]):
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_helper.save_json(
-            path,
-            data,
-            self._private,
-            encoder=self._encoder,
-            atomic_writes=self._atomic_writes,
-        )
+        start = time.monotonic()
+        if self._binary_format:
+            record_file.save_records(
+                path,
+                data,
+                self._private,
+                atomic_writes=self._atomic_writes,
+                record_key=self._record_key,
+            )
+        elif self._chunked_writes:
+            json_helper.save_json_chunked(
+                path, data, self._private, atomic_writes=self._atomic_writes
+            )
+        else:
+            json_helper.save_json(
+                path,
+                data,
+                self._private,
+                encoder=self._encoder,
+                atomic_writes=self._atomic_writes,
+            )
+        write_time = time.monotonic() - start
+        # Writes of the same store are serialized by the write lock,
+        # setdefault is atomic if two stores are written at the same time
+        write_timings = self.hass.data.setdefault(STORAGE_WRITE_TIMINGS, {})
+        write_timings.setdefault(self.key, StoreWriteTiming()).record(write_time)
+        _LOGGER.debug("Wrote data for %s in %.3f seconds", self.key, write_time)
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
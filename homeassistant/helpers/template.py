@@ -4,6 +4,7 @@ from __future__ import annotations
 from ast import literal_eval
 import asyncio
 import base64
+import binascii
 import collections.abc
 from collections.abc import Callable, Collection, Generator, Iterable, MutableMapping
 from contextlib import contextmanager, suppress
@@ -20,6 +21,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import threading
 from types import CodeType
 from typing import (
     Any,
@@ -38,6 +40,7 @@ import async_timeout
 from awesomeversion import AwesomeVersion
 import jinja2
 from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2.bccache import Bucket
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -52,13 +55,16 @@ from homeassistant.const import (
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     State,
     callback,
@@ -81,6 +87,7 @@ from homeassistant.util.thread import ThreadWithException
 
 from . import area_registry, device_registry, entity_registry, location as loc_helper
 from .singleton import singleton
+from .storage import Store
 from .typing import TemplateVarsType
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -93,6 +100,12 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE = "template.bytecode_cache"
+
+BYTECODE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_STORAGE_VERSION = 1
+BYTECODE_SAVE_DELAY = 60
+BYTECODE_CACHE_SIZE = 1024
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -990,7 +1003,7 @@ class TemplateStateBase(State):
         return self._state.domain
 
     @property
-    def object_id(self) -> str:  # type: ignore[override]
+    def object_id(self) -> str:
         """Wrap State.object_id."""
         self._collect_state()
         return self._state.object_id
@@ -2224,6 +2237,12 @@ async def async_load_custom_templates(hass: HomeAssistant) -> None:
     """Load all custom jinja files under 5MiB into memory."""
     custom_templates = await hass.async_add_executor_job(_load_custom_templates, hass)
     _get_hass_loader(hass).sources = custom_templates
+    _get_bytecode_cache(hass).async_set_custom_templates(custom_templates)
+
+
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the templates compiled by the previous run."""
+    await _get_bytecode_cache(hass).async_load()
 
 
 def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
@@ -2274,6 +2293,135 @@ class HassLoader(jinja2.BaseLoader):
         return self._sources[template], template, lambda: cur_reload == self._reload
 
 
+class TemplateBytecodeCache(jinja2.BytecodeCache):
+    """Keep the compiled templates and save them in .storage.
+
+    The bytecode of the previous run is loaded at startup so templates
+    do not have to be compiled again. Templates compiled from a string
+    are keyed by the checksum of their source, custom templates by their
+    name. The saved bytecode is dropped when Home Assistant is updated
+    or the custom templates change.
+
+    Only the bytecode used until startup is done is saved, templates
+    rendered later on, e.g. from the websocket API, are only kept in
+    a size limited cache in memory.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._store = Store[dict[str, Any]](
+            hass, BYTECODE_STORAGE_VERSION, BYTECODE_STORAGE_KEY
+        )
+        # Templates may be compiled outside the event loop
+        self._lock = threading.Lock()
+        self._bytecode: MutableMapping[str, bytes] = LRU(BYTECODE_CACHE_SIZE)
+        # The bytecode to save, None once startup is done
+        self._startup_bytecode: dict[str, bytes] | None = {}
+        self._custom_templates_key: str | None = None
+        self.hits = 0
+        self.misses = 0
+
+    async def async_load(self) -> None:
+        """Load the saved bytecode and save it again after startup."""
+        self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STARTED, self._async_schedule_save
+        )
+        if not (data := await self._store.async_load()):
+            return
+        if data["ha_version"] != __version__ or (
+            self._custom_templates_key is not None
+            and data["custom_templates"] != self._custom_templates_key
+        ):
+            return
+        self._custom_templates_key = data["custom_templates"]
+        try:
+            bytecode = {
+                key: base64.b64decode(value) for key, value in data["bytecode"].items()
+            }
+        except binascii.Error:
+            _LOGGER.warning("Ignoring invalid saved template bytecode")
+            return
+        with self._lock:
+            for key, value in bytecode.items():
+                # Keep the bytecode of templates compiled while loading
+                if key not in self._bytecode:
+                    self._bytecode[key] = value
+
+    @callback
+    def async_set_custom_templates(self, custom_templates: dict[str, str]) -> None:
+        """Drop the bytecode if the custom templates changed."""
+        key = self.get_source_checksum(
+            orjson.dumps(custom_templates, option=orjson.OPT_SORT_KEYS).decode()
+        )
+        if self._custom_templates_key not in (None, key):
+            self.clear()
+        self._custom_templates_key = key
+
+    def get_source_bucket(self, environment: jinja2.Environment, source: str) -> Bucket:
+        """Return a cache bucket for a template compiled from a string."""
+        checksum = self.get_source_checksum(source)
+        bucket = Bucket(environment, f"source:{checksum}", checksum)
+        self.load_bytecode(bucket)
+        return bucket
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Load the bytecode of a bucket."""
+        with self._lock:
+            bytecode = self._bytecode.get(bucket.key)
+        if bytecode is not None:
+            bucket.bytecode_from_string(bytecode)
+        if bytecode is None or bucket.code is None:
+            self.misses += 1
+            return
+        self.hits += 1
+        self._set_bytecode(bucket.key, bytecode)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        """Store the bytecode of a bucket."""
+        self._set_bytecode(bucket.key, bucket.bytecode_to_string())
+
+    def _set_bytecode(self, key: str, bytecode: bytes) -> None:
+        """Store the bytecode and remember it for saving during startup."""
+        with self._lock:
+            self._bytecode[key] = bytecode
+            if self._startup_bytecode is not None:
+                self._startup_bytecode[key] = bytecode
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self._bytecode.clear()
+            if self._startup_bytecode is not None:
+                self._startup_bytecode.clear()
+
+    @callback
+    def _async_schedule_save(self, _: Event) -> None:
+        """Save the bytecode used during startup."""
+        with self._lock:
+            bytecode, self._startup_bytecode = self._startup_bytecode, None
+        if bytecode is not None:
+            self._store.async_delay_save(
+                partial(self._data_to_save, bytecode), BYTECODE_SAVE_DELAY
+            )
+
+    @callback
+    def _data_to_save(self, bytecode: dict[str, bytes]) -> dict[str, Any]:
+        """Return the bytecode used during startup."""
+        return {
+            "ha_version": __version__,
+            "custom_templates": self._custom_templates_key,
+            "bytecode": {
+                key: base64.b64encode(value).decode() for key, value in bytecode.items()
+            },
+        }
+
+
+@singleton(_BYTECODE_CACHE)
+def _get_bytecode_cache(hass: HomeAssistant) -> TemplateBytecodeCache:
+    return TemplateBytecodeCache(hass)
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -2375,6 +2523,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
         # This environment has access to hass, attach its loader to enable imports.
         self.loader = _get_hass_loader(hass)
+        self.bytecode_cache = _get_bytecode_cache(hass)
 
         # We mark these as a context functions to ensure they get
         # evaluated fresh with every execution, rather than executed
@@ -2571,9 +2720,26 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             )
 
         if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+            cached = self.template_cache[source] = self._compile_with_bytecode_cache(
+                source
+            )
 
         return cached
 
+    def _compile_with_bytecode_cache(
+        self, source: str | jinja2.nodes.Template
+    ) -> CodeType:
+        """Compile the template unless its bytecode is cached."""
+        bytecode_cache = self.bytecode_cache
+        if not isinstance(bytecode_cache, TemplateBytecodeCache) or not isinstance(
+            source, str
+        ):
+            return super().compile(source)
+        bucket = bytecode_cache.get_source_bucket(self, source)
+        if bucket.code is None:
+            bucket.code = super().compile(source)
+            bytecode_cache.set_bucket(bucket)
+        return bucket.code
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)  # type: ignore[no-untyped-call]
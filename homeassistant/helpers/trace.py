@@ -12,6 +12,8 @@ import homeassistant.util.dt as dt_util
 
 from .typing import TemplateVarsType
 
+_MISSING = object()
+
 
 class TraceElement:
     """Container for trace data."""
@@ -29,13 +31,33 @@ class TraceElement:
         if variables is None:
             variables = {}
         last_variables = variables_cv.get() or {}
-        variables_cv.set(dict(variables))
-        changed_variables = {
-            key: value
+        self._last_variables: dict[str, Any] | None = None
+        self._variables_snapshot: dict[str, Any] | None = None
+        self._variables: dict[str, Any] | None
+        if not trace_lazy_variables_cv.get():
+            variables_cv.set(dict(variables))
+            self._variables = {
+                key: value
+                for key, value in variables.items()
+                if key not in last_variables or last_variables[key] != value
+            }
+            return
+
+        # Keep the snapshots and compare them when the trace is serialized,
+        # the snapshot is shared with the previous element if no variable
+        # was replaced. Values are not copied, so variables mutated in place
+        # are not detected
+        if len(variables) == len(last_variables) and all(
+            last_variables.get(key, _MISSING) is value
             for key, value in variables.items()
-            if key not in last_variables or last_variables[key] != value
-        }
-        self._variables = changed_variables
+        ):
+            self._variables = {}
+            return
+        snapshot = dict(variables)
+        variables_cv.set(snapshot)
+        self._variables = None
+        self._last_variables = last_variables
+        self._variables_snapshot = snapshot
 
     def __repr__(self) -> str:
         """Container for trace data."""
@@ -59,6 +81,24 @@ class TraceElement:
         old_result = self._result or {}
         self._result = {**old_result, **kwargs}
 
+    @property
+    def changed_variables(self) -> dict[str, Any]:
+        """Return the variables which changed since the previous element."""
+        if self._variables is None:
+            last_variables = self._last_variables or {}
+            snapshot = self._variables_snapshot or {}
+            self._variables = {
+                key: value
+                for key, value in snapshot.items()
+                if key not in last_variables
+                or (
+                    (last_value := last_variables[key]) is not value
+                    and last_value != value
+                )
+            }
+            self._last_variables = self._variables_snapshot = None
+        return self._variables
+
     def as_dict(self) -> dict[str, Any]:
         """Return dictionary version of this TraceElement."""
         result: dict[str, Any] = {"path": self.path, "timestamp": self._timestamp}
@@ -69,8 +109,8 @@ class TraceElement:
                 "item_id": item_id,
                 "run_id": str(self._child_run_id),
             }
-        if self._variables:
-            result["changed_variables"] = self._variables
+        if changed_variables := self.changed_variables:
+            result["changed_variables"] = changed_variables
         if self._error is not None:
             result["error"] = str(self._error)
         if self._result is not None:
@@ -93,6 +133,10 @@ trace_path_stack_cv: ContextVar[list[str] | None] = ContextVar(
 )
 # Copy of last variables
 variables_cv: ContextVar[Any | None] = ContextVar("variables_cv", default=None)
+# Compare variables when the trace is serialized instead of at every step
+trace_lazy_variables_cv: ContextVar[bool] = ContextVar(
+    "trace_lazy_variables_cv", default=False
+)
 # (domain.item_id, Run ID)
 trace_id_cv: ContextVar[tuple[str, str] | None] = ContextVar(
     "trace_id_cv", default=None
@@ -103,6 +147,21 @@ script_execution_cv: ContextVar[StopReason | None] = ContextVar(
 )
 
 
+@contextmanager
+def trace_lazy_variables(lazy: bool) -> Generator[None, None, None]:
+    """Compare variables of trace elements when the trace is serialized.
+
+    The snapshots are shallow copies, a variable which is mutated in place
+    instead of replaced, for example a dict or a list, is not reported in
+    changed_variables.
+    """
+    token = trace_lazy_variables_cv.set(lazy)
+    try:
+        yield
+    finally:
+        trace_lazy_variables_cv.reset(token)
+
+
 def trace_id_set(trace_id: tuple[str, str]) -> None:
     """Set id of the current trace."""
     trace_id_cv.set(trace_id)
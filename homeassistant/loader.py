@@ -6,14 +6,17 @@ documentation as possible to keep it understandable.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
-from contextlib import suppress
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext, suppress
 from dataclasses import dataclass
 import functools as ft
 import importlib
 import logging
 import pathlib
 import sys
+import threading
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, TypeVar, cast
 
@@ -33,6 +36,8 @@ from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
+from .util.package import is_installed
+from .util.timeline import Timeline
 
 # Typing imports that create a circular dependency
 if TYPE_CHECKING:
@@ -48,6 +53,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_STARTUP_TIMELINE = "startup_timeline"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -60,6 +66,7 @@ CUSTOM_WARNING = (
 _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular dependency
 
 MAX_LOAD_CONCURRENTLY = 4
+MAX_IMPORT_EXECUTOR_WORKERS = 4
 
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
@@ -164,6 +171,7 @@ class Manifest(TypedDict, total=False):
     version: str
     codeowners: list[str]
     loggers: list[str]
+    import_executor: bool
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -687,6 +695,11 @@ class Integration:
         """Return list of loggers used by the integration."""
         return self.manifest.get("loggers")
 
+    @property
+    def import_executor(self) -> bool:
+        """Return if the integration can be imported in the import executor."""
+        return self.manifest.get("import_executor", True)
+
     @property
     def quality_scale(self) -> str | None:
         """Return Integration Quality Scale."""
@@ -870,6 +883,143 @@ def _resolve_integrations_from_root(
     return integrations
 
 
+def async_startup_timeline_span(
+    hass: HomeAssistant,
+    name: str,
+    category: str,
+    lane: str,
+    args: dict[str, Any] | None = None,
+) -> AbstractContextManager[None]:
+    """Record a span in the startup timeline if it is being recorded."""
+    timeline: Timeline | None = hass.data.get(DATA_STARTUP_TIMELINE)
+    if timeline is None or not timeline.recording:
+        return nullcontext()
+    return timeline.span(name, category, lane, args)
+
+
+def _import_integration_modules(
+    integration: Integration, platform_names: Iterable[str]
+) -> tuple[dict[str, ModuleType], float, float, str]:
+    """Import the component and platforms of an integration.
+
+    This runs in a thread of the import executor. Modules which fail to
+    import here are left to be imported in the event loop as usual.
+    Returns the imported modules keyed like the component cache, the
+    monotonic start and end of the import and the name of the thread.
+    """
+    start = time.monotonic()
+    modules: dict[str, ModuleType] = {}
+    domain = integration.domain
+    # Requirements are installed during setup, importing
+    # before that would only fail
+    if all(is_installed(req) for req in integration.requirements):
+        try:
+            modules[domain] = importlib.import_module(integration.pkg_path)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.debug(
+                "Unable to import %s in the executor",
+                integration.pkg_path,
+                exc_info=True,
+            )
+        else:
+            for platform_name in platform_names:
+                path = integration.file_path / platform_name
+                if not path.with_suffix(".py").exists() and not path.is_dir():
+                    continue
+                try:
+                    modules[f"{domain}.{platform_name}"] = importlib.import_module(
+                        f"{integration.pkg_path}.{platform_name}"
+                    )
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.debug(
+                        "Unable to import %s.%s in the executor",
+                        integration.pkg_path,
+                        platform_name,
+                        exc_info=True,
+                    )
+    return modules, start, time.monotonic(), threading.current_thread().name
+
+
+async def async_import_integrations_in_executor(
+    hass: HomeAssistant,
+    integrations: Iterable[Integration],
+    platforms: Mapping[str, Iterable[str]],
+) -> None:
+    """Import integrations and their platforms in an import executor.
+
+    The modules are imported in parallel and added to the component
+    cache so the setup of the integrations does not import them in the
+    event loop. Only the platforms listed for the domain of an
+    integration in platforms are imported. Custom integrations and
+    integrations which set import_executor to false in their manifest
+    are skipped since their modules may not be safe to import outside
+    the event loop.
+    """
+    cache: dict[str, ModuleType] = hass.data.setdefault(DATA_COMPONENTS, {})
+    to_import = [
+        integration
+        for integration in integrations
+        if integration.is_built_in
+        and integration.import_executor
+        and integration.domain not in cache
+    ]
+    if not to_import:
+        return
+    start = time.monotonic()
+    executor = ThreadPoolExecutor(
+        max_workers=MAX_IMPORT_EXECUTOR_WORKERS, thread_name_prefix="ImportExecutor"
+    )
+    try:
+        results = await asyncio.gather(
+            *(
+                hass.loop.run_in_executor(
+                    executor,
+                    _import_integration_modules,
+                    integration,
+                    platforms.get(integration.domain, ()),
+                )
+                for integration in to_import
+            )
+        )
+    finally:
+        executor.shutdown(wait=False)
+    elapsed = time.monotonic() - start
+    # Join the idle workers outside the event loop so no threads are left behind
+    await hass.async_add_executor_job(executor.shutdown)
+
+    timeline: Timeline | None = hass.data.get(DATA_STARTUP_TIMELINE)
+    imported = 0
+    import_time = 0.0
+    for integration, (modules, import_start, import_end, thread_name) in zip(
+        to_import, results
+    ):
+        for name, module in modules.items():
+            cache.setdefault(name, module)
+        imported += len(modules)
+        import_time += import_end - import_start
+        if timeline is not None:
+            timeline.add_span(
+                integration.domain,
+                "import",
+                thread_name,
+                import_start,
+                import_end,
+                {"modules": list(modules)},
+            )
+
+    # The imports are slower in parallel since they compete for the GIL,
+    # so their sum is an upper bound of the time they take one at a time
+    _LOGGER.info(
+        "Imported %s modules of %s integrations in the executor in %.2fs,"
+        " the imports took %.2fs combined, saving up to %.2fs",
+        imported,
+        len(to_import),
+        elapsed,
+        import_time,
+        max(import_time - elapsed, 0),
+    )
+
+
 async def async_get_integration(hass: HomeAssistant, domain: str) -> Integration:
     """Get integration."""
     integrations_or_excs = await async_get_integrations(hass, [domain])
@@ -936,9 +1086,12 @@ async def async_get_integrations(
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
 
-        integrations = await hass.async_add_executor_job(
-            _resolve_integrations_from_root, hass, components, list(needed)
-        )
+        with async_startup_timeline_span(
+            hass, "resolve manifests", "loader", "loader", {"domains": list(needed)}
+        ):
+            integrations = await hass.async_add_executor_job(
+                _resolve_integrations_from_root, hass, components, list(needed)
+            )
         for domain, future in needed.items():
             int_or_exc = integrations.get(domain)
             if not int_or_exc:
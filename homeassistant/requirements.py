@@ -12,7 +12,12 @@ import pkg_resources
 from .core import HomeAssistant, callback
 from .exceptions import HomeAssistantError
 from .helpers.typing import UNDEFINED, UndefinedType
-from .loader import Integration, IntegrationNotFound, async_get_integration
+from .loader import (
+    Integration,
+    IntegrationNotFound,
+    async_get_integration,
+    async_startup_timeline_span,
+)
 from .util import package as pkg_util
 
 # The default is too low when the internet connection is satellite or high latency
@@ -245,11 +250,18 @@ class RequirementsManager:
             return
         self._raise_for_failed_requirements(name, missing)
 
-        async with self.pip_lock:
-            # Recaculate missing again now that we have the lock
-            missing = self._find_missing_requirements(requirements)
-            if missing:
-                await self._async_process_requirements(name, missing)
+        with async_startup_timeline_span(
+            self.hass,
+            "install requirements",
+            "requirements",
+            name,
+            {"missing": missing},
+        ):
+            async with self.pip_lock:
+                # Recaculate missing again now that we have the lock
+                missing = self._find_missing_requirements(requirements)
+                if missing:
+                    await self._async_process_requirements(name, missing)
 
     def _find_missing_requirements(self, requirements: list[str]) -> list[str]:
         """Find requirements that are missing in the cache."""
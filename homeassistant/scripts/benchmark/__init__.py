@@ -6,9 +6,11 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+import contextvars
 import json
 import logging
 from timeit import default_timer as timer
+import tracemalloc
 from typing import TypeVar
 
 from homeassistant import core
@@ -19,6 +21,7 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -314,6 +317,265 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+def _sensor_attributes(idx: int) -> dict[str, str]:
+    """Return one of the common attribute sets of sensors."""
+    unit, device_class = (
+        ("°C", "temperature"),
+        ("%", "humidity"),
+        ("W", "power"),
+        ("kWh", "energy"),
+        ("lx", "illuminance"),
+    )[idx % 5]
+    state_class = "total_increasing" if device_class == "energy" else "measurement"
+    return {
+        "unit_of_measurement": unit,
+        "device_class": device_class,
+        "state_class": state_class,
+    }
+
+
+class _CopyingStateMachine(core.StateMachine):
+    """State machine which copies the attributes of every state."""
+
+    def _async_intern_attributes(self, attributes):
+        return ReadOnlyDict(attributes)
+
+
+def _state_machine_memory(hass, state_machine, count):
+    """Return the memory allocated to set the states of count sensors."""
+    tracemalloc.start()
+    for idx in range(count):
+        state_machine.async_set(
+            f"sensor.sensor_{idx}", str(idx), _sensor_attributes(idx)
+        )
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return memory
+
+
+@benchmark
+async def state_machine_memory(hass):
+    """Measure the memory of 10k and 50k sensor states with shared attributes."""
+    start = timer()
+    for count in (10_000, 50_000):
+        copied = _state_machine_memory(
+            hass, _CopyingStateMachine(hass.bus, hass.loop), count
+        )
+        await hass.async_block_till_done()
+        shared = _state_machine_memory(
+            hass, core.StateMachine(hass.bus, hass.loop), count
+        )
+        await hass.async_block_till_done()
+        print(
+            f"{count} states: {copied / 2**20:.1f} MiB with copied attributes,"
+            f" {shared / 2**20:.1f} MiB with shared attributes,"
+            f" {(copied - shared) / 2**20:.1f} MiB saved"
+        )
+    return timer() - start
+
+
+class _SubscribeEntitiesConnection:
+    """A websocket connection that counts the messages sent to it."""
+
+    def __init__(self, user):
+        """Initialize the connection."""
+        self.user = user
+        self.sent = 0
+
+    def send_message(self, message):
+        """Count a message."""
+        self.sent += 1
+
+
+def _subscribe_entities_connections(connections):
+    """Return simulated connections with their subscribed entity ids.
+
+    A third of them belong to the owner, a third to a user that can only
+    read sensors and a third subscribe to a few entities only.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.auth import models as auth_models
+
+    owner = auth_models.User("owner", None, is_owner=True)
+    restricted = auth_models.User(
+        "restricted",
+        None,
+        groups=[
+            auth_models.Group(
+                "sensors", {"entities": {"domains": {"sensor": {"read": True}}}}
+            )
+        ],
+    )
+    subscriptions = []
+    for idx in range(connections):
+        if idx % 3 == 0:
+            subscriptions.append((_SubscribeEntitiesConnection(owner), set()))
+        elif idx % 3 == 1:
+            subscriptions.append((_SubscribeEntitiesConnection(restricted), set()))
+        else:
+            subscriptions.append(
+                (
+                    _SubscribeEntitiesConnection(owner),
+                    {f"sensor.sensor_{entity}" for entity in range(idx, idx + 10)},
+                )
+            )
+    return subscriptions
+
+
+async def _subscribe_entities_fanout(hass, subscribe, connections, states):
+    """Return the time to send states to the subscribe_entities connections."""
+    subscriptions = _subscribe_entities_connections(connections)
+    for msg_id, (connection, entity_ids) in enumerate(subscriptions):
+        subscribe(hass, connection, msg_id, entity_ids)
+    await hass.async_block_till_done()
+
+    start = timer()
+    for idx in range(states):
+        domain = "sensor" if idx % 2 else "light"
+        hass.states.async_set(f"{domain}.{domain}_{idx % 100}", str(idx))
+    await hass.async_block_till_done()
+    runtime = timer() - start
+
+    assert sum(connection.sent for connection, _ in subscriptions)
+    return runtime
+
+
+def _subscribe_entities_listener(hass, connection, msg_id, entity_ids):
+    """Subscribe the way subscribe_entities did with a listener per connection."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.auth.permissions.const import POLICY_READ
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api import messages
+
+    @core.callback
+    def forward_entity_changes(event):
+        entity_id = event.data["entity_id"]
+        if entity_ids and entity_id not in entity_ids:
+            return
+        permissions = connection.user.permissions
+        if not permissions.access_all_entities(
+            POLICY_READ
+        ) and not permissions.check_entity(entity_id, POLICY_READ):
+            return
+        connection.send_message(messages.cached_state_diff_message(msg_id, event))
+
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED, forward_entity_changes, run_immediately=True
+    )
+
+
+def _subscribe_entities_hub(hass, connection, msg_id, entity_ids):
+    """Subscribe through the shared state diff hub."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.state_hub import (
+        async_get_state_diff_hub,
+    )
+
+    async_get_state_diff_hub(hass).async_subscribe(connection, msg_id, entity_ids)
+
+
+@benchmark
+async def subscribe_entities_fanout(hass):
+    """Send 100k state changes to 30 subscribe_entities connections."""
+    connections = 30
+    states = 10**5
+    # Create the second instance in a copy of the context so it does not
+    # replace hass as the current instance for the rest of the run
+    listener_hass = contextvars.copy_context().run(core.HomeAssistant)
+    listeners = await _subscribe_entities_fanout(
+        listener_hass, _subscribe_entities_listener, connections, states
+    )
+    await listener_hass.async_stop()
+    hub = await _subscribe_entities_fanout(
+        hass, _subscribe_entities_hub, connections, states
+    )
+    print(
+        f"{connections} connections: {listeners:.2f}s with a listener per"
+        f" connection, {hub:.2f}s with the state diff hub"
+    )
+    return hub
+
+
+def _mqtt_subscriptions_and_topics() -> tuple[list[str], list[str]]:
+    """Return realistic MQTT topic filters and received topics."""
+    topic_filters = [
+        "homeassistant/+/+/config",
+        "homeassistant/+/+/+/config",
+        "tasmota/discovery/#",
+        "zigbee2mqtt/bridge/#",
+    ]
+    topics = []
+    for idx in range(1000):
+        topic_filters.append(f"zigbee2mqtt/device_{idx}")
+        topic_filters.append(f"zigbee2mqtt/device_{idx}/availability")
+        topics.append(f"zigbee2mqtt/device_{idx}")
+        topics.append(f"zigbee2mqtt/device_{idx}/availability")
+        topics.append(f"homeassistant/sensor/device_{idx}/temperature/config")
+    for idx in range(500):
+        topic_filters.append(f"tele/tasmota_{idx}/+")
+        topic_filters.append(f"stat/tasmota_{idx}/RESULT")
+        topics.append(f"tele/tasmota_{idx}/SENSOR")
+        topics.append(f"stat/tasmota_{idx}/RESULT")
+        topics.append(f"tasmota/discovery/{idx:012X}/config")
+    return topic_filters, topics
+
+
+@benchmark
+async def mqtt_topic_matching(hass):
+    """Match 100k MQTT topics against 3k subscriptions with a topic trie.
+
+    Like the MQTT client, only wildcard subscriptions are added to the trie,
+    simple subscriptions are looked up in a dict.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+    topic_filters, topics = _mqtt_subscriptions_and_topics()
+    simple: dict[str, list[str]] = {}
+    trie = TopicTrie()
+    for topic_filter in topic_filters:
+        if "+" in topic_filter or "#" in topic_filter:
+            trie.add(topic_filter, topic_filter)
+        else:
+            simple.setdefault(topic_filter, []).append(topic_filter)
+    size = len(topics)
+
+    start = timer()
+
+    for i in range(10**5):
+        topic = topics[i % size]
+        matches = trie.match(topic)
+        if topic in simple:
+            matches = [*simple[topic], *matches]
+
+    return timer() - start
+
+
+@benchmark
+async def mqtt_topic_matching_linear(hass):
+    """Match 1k MQTT topics against 3k subscriptions by testing each filter."""
+    # pylint: disable-next=import-outside-toplevel
+    from paho.mqtt.matcher import MQTTMatcher
+
+    topic_filters, topics = _mqtt_subscriptions_and_topics()
+    matchers = []
+    for topic_filter in topic_filters:
+        matcher = MQTTMatcher()
+        matcher[topic_filter] = True
+        matchers.append(matcher)
+    size = len(topics)
+
+    start = timer()
+
+    for i in range(10**3):
+        topic = topics[i % size]
+        for matcher in matchers:
+            next(matcher.iter_match(topic), False)
+
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
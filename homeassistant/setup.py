@@ -6,6 +6,7 @@ from collections.abc import Awaitable, Callable, Generator, Iterable
 import contextlib
 from datetime import timedelta
 import logging.handlers
+import time
 from timeit import default_timer as timer
 from types import ModuleType
 from typing import Any
@@ -23,6 +24,7 @@ from .exceptions import DependencyError, HomeAssistantError
 from .helpers.issue_registry import IssueSeverity, async_create_issue
 from .helpers.typing import ConfigType
 from .util import dt as dt_util, ensure_unique_string
+from .util.timeline import Timeline
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -212,14 +214,16 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with loader.async_startup_timeline_span(hass, "import", "import", domain):
+            component = integration.get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
 
-    processed_config = await conf_util.async_process_component_config(
-        hass, config, integration
-    )
+    with loader.async_startup_timeline_span(hass, "config", "setup", domain):
+        processed_config = await conf_util.async_process_component_config(
+            hass, config, integration
+        )
 
     if processed_config is None:
         log_error("Invalid config.")
@@ -284,8 +288,11 @@ async def _async_setup_component(
                 return False
 
             if task:
-                async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
-                    result = await task
+                with loader.async_startup_timeline_span(
+                    hass, "async_setup", "setup", domain
+                ):
+                    async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
+                        result = await task
         except asyncio.TimeoutError:
             _LOGGER.error(
                 (
@@ -413,13 +420,20 @@ async def async_process_deps_reqs(
     elif integration.domain in processed:
         return
 
-    if failed_deps := await _async_process_dependencies(hass, config, integration):
+    with loader.async_startup_timeline_span(
+        hass, "dependencies", "setup", integration.domain
+    ):
+        failed_deps = await _async_process_dependencies(hass, config, integration)
+    if failed_deps:
         raise DependencyError(failed_deps)
 
     async with hass.timeout.async_freeze(integration.domain):
-        await requirements.async_get_integration_with_requirements(
-            hass, integration.domain
-        )
+        with loader.async_startup_timeline_span(
+            hass, "requirements", "requirements", integration.domain
+        ):
+            await requirements.async_get_integration_with_requirements(
+                hass, integration.domain
+            )
 
     processed.add(integration.domain)
 
@@ -505,6 +519,7 @@ def async_start_setup(
     """Keep track of when setup starts and finishes."""
     setup_started = hass.data.setdefault(DATA_SETUP_STARTED, {})
     started = dt_util.utcnow()
+    start = time.monotonic()
     unique_components: dict[str, str] = {}
     for domain in components:
         unique = ensure_unique_string(domain, setup_started)
@@ -515,6 +530,11 @@ def async_start_setup(
 
     setup_time: dict[str, timedelta] = hass.data.setdefault(DATA_SETUP_TIME, {})
     time_taken = dt_util.utcnow() - started
+    timeline: Timeline | None = hass.data.get(loader.DATA_STARTUP_TIMELINE)
+    if timeline is not None:
+        end = time.monotonic()
+        for domain in unique_components.values():
+            timeline.add_span("setup", "setup", domain, start, end)
     for unique, domain in unique_components.items():
         del setup_started[unique]
         integration = domain.rpartition(".")[-1]
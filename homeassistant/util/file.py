@@ -1,6 +1,7 @@
 """File utility functions."""
 from __future__ import annotations
 
+from collections.abc import Iterable
 import logging
 import os
 import tempfile
@@ -33,11 +34,24 @@ def write_utf8_file_atomic(
     Using this function frequently will significantly
     negatively impact performance.
     """
+    write_utf8_chunks_atomic(filename, (utf8_data.encode("utf-8"),), private)
+
+
+def write_utf8_chunks_atomic(
+    filename: str,
+    utf8_chunks: Iterable[bytes],
+    private: bool = False,
+) -> None:
+    """Write UTF-8 encoded chunks to a file and rename it into place.
+
+    Same as write_utf8_file_atomic but the data is written chunk by
+    chunk as the iterable produces it.
+    """
     try:
-        with AtomicWriter(filename, overwrite=True).open() as fdesc:
+        with AtomicWriter(filename, mode="wb", overwrite=True).open() as fdesc:
             if not private:
                 os.fchmod(fdesc.fileno(), 0o644)
-            fdesc.write(utf8_data)
+            fdesc.writelines(utf8_chunks)
     except OSError as error:
         _LOGGER.exception("Saving file failed: %s", filename)
         raise WriteError(error) from error
@@ -52,15 +66,28 @@ def write_utf8_file(
 
     Writes all or nothing.
     """
+    write_utf8_chunks(filename, (utf8_data.encode("utf-8"),), private)
+
+
+def write_utf8_chunks(
+    filename: str,
+    utf8_chunks: Iterable[bytes],
+    private: bool = False,
+) -> None:
+    """Write UTF-8 encoded chunks to a file and rename it into place.
+
+    Same as write_utf8_file but the data is written chunk by chunk
+    as the iterable produces it.
+    """
 
     tmp_filename = ""
     try:
         # Modern versions of Python tempfile create this file with mode 0o600
         with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", dir=os.path.dirname(filename), delete=False
+            mode="wb", dir=os.path.dirname(filename), delete=False
         ) as fdesc:
-            fdesc.write(utf8_data)
             tmp_filename = fdesc.name
+            fdesc.writelines(utf8_chunks)
             if not private:
                 os.fchmod(fdesc.fileno(), 0o644)
         os.replace(tmp_filename, filename)
@@ -0,0 +1,95 @@
+"""Record a timeline of work and export it as Chrome trace events."""
+from __future__ import annotations
+
+from collections.abc import Generator
+import contextlib
+import time
+from typing import Any
+
+
+class Timeline:
+    """A timeline of named spans grouped in lanes.
+
+    The timeline is exported in the Chrome trace event format, which
+    can be opened with chrome://tracing or https://ui.perfetto.dev.
+    Each lane is shown as a thread, spans in the same lane are
+    expected to be nested.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the timeline."""
+        self.start = time.monotonic()
+        self.recording = True
+        self._lanes: dict[str, int] = {}
+        self._events: list[dict[str, Any]] = []
+
+    def add_span(
+        self,
+        name: str,
+        category: str,
+        lane: str,
+        start: float,
+        end: float,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Add a span which started and ended at the given monotonic times."""
+        if not self.recording:
+            return
+        if (tid := self._lanes.get(lane)) is None:
+            tid = self._lanes[lane] = len(self._lanes) + 1
+        event: dict[str, Any] = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((start - self.start) * 1_000_000),
+            "dur": round((end - start) * 1_000_000),
+            "pid": 1,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = args
+        self._events.append(event)
+
+    @contextlib.contextmanager
+    def span(
+        self,
+        name: str,
+        category: str,
+        lane: str,
+        args: dict[str, Any] | None = None,
+    ) -> Generator[None, None, None]:
+        """Record a span for the duration of the context."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add_span(name, category, lane, start, time.monotonic(), args)
+
+    def stop(self) -> None:
+        """Stop recording new spans."""
+        self.recording = False
+
+    def as_trace(self) -> dict[str, Any]:
+        """Return the timeline as a Chrome trace event document."""
+        lanes = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": tid,
+                "args": {"name": lane},
+            }
+            for lane, tid in self._lanes.items()
+        ]
+        # Sort the lanes in the order they first appeared
+        lanes.extend(
+            {
+                "name": "thread_sort_index",
+                "ph": "M",
+                "pid": 1,
+                "tid": tid,
+                "args": {"sort_index": tid},
+            }
+            for tid in self._lanes.values()
+        )
+        return {"traceEvents": lanes + self._events, "displayTimeUnit": "ms"}
@@ -14,8 +14,10 @@ from homeassistant.auth import (
     InvalidAuthError,
     auth_store,
     const as auth_const,
+    jwt_wrapper,
     models as auth_models,
 )
+from homeassistant.auth.access_token_cache import AccessTokenCache
 from homeassistant.auth.const import GROUP_ID_ADMIN, MFA_SESSION_EXPIRATION
 from homeassistant.auth.models import Credentials
 from homeassistant.core import HomeAssistant, callback
@@ -1298,3 +1300,60 @@ async def test_access_token_from_the_future(mock_hass) -> None:
     with freeze_time(now + timedelta(days=365)):
         rt = await manager.async_validate_access_token(access_token)
         assert rt.id == refresh_token.id
+
+
+async def test_access_token_cache(mock_hass) -> None:
+    """Test verified access tokens are cached until they are invalidated."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    with patch(
+        "homeassistant.auth.jwt_wrapper.verify_and_decode",
+        wraps=jwt_wrapper.verify_and_decode,
+    ) as mock_verify:
+        for _ in range(3):
+            assert (
+                await manager.async_validate_access_token(access_token) is refresh_token
+            )
+    assert mock_verify.call_count == 1
+    stats = manager.async_get_access_token_cache_stats()
+    assert stats["size"] == 1
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.667
+
+    await manager.async_deactivate_user(user)
+    assert await manager.async_validate_access_token(access_token) is None
+    await manager.async_activate_user(user)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+    assert manager.async_get_access_token_cache_stats()["size"] == 0
+
+
+async def test_access_token_cache_expiry_and_size(mock_hass) -> None:
+    """Test cached access tokens expire and the cache is bounded."""
+    now = dt_util.utcnow()
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    manager._access_token_cache = AccessTokenCache(2)
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_tokens = []
+    for seconds in range(3):
+        with freeze_time(now + timedelta(seconds=seconds)):
+            access_tokens.append(manager.async_create_access_token(refresh_token))
+            assert await manager.async_validate_access_token(access_tokens[-1])
+
+    stats = manager.async_get_access_token_cache_stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+
+    with freeze_time(now + auth_const.ACCESS_TOKEN_EXPIRATION + timedelta(minutes=1)):
+        assert await manager.async_validate_access_token(access_tokens[-1]) is None
+
+    stats = manager.async_get_access_token_cache_stats()
+    assert stats["size"] == 1
+    assert stats["expired"] == 1
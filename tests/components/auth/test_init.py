@@ -519,6 +519,37 @@ async def test_ws_delete_refresh_token(
     assert refresh_token is None
 
 
+async def test_ws_access_token_cache_stats(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    hass_access_token: str,
+    hass_read_only_access_token: str,
+) -> None:
+    """Test the access token cache statistics command."""
+    assert await async_setup_component(hass, "auth", {})
+    ws_client = await hass_ws_client(hass, hass_access_token)
+
+    await ws_client.send_json({"id": 5, "type": "auth/access_token_cache_stats"})
+    result = await ws_client.receive_json()
+    assert result["success"], result
+    stats = result["result"]
+    assert stats["size"] == 1
+    assert stats["misses"] == 1
+    hits = stats["hits"]
+
+    assert await hass.auth.async_validate_access_token(hass_access_token)
+    await ws_client.send_json({"id": 6, "type": "auth/access_token_cache_stats"})
+    result = await ws_client.receive_json()
+    assert result["result"]["hits"] == hits + 1
+    assert result["result"]["hit_rate"] == round((hits + 1) / (hits + 2), 3)
+
+    ws_client = await hass_ws_client(hass, hass_read_only_access_token)
+    await ws_client.send_json({"id": 5, "type": "auth/access_token_cache_stats"})
+    result = await ws_client.receive_json()
+    assert not result["success"]
+    assert result["error"]["code"] == "unauthorized"
+
+
 async def test_ws_sign_path(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator, hass_access_token: str
 ) -> None:
@@ -235,6 +235,61 @@ async def test_expand_entity_ids_recursive(hass: HomeAssistant) -> None:
     )
 
 
+async def test_expand_entity_ids_cache(hass: HomeAssistant) -> None:
+    """Test expanded groups are cached until the members of a group change."""
+    hass.states.async_set("light.Bowl", STATE_ON)
+    hass.states.async_set("light.Ceiling", STATE_OFF)
+    hass.states.async_set("light.Kitchen", STATE_OFF)
+
+    assert await async_setup_component(hass, "group", {})
+
+    inner_group = await group.Group.async_create_group(
+        hass, "inner_group", ["light.Bowl", "light.Ceiling"], False
+    )
+    outer_group = await group.Group.async_create_group(
+        hass, "outer_group", [inner_group.entity_id], False
+    )
+
+    assert group.expand_entity_ids(hass, [outer_group.entity_id]) == [
+        "light.bowl",
+        "light.ceiling",
+    ]
+    cache: group.GroupExpansionCache = hass.data[group.EXPAND_CACHE_KEY]
+    assert cache.misses == 2
+    assert cache.hits == 0
+
+    assert group.expand_entity_ids(hass, [outer_group.entity_id]) == [
+        "light.bowl",
+        "light.ceiling",
+    ]
+    assert group.expand_entity_ids(hass, [inner_group.entity_id]) == [
+        "light.bowl",
+        "light.ceiling",
+    ]
+    assert cache.misses == 2
+    assert cache.hits == 2
+
+    # A group state change without member changes keeps the cache
+    hass.states.async_set("light.Ceiling", STATE_ON)
+    await hass.async_block_till_done()
+    assert hass.states.get(inner_group.entity_id).state == STATE_ON
+    assert group.expand_entity_ids(hass, [outer_group.entity_id]) == [
+        "light.bowl",
+        "light.ceiling",
+    ]
+    assert cache.hits == 3
+
+    # Changing the members of a nested group clears the cache
+    await inner_group.async_update_tracked_entity_ids(["light.Bowl", "light.Kitchen"])
+    await hass.async_block_till_done()
+    assert group.expand_entity_ids(hass, [outer_group.entity_id]) == [
+        "light.bowl",
+        "light.kitchen",
+    ]
+    assert cache.misses == 4
+    assert cache.hits == 3
+
+
 async def test_expand_entity_ids_ignores_non_strings(hass: HomeAssistant) -> None:
     """Test that non string elements in lists are ignored."""
     assert [] == group.expand_entity_ids(hass, [5, True])
@@ -985,6 +985,97 @@ async def test_history_stream_live(
     }
 
 
+async def test_history_stream_live_columnar(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream with history and live data as columns."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "1.5", attributes={"any": "attr"})
+    sensor_one_last_updated = hass.states.get("sensor.one").last_updated
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.two", "off", attributes={"any": "attr"})
+    sensor_two_last_updated = hass.states.get("sensor.two").last_updated
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "start_time": now.isoformat(),
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": False,
+            "minimal_response": False,
+            "columnar": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["type"] == "result"
+
+    response = await client.receive_json()
+    assert response == {
+        "event": {
+            "end_time": sensor_two_last_updated.timestamp(),
+            "start_time": now.timestamp(),
+            "states": {
+                "sensor.one": {
+                    "s": [1.5],
+                    "lu": [sensor_one_last_updated.timestamp()],
+                    "lc": [sensor_one_last_updated.timestamp()],
+                    "a": [{"any": "attr"}],
+                    "ai": [0],
+                },
+                "sensor.two": {
+                    "s": ["off"],
+                    "lu": [sensor_two_last_updated.timestamp()],
+                    "lc": [sensor_two_last_updated.timestamp()],
+                    "a": [{"any": "attr"}],
+                    "ai": [0],
+                },
+            },
+        },
+        "id": 1,
+        "type": "event",
+    }
+
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "2", attributes={"any": "attr"})
+    sensor_one_first_update = hass.states.get("sensor.one").last_updated
+    hass.states.async_set("sensor.one", "2", attributes={"diff": "attr"})
+    await async_recorder_block_till_done(hass)
+
+    sensor_one_last_updated = hass.states.get("sensor.one").last_updated
+    response = await client.receive_json()
+    assert response == {
+        "event": {
+            "states": {
+                "sensor.one": {
+                    "s": [2.0, 2.0],
+                    "lu": [
+                        sensor_one_first_update.timestamp(),
+                        sensor_one_last_updated.timestamp(),
+                    ],
+                    "lc": [
+                        sensor_one_first_update.timestamp(),
+                        sensor_one_first_update.timestamp(),
+                    ],
+                    "a": [{"any": "attr"}, {"diff": "attr"}],
+                    "ai": [0, 1],
+                },
+            },
+        },
+        "id": 1,
+        "type": "event",
+    }
+
+
 async def test_history_stream_live_minimal_response(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
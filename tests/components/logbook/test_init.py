@@ -18,6 +18,7 @@ from homeassistant.components.logbook.models import LazyEventPartialState
 from homeassistant.components.logbook.processor import EventProcessor
 from homeassistant.components.logbook.queries.common import PSEUDO_EVENT_STATE_CHANGED
 from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.models import bytes_to_ulid_or_none
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.sensor import SensorStateClass
 from homeassistant.const import (
@@ -155,6 +156,57 @@ async def test_service_call_create_logbook_entry_invalid_entity_id(
     assert events[0][logbook.ATTR_MESSAGE] == "is triggered"
 
 
+@patch("homeassistant.components.logbook.processor.STREAM_CHUNK_SIZE", 1)
+@patch("homeassistant.components.logbook.processor.STREAM_MAX_CONTEXTS", 3)
+async def test_stream_events_forgets_least_recently_used_contexts(
+    hass_: HomeAssistant,
+) -> None:
+    """Test streaming events forgets the least recently used contexts first."""
+    for entity_id in ("switch.a", "switch.b", "switch.c", "light.a"):
+        hass_.states.async_set(entity_id, STATE_OFF)
+    await async_wait_recording_done(hass_)
+    start = dt_util.utcnow()
+
+    context_a = ha.Context(id="01GTDGKBCH00GW0X476W5TVAAA")
+    context_b = ha.Context(id="01GTDGKBCH00GW0X476W5TVBBB")
+    context_c = ha.Context(id="01GTDGKBCH00GW0X476W5TVCCC")
+    for entity_id, state, context in (
+        ("switch.a", STATE_ON, context_a),
+        ("light.a", STATE_ON, context_a),
+        ("switch.b", STATE_ON, context_b),
+        ("light.a", STATE_OFF, context_a),
+        ("switch.c", STATE_ON, context_c),
+        ("light.a", STATE_ON, context_a),
+    ):
+        hass_.states.async_set(entity_id, state, context=context)
+        await hass_.async_block_till_done()
+    await async_wait_recording_done(hass_)
+
+    event_processor = EventProcessor(hass_, (EVENT_CALL_SERVICE, EVENT_LOGBOOK_ENTRY))
+    events = [
+        event
+        for chunk in event_processor.stream_events(
+            start, dt_util.utcnow() + timedelta(hours=1)
+        )
+        for event in chunk
+    ]
+    assert [
+        (event["entity_id"], event.get("context_entity_id")) for event in events
+    ] == [
+        ("switch.a", None),
+        ("light.a", "switch.a"),
+        ("switch.b", None),
+        ("light.a", "switch.a"),
+        ("switch.c", None),
+        # context_a was used after context_b so context_b is forgotten
+        ("light.a", "switch.a"),
+    ]
+    assert context_b.id not in [
+        bytes_to_ulid_or_none(context_id_bin)
+        for context_id_bin in event_processor.logbook_run.context_lookup
+    ]
+
+
 async def test_service_call_create_log_book_entry_no_message(hass_) -> None:
     """Test if service call create log book entry without message."""
     calls = async_capture_events(hass_, logbook.EVENT_LOGBOOK_ENTRY)
@@ -0,0 +1,93 @@
+"""The tests for the MQTT topic trie."""
+from paho.mqtt.matcher import MQTTMatcher
+import pytest
+
+from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+TOPIC_FILTERS = [
+    "sport/tennis/player1",
+    "sport/tennis/player1/#",
+    "sport/tennis/+",
+    "sport/+/player1",
+    "sport/#",
+    "+/+",
+    "+",
+    "/+",
+    "#",
+    "$SYS/#",
+    "$SYS/+/clients",
+    "+/monitor/clients",
+    "zigbee2mqtt/+/availability",
+    "homeassistant/+/+/config",
+    "homeassistant/+/+/+/config",
+]
+
+
+@pytest.mark.parametrize(
+    "topic",
+    [
+        "sport",
+        "sport/",
+        "sport/tennis",
+        "sport/tennis/player1",
+        "sport/tennis/player1/ranking",
+        "sport/tennis/player2",
+        "sport/badminton/player1",
+        "/finance",
+        "finance",
+        "",
+        "/",
+        "$SYS/monitor/clients",
+        "$SYS",
+        "zigbee2mqtt/kitchen_light/availability",
+        "zigbee2mqtt/kitchen_light",
+        "homeassistant/sensor/node/object/config",
+        "homeassistant/sensor/object/config",
+    ],
+)
+def test_match_same_as_paho(topic: str) -> None:
+    """Test the trie matches the same topic filters as the paho matcher."""
+    trie: TopicTrie[str] = TopicTrie()
+    for topic_filter in TOPIC_FILTERS:
+        trie.add(topic_filter, topic_filter)
+
+    expected = []
+    for topic_filter in TOPIC_FILTERS:
+        matcher = MQTTMatcher()
+        matcher[topic_filter] = topic_filter
+        expected.extend(matcher.iter_match(topic))
+
+    assert sorted(trie.match(topic)) == sorted(expected)
+
+
+def test_add_remove() -> None:
+    """Test adding and removing values."""
+    trie: TopicTrie[int] = TopicTrie()
+    trie.add("a/+/c", 1)
+    trie.add("a/+/c", 2)
+    trie.add("a/#", 3)
+    assert len(trie) == 3
+    assert sorted(trie) == [1, 2, 3]
+    assert trie.has_filter("a/+/c")
+    assert trie.has_filter("a/#")
+    assert not trie.has_filter("a/+")
+    assert not trie.has_filter("b")
+    assert sorted(trie.match("a/b/c")) == [1, 2, 3]
+
+    trie.remove("a/+/c", 1)
+    assert sorted(trie.match("a/b/c")) == [2, 3]
+
+    with pytest.raises(ValueError):
+        trie.remove("a/+/c", 1)
+    with pytest.raises(KeyError):
+        trie.remove("a/b/c", 2)
+
+    trie.remove("a/+/c", 2)
+    assert not trie.has_filter("a/+/c")
+    assert trie.match("a/b/c") == [3]
+
+    trie.remove("a/#", 3)
+    assert len(trie) == 0
+    assert trie.match("a/b/c") == []
+    # All nodes are pruned when the trie is empty
+    assert not trie._root.children
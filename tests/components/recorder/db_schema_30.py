@@ -261,6 +261,19 @@ class Events(Base):  # type: ignore[misc,valid-type]
             context_parent_id=event.context.parent_id,
         )
 
+    @staticmethod
+    def row_from_event(event: Event) -> dict[str, Any]:
+        """Create the column values of a row from a native event.
+
+        *** Not originally in v30, only added for recorder to startup ok
+        """
+        dbevent = Events.from_event(event)
+        return {
+            column.key: getattr(dbevent, column.key)
+            for column in Events.__table__.columns
+            if column.key != "event_id"
+        }
+
     def to_native(self, validate_entity_id: bool = True) -> Event | None:
         """Convert to a native HA Event."""
         context = Context(
@@ -443,6 +456,19 @@ class States(Base):  # type: ignore[misc,valid-type]
 
         return dbstate
 
+    @staticmethod
+    def row_from_event(event: Event) -> dict[str, Any]:
+        """Create the column values of a row from a native event.
+
+        *** Not originally in v30, only added for recorder to startup ok
+        """
+        dbstate = States.from_event(event)
+        return {
+            column.key: getattr(dbstate, column.key)
+            for column in States.__table__.columns
+            if column.key != "state_id"
+        }
+
     def to_native(self, validate_entity_id: bool = True) -> State | None:
         """Convert to an HA state object."""
         context = Context(
@@ -23,7 +23,7 @@ from homeassistant.components.recorder.db_schema import (
     StatesMeta,
 )
 from homeassistant.components.recorder.filters import Filters
-from homeassistant.components.recorder.history import legacy
+from homeassistant.components.recorder.history import legacy, modern
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.models.legacy import (
     LegacyLazyState,
@@ -524,6 +524,96 @@ def test_get_significant_states_minimal_response(
     )
 
 
+@pytest.mark.parametrize("no_attributes", [False, True])
+@pytest.mark.parametrize("include_last_changed", [False, True])
+def test_history_statements_select_columns_in_order(
+    no_attributes: bool, include_last_changed: bool
+) -> None:
+    """Test the history statements select the columns the rows are read with."""
+    columns = list(modern._selected_columns(no_attributes, include_last_changed))
+    stmt = modern._stmt_and_join_attributes(no_attributes, include_last_changed)
+    start_state_stmt = modern._stmt_and_join_attributes_for_start_state(
+        no_attributes, include_last_changed
+    )
+    from_subquery_stmt = modern._select_from_subquery(
+        stmt.subquery(), no_attributes, include_last_changed
+    )
+    for statement in (stmt, start_state_stmt, from_subquery_stmt):
+        assert [column.name for column in statement.selected_columns] == columns
+
+
+@pytest.mark.parametrize("minimal_response", [False, True])
+@pytest.mark.parametrize("significant_changes_only", [False, True])
+def test_get_significant_states_columnar(
+    hass_recorder: Callable[..., HomeAssistant],
+    minimal_response: bool,
+    significant_changes_only: bool,
+) -> None:
+    """Test the columnar states match the compressed states."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    entity_ids = list(states)
+    compressed = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids,
+        significant_changes_only=significant_changes_only,
+        minimal_response=minimal_response,
+        compressed_state_format=True,
+    )
+    columnar = history.get_significant_states_columnar(
+        hass,
+        zero,
+        four,
+        entity_ids,
+        significant_changes_only=significant_changes_only,
+        minimal_response=minimal_response,
+    )
+    assert list(columnar) == list(compressed)
+    for entity_id, compressed_states in compressed.items():
+        columns = columnar[entity_id].as_dict()
+        assert len(columns["s"]) == len(compressed_states)
+        assert ("lc" in columns) is not significant_changes_only
+        for idx, compressed_state in enumerate(compressed_states):
+            state = columns["s"][idx]
+            if isinstance(state, float):
+                assert state == float(compressed_state["s"])
+            else:
+                assert state == compressed_state["s"]
+            assert columns["lu"][idx] == compressed_state["lu"]
+            if "lc" in columns:
+                assert columns["lc"][idx] == compressed_state.get(
+                    "lc", compressed_state["lu"]
+                )
+            if "a" in compressed_state:
+                assert columns["a"][columns["ai"][idx]] == compressed_state["a"]
+
+    # The thermostat states are numeric and its attributes are not repeated
+    thermostat = columnar["thermostat.test"]
+    assert thermostat.states.tolist() == [20.0, 21.0, 21.0]
+    assert thermostat.attributes == [
+        {"current_temperature": 19.5},
+        {"current_temperature": 19.8},
+        {"current_temperature": 20},
+    ]
+
+
+def test_get_significant_states_columnar_no_attributes(
+    hass_recorder: Callable[..., HomeAssistant]
+) -> None:
+    """Test the columnar states without attributes."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    columnar = history.get_significant_states_columnar(
+        hass, zero, four, list(states), no_attributes=True
+    )
+    columns = columnar["media_player.test"].as_dict()
+    assert columns["s"] == ["idle", "YouTube", "Netflix"]
+    assert "a" not in columns
+    assert "ai" not in columns
+
+
 @pytest.mark.parametrize("time_zone", ["Europe/Berlin", "US/Hawaii", "UTC"])
 def test_get_significant_states_with_initial(
     time_zone, hass_recorder: Callable[..., HomeAssistant]
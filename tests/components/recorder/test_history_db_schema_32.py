@@ -293,6 +293,26 @@ def test_get_significant_states(hass_recorder: Callable[..., HomeAssistant]) ->
         assert_dict_of_states_equal_without_context_and_last_changed(states, hist)
 
 
+def test_get_significant_states_columnar(
+    hass_recorder: Callable[..., HomeAssistant]
+) -> None:
+    """Test the columnar states are converted from the legacy states."""
+    hass = hass_recorder()
+    instance = recorder.get_instance(hass)
+    with patch.object(instance.states_meta_manager, "active", False):
+        zero, four, states = record_states(hass)
+        columnar = history.get_significant_states_columnar(
+            hass, zero, four, entity_ids=list(states), minimal_response=True
+        )
+        columns = columnar["media_player.test"].as_dict()
+        assert columns["s"] == ["idle", "YouTube", "Netflix"]
+        # Only the first state has attributes with minimal_response
+        assert columns["ai"] == [0, 1, 1]
+        assert columns["a"] == [{"media_title": str(sentinel.mt1)}, {}]
+        thermostat = columnar["thermostat.test"]
+        assert thermostat.states.tolist() == [20.0, 21.0, 21.0]
+
+
 def test_get_significant_states_minimal_response(
     hass_recorder: Callable[..., HomeAssistant]
 ) -> None:
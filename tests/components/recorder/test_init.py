@@ -12,11 +12,13 @@ from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import event as sqlalchemy_event
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
+    CONF_AUTO_PURGE_MODE,
     CONF_AUTO_REPACK,
     CONF_COMMIT_INTERVAL,
     CONF_DB_MAX_RETRIES,
@@ -35,6 +37,7 @@ from homeassistant.components.recorder.const import (
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     KEEPALIVE_TIME,
+    AutoPurgeMode,
     SupportedDialect,
 )
 from homeassistant.components.recorder.db_schema import (
@@ -49,6 +52,10 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsRuns,
 )
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.purge import (
+    DEFAULT_EVENTS_BATCHES_PER_PURGE,
+    DEFAULT_STATES_BATCHES_PER_PURGE,
+)
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_DISABLE,
@@ -99,6 +106,7 @@ def _default_recorder(hass):
         hass,
         auto_purge=True,
         auto_repack=True,
+        auto_purge_mode=AutoPurgeMode.NIGHTLY,
         keep_days=7,
         commit_interval=1,
         uri="sqlite://",
@@ -365,17 +373,14 @@ def test_saving_state_with_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    def _throw_if_state_pending(*args, **kwargs):
+        if get_instance(hass)._pending_rows:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
         "flush",
-        side_effect=_throw_if_state_in_session,
+        side_effect=_throw_if_state_pending,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -395,6 +400,54 @@ def test_saving_state_with_exception(
     assert "Error saving events" not in caplog.text
 
 
+def test_saving_state_retry_does_not_duplicate_rows(
+    hass_recorder: Callable[..., HomeAssistant],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a commit failing after some rows were inserted is retried cleanly."""
+    hass = hass_recorder({CONF_COMMIT_INTERVAL: 1})
+    event_session = get_instance(hass).event_session
+    execute = event_session.execute
+    states_inserts = 0
+
+    def _fail_second_states_insert_once(statement, *args, **kwargs):
+        nonlocal states_inserts
+        if getattr(statement, "is_insert", False) and (
+            statement.table is States.__table__
+        ):
+            states_inserts += 1
+            # The event and the first state are inserted by now
+            if states_inserts == 2:
+                raise OperationalError(
+                    "insert the states", "fake params", "forced to fail"
+                )
+        return execute(statement, *args, **kwargs)
+
+    with patch("time.sleep"), patch.object(
+        event_session, "execute", side_effect=_fail_second_states_insert_once
+    ):
+        hass.bus.fire("test_event", {"key": "value"})
+        hass.states.set("test.recorder", "on", {"attr": 1})
+        hass.states.set("test.recorder", "off", {"attr": 1})
+        # The first wait makes sure the rows are pending, the second commits them
+        wait_recording_done(hass)
+        wait_recording_done(hass)
+
+    assert states_inserts > 2
+    assert "Error executing query" in caplog.text
+
+    with session_scope(hass=hass, read_only=True) as session:
+        events = list(
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "test_event")
+        )
+        assert len(events) == 1
+        states = list(session.query(States).order_by(States.state_id))
+        assert [state.state for state in states] == ["on", "off"]
+        assert states[1].old_state_id == states[0].state_id
+
+
 def test_saving_state_with_sqlalchemy_exception(
     hass_recorder: Callable[..., HomeAssistant],
     hass: HomeAssistant,
@@ -407,17 +460,14 @@ def test_saving_state_with_sqlalchemy_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    def _throw_if_state_pending(*args, **kwargs):
+        if get_instance(hass)._pending_rows:
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
         "flush",
-        side_effect=_throw_if_state_in_session,
+        side_effect=_throw_if_state_pending,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -1134,6 +1184,42 @@ def test_auto_purge_no_auto_repack_on_not_second_sunday(
     dt_util.set_default_time_zone(original_tz)
 
 
+@pytest.mark.parametrize("enable_nightly_purge", [True])
+def test_auto_purge_adaptive(hass_recorder: Callable[..., HomeAssistant]) -> None:
+    """Test the adaptive purge starts at the nightly time and runs in slices."""
+    hass = hass_recorder({CONF_AUTO_PURGE_MODE: "adaptive"})
+
+    original_tz = dt_util.DEFAULT_TIME_ZONE
+
+    tz = dt_util.get_time_zone("Europe/Copenhagen")
+    dt_util.set_default_time_zone(tz)
+
+    now = dt_util.utcnow()
+    test_time = datetime(now.year + 2, 1, 1, 4, 15, 0, tzinfo=tz)
+    run_tasks_at_time(hass, test_time)
+
+    with patch(
+        "homeassistant.components.recorder.purge.purge_old_data",
+        side_effect=[False, True],
+    ) as purge_old_data, patch(
+        "homeassistant.components.recorder.tasks.periodic_db_cleanups"
+    ) as periodic_db_cleanups:
+        # Advance one day, and the purge should run in two slices
+        test_time = test_time + timedelta(days=1)
+        run_tasks_at_time(hass, test_time)
+        # The second slice is queued behind the first one
+        wait_recording_done(hass)
+        assert len(purge_old_data.mock_calls) == 2
+        # Slices purge fewer batches than the nightly purge
+        slice_kwargs = purge_old_data.mock_calls[0].kwargs
+        assert slice_kwargs["states_batch_size"] < DEFAULT_STATES_BATCHES_PER_PURGE
+        assert slice_kwargs["events_batch_size"] < DEFAULT_EVENTS_BATCHES_PER_PURGE
+        assert len(periodic_db_cleanups.mock_calls) == 1
+
+    assert not get_instance(hass).purge_scheduler.active
+    dt_util.set_default_time_zone(original_tz)
+
+
 @pytest.mark.parametrize("enable_nightly_purge", [True])
 def test_auto_purge_disabled(hass_recorder: Callable[..., HomeAssistant]) -> None:
     """Test periodic db cleanup still run when auto purge is disabled."""
@@ -1380,6 +1466,119 @@ def test_saving_sets_old_state(hass_recorder: Callable[..., HomeAssistant]) -> N
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("insert_returning", [True, False])
+def test_saving_sets_old_state_inside_commit_interval(
+    hass_recorder: Callable[..., HomeAssistant], insert_returning: bool
+) -> None:
+    """Test saving many states of an entity in one commit links the old states."""
+    hass = hass_recorder()
+    instance = get_instance(hass)
+
+    with patch.object(
+        instance.engine.dialect,
+        "insert_executemany_returning_sort_by_parameter_order",
+        insert_returning,
+    ):
+        hass.states.set("test.one", "s1", {})
+        hass.states.set("test.two", "s2", {})
+        hass.states.set("test.one", "s3", {"new": "attrs"})
+        hass.states.set("test.one", "s4", {})
+        hass.states.remove("test.two")
+        hass.bus.fire("test_event", {"new": "data"})
+        wait_recording_done(hass)
+        hass.states.set("test.one", "s5", {})
+        wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                StateAttributes.shared_attrs,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+        )
+        assert len(states) == 6
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s4"].state_id
+        assert states_by_state[None].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state[None].entity_id == "test.two"
+        assert states_by_state["s3"].shared_attrs == '{"new":"attrs"}'
+
+        events = list(
+            session.query(Events.event_id, EventData.shared_data)
+            .filter(Events.event_type_id.in_(select_event_type_ids(("test_event",))))
+            .outerjoin(EventData, Events.data_id == EventData.data_id)
+        )
+        assert len(events) == 1
+        assert events[0].shared_data == '{"new":"data"}'
+
+
+def test_saving_states_without_returning_in_batches(
+    hass_recorder: Callable[..., HomeAssistant]
+) -> None:
+    """Test states are inserted in batches when the dialect has no returning."""
+    hass = hass_recorder({"commit_interval": 30})
+    instance = get_instance(hass)
+    state_inserts: list[bool] = []
+
+    def _before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        if statement.startswith("INSERT INTO states ("):
+            state_inserts.append(executemany)
+
+    sqlalchemy_event.listen(
+        instance.engine, "before_cursor_execute", _before_cursor_execute
+    )
+    with patch.object(
+        instance.engine.dialect,
+        "insert_executemany_returning_sort_by_parameter_order",
+        False,
+    ):
+        for idx in range(10):
+            hass.states.set(f"test.entity_{idx}", "on", {})
+        for idx in range(10):
+            hass.states.set(f"test.entity_{idx}", "off", {})
+        wait_recording_done(hass)
+        hass.states.set("test.entity_0", "on", {})
+        hass.block_till_done()
+        # The commit is only queued once the recorder has the state
+        instance.block_till_done()
+        wait_recording_done(hass)
+    sqlalchemy_event.remove(
+        instance.engine, "before_cursor_execute", _before_cursor_execute
+    )
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id, States.state_id, States.old_state_id, States.state
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+    assert len(states) == 21
+    states_by_entity: dict[str, list] = {}
+    for state in sorted(states, key=lambda state: state.state_id):
+        states_by_entity.setdefault(state.entity_id, []).append(state)
+    assert len(states_by_entity) == 10
+    for entity_states in states_by_entity.values():
+        assert entity_states[0].old_state_id is None
+        for old_state, state in zip(entity_states, entity_states[1:]):
+            assert state.old_state_id == old_state.state_id
+    # One executemany per generation of the first commit
+    assert state_inserts == [True, True, False]
+
+
 def test_saving_state_with_serializable_data(
     hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
 ) -> None:
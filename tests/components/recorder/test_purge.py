@@ -27,12 +27,13 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.history import get_significant_states
 from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge_scheduler import AdaptivePurgeScheduler
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
     SERVICE_PURGE_ENTITIES,
 )
-from homeassistant.components.recorder.tasks import PurgeTask
+from homeassistant.components.recorder.tasks import AdaptivePurgeTask, PurgeTask
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED, EVENT_THEMES_UPDATED, STATE_ON
 from homeassistant.core import HomeAssistant
@@ -47,6 +48,7 @@ from .common import (
     convert_pending_states_to_meta,
 )
 
+from tests.common import async_fire_time_changed
 from tests.typing import RecorderInstanceGenerator
 
 TEST_EVENT_TYPES = (
@@ -159,6 +161,82 @@ async def test_purge_old_states(
         assert state_attributes.count() == 3
 
 
+async def test_adaptive_purge_old_states(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the adaptive purge deletes old states in slices."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    scheduler = instance.purge_scheduler
+    # Defer every slice while there is any backlog
+    scheduler.max_backlog = -1
+    with patch(
+        "homeassistant.components.recorder.tasks.periodic_db_cleanups"
+    ) as periodic_db_cleanups:
+        instance.queue_task(AdaptivePurgeTask(purge_before, repack=False))
+        await async_recorder_block_till_done(hass)
+        assert scheduler.active
+        assert scheduler.deferred_slices == 1
+        assert scheduler.rows_purged == 0
+        assert 0 < scheduler.window_remaining <= 23 * 3600
+
+        scheduler.max_backlog = 250
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+        await async_recorder_block_till_done(hass)
+        await async_wait_recording_done(hass)
+
+    assert not scheduler.active
+    assert len(periodic_db_cleanups.mock_calls) == 1
+    # 4 states and 2 state attributes
+    assert scheduler.rows_purged == 6
+    assert scheduler.slices >= 1
+    assert scheduler.last_completed is not None
+    assert scheduler.window_remaining == 0
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 2
+        assert session.query(StateAttributes).count() == 1
+
+
+def test_adaptive_purge_scheduler_slice_size() -> None:
+    """Test the adaptive purge sizes slices by run time and backlog."""
+    scheduler = AdaptivePurgeScheduler(slice_time=1, max_backlog=100)
+    assert scheduler.start(dt_util.utcnow(), repack=False)
+    assert not scheduler.start(dt_util.utcnow(), repack=False)
+
+    for _ in range(3):
+        scheduler.record_slice(0.1, 500, backlog=0)
+    assert scheduler.states_batch_size == 4
+    assert scheduler.events_batch_size == 4
+    assert scheduler.rows_purged == 1500
+    assert scheduler.rows_per_second == pytest.approx(5000)
+
+    # A busy queue keeps the slices the same size
+    scheduler.record_slice(0.1, 0, backlog=80)
+    assert scheduler.states_batch_size == 4
+
+    # A slow slice halves the next one
+    scheduler.record_slice(2, 0, backlog=0)
+    assert scheduler.states_batch_size == 2
+    assert scheduler.events_batch_size == 2
+
+    assert not scheduler.should_defer(100)
+    assert scheduler.should_defer(101)
+    assert scheduler.states_batch_size == 1
+    assert scheduler.deferred_slices == 1
+
+    # Once the window has passed the purge catches up
+    scheduler.window_end = dt_util.utcnow() - timedelta(seconds=1)
+    assert not scheduler.should_defer(1000)
+
+    scheduler.finish()
+    assert not scheduler.active
+    assert scheduler.as_dict()["rows_purged"] == 1500
+
+
 async def test_purge_old_states_encouters_database_corruption(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     hass: HomeAssistant,
@@ -7,6 +7,7 @@ from homeassistant.components.recorder import Recorder, get_instance
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 
 from .common import async_wait_recording_done
 
@@ -32,9 +33,32 @@ async def test_recorder_system_health(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "backlog": 0,
+        "average_commit_time": ANY,
+        "average_rows_per_commit": ANY,
+        "busiest_task": ANY,
     }
 
 
+async def test_recorder_system_health_adaptive_purge(
+    recorder_mock: Recorder, hass: HomeAssistant, recorder_db_url: str
+) -> None:
+    """Test recorder system health reports a running adaptive purge."""
+    if recorder_db_url.startswith(("mysql://", "postgresql://")):
+        # This test is specific for SQLite
+        return
+
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    purge_scheduler = get_instance(hass).purge_scheduler
+    purge_scheduler.start(dt_util.utcnow(), repack=False)
+    purge_scheduler.record_slice(0.5, 100, backlog=0)
+    info = await get_system_health_info(hass, "recorder")
+    purge_scheduler.finish()
+    assert info["purge_rows_per_second"] == 200.0
+    assert info["purge_window_remaining"] == "23.0 h"
+
+
 @pytest.mark.parametrize(
     "dialect_name", [SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL]
 )
@@ -58,6 +82,10 @@ async def test_recorder_system_health_alternate_dbms(
         "estimated_db_size": "1.00 MiB",
         "database_engine": dialect_name.value,
         "database_version": ANY,
+        "backlog": 0,
+        "average_commit_time": ANY,
+        "average_rows_per_commit": ANY,
+        "busiest_task": ANY,
     }
 
 
@@ -89,6 +117,10 @@ async def test_recorder_system_health_db_url_missing_host(
         "estimated_db_size": "1.00 MiB",
         "database_engine": dialect_name.value,
         "database_version": ANY,
+        "backlog": 0,
+        "average_commit_time": ANY,
+        "average_rows_per_commit": ANY,
+        "busiest_task": ANY,
     }
 
 
@@ -115,4 +147,8 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "backlog": 0,
+        "average_commit_time": ANY,
+        "average_rows_per_commit": ANY,
+        "busiest_task": ANY,
     }
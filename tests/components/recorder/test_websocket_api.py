@@ -2145,6 +2145,30 @@ async def test_recorder_info(
     }
 
 
+async def test_recorder_task_metrics(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the recorder task metrics."""
+    client = await hass_ws_client()
+
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+
+    await client.send_json({"id": 1, "type": "recorder/task_metrics"})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["backlog"] == 0
+    assert result["max_backlog"] == 65000
+    assert result["commits"] >= 1
+    assert result["rows_per_commit"]["max"] >= 1
+    assert set(result["commit_time"]) == {"average", "max", "last"}
+    event_task = result["tasks"]["EventTask"]
+    assert event_task["count"] >= 1
+    assert set(event_task["queue_time"]) == {"average", "max"}
+    assert set(event_task["run_time"]) == {"average", "max", "total"}
+
+
 async def test_recorder_info_no_recorder(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
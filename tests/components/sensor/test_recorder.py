@@ -5,7 +5,7 @@ from collections.abc import Callable
 from datetime import datetime, timedelta
 import math
 from statistics import mean
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
 from freezegun.api import FrozenDateTimeFactory
@@ -34,13 +34,23 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, SensorDeviceClass
-from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    SensorDeviceClass,
+    recorder as sensor_recorder,
+)
+from homeassistant.const import (
+    ATTR_FRIENDLY_NAME,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_STATE_CHANGED,
+    STATE_UNAVAILABLE,
+)
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component, setup_component
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import METRIC_SYSTEM, US_CUSTOMARY_SYSTEM
 
+from tests.common import async_fire_time_changed
 from tests.components.recorder.common import (
     assert_dict_of_states_equal_without_context_and_last_changed,
     assert_multiple_states_equal_without_context_and_last_changed,
@@ -5195,3 +5205,109 @@ async def test_exclude_attributes(
     assert len(states) == 1
     assert ATTR_OPTIONS not in states[0].attributes
     assert ATTR_FRIENDLY_NAME in states[0].attributes
+
+
+async def test_compile_statistics_tracker(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test statistics compiled by the tracker match the ones from the history."""
+    zero = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    zero += timedelta(hours=1)
+    freezer.move_to(zero + timedelta(minutes=1))
+    power = POWER_SENSOR_ATTRIBUTES
+    energy = {**ENERGY_SENSOR_ATTRIBUTES, "state_class": "total_increasing"}
+    total_attributes = {**ENERGY_SENSOR_ATTRIBUTES, "last_reset": zero.isoformat()}
+    hass.states.async_set("sensor.power", "1", power)
+    hass.states.async_set("sensor.energy", "10", energy)
+    hass.states.async_set("sensor.total", "5", total_attributes)
+    assert await async_setup_component(hass, "sensor", {})
+    await hass.async_block_till_done()
+    assert isinstance(
+        tracker := hass.data[sensor_recorder.STATISTICS_TRACKER],
+        sensor_recorder.StatisticsTracker,
+    )
+
+    async def _set_states(start: datetime, states: list[list[tuple]]) -> None:
+        """Set the states of each minute of the period and end it."""
+        for minute, minute_states in enumerate(states, 1):
+            freezer.move_to(start + timedelta(minutes=minute))
+            for entity_id, state, attributes in minute_states:
+                hass.states.async_set(entity_id, state, attributes)
+        freezer.move_to(start + timedelta(minutes=5))
+        async_fire_time_changed(hass, start + timedelta(minutes=5))
+        await async_wait_recording_done(hass)
+
+    async def _compile_statistics(start: datetime) -> tuple[dict, int]:
+        """Compile the statistics of the period and count the history queries."""
+        with patch.object(
+            sensor_recorder.history,
+            "get_full_significant_states_with_session",
+            wraps=history.get_full_significant_states_with_session,
+        ) as get_history:
+            compiled = await get_instance(hass).async_add_executor_job(
+                sensor_recorder.compile_statistics,
+                hass,
+                start,
+                start + timedelta(minutes=5),
+            )
+        return compiled.platform_stats, get_history.call_count
+
+    # The tracker did not observe the period it was started in
+    await _set_states(zero, [])
+    assert await _compile_statistics(zero) == (ANY, 2)
+
+    total_attributes_2 = {
+        **ENERGY_SENSOR_ATTRIBUTES,
+        "last_reset": (zero + timedelta(minutes=7)).isoformat(),
+    }
+    period_states: list[list[list[tuple]]] = [
+        [
+            [("sensor.power", "3", power), ("sensor.energy", "12", energy)],
+            [
+                # Attribute changes are not significant
+                ("sensor.power", "3", {**power, "extra": 1}),
+                ("sensor.energy", "11.5", energy),
+                ("sensor.total", "1", total_attributes_2),
+            ],
+            [
+                ("sensor.power", STATE_UNAVAILABLE, power),
+                ("sensor.energy", "1", energy),
+                ("sensor.total", "3", total_attributes_2),
+            ],
+            [("sensor.power", "2", power), ("sensor.energy", "4", energy)],
+        ],
+        [
+            [("sensor.power", "-1.5", power), ("sensor.energy", "6", energy)],
+            [("sensor.energy", "7", energy), ("sensor.total", "4", total_attributes)],
+            [("sensor.power", "8", power), ("sensor.energy", "0.5", energy)],
+            [],
+        ],
+    ]
+    for period, states in enumerate(period_states, 1):
+        start = zero + timedelta(minutes=5 * period)
+        await _set_states(start, states)
+        tracked_stats, history_queries = await _compile_statistics(start)
+        assert history_queries == 0
+        assert {stat["meta"]["statistic_id"] for stat in tracked_stats} == {
+            "sensor.power",
+            "sensor.energy",
+            "sensor.total",
+        }
+        assert await _compile_statistics(start) == (tracked_stats, 2)
+        # Save the statistics so the next period continues the sums
+        do_adhoc_statistics(hass, start=start)
+        await async_wait_recording_done(hass)
+
+    hass.states.async_remove("sensor.power")
+    await hass.async_block_till_done()
+    # pylint: disable-next=protected-access
+    assert "sensor.power" in tracker._accumulators
+    async_fire_time_changed(hass, zero + timedelta(minutes=20))
+    # pylint: disable-next=protected-access
+    assert "sensor.power" not in tracker._accumulators
+
+    # The tracker stops when the recorder shuts down
+    listeners = hass.bus.async_listeners()[EVENT_STATE_CHANGED]
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners - 1
@@ -38,7 +38,7 @@ def _find_traces(traces, trace_type, item_id):
 
 
 async def _setup_automation_or_script(
-    hass, domain, configs, script_config=None, stored_traces=None
+    hass, domain, configs, script_config=None, stored_traces=None, trace_config=None
 ):
     """Set up automations or scripts from automation config."""
     if domain == "script":
@@ -62,6 +62,10 @@ async def _setup_automation_or_script(
                 config["trace"] = {}
                 config["trace"]["stored_traces"] = stored_traces
 
+    if trace_config is not None:
+        for config in configs.values() if domain == "script" else configs:
+            config["trace"] = {**config.get("trace", {}), **trace_config}
+
     assert await async_setup_component(hass, domain, {domain: configs})
 
 
@@ -587,6 +591,58 @@ async def test_trace_overflow(
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+@pytest.mark.parametrize("lazy_variables", [False, True])
+async def test_trace_lazy_variables(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain: str,
+    lazy_variables: bool,
+) -> None:
+    """Test the changed variables are the same when compared lazily."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [
+            {"variables": {"x": 1}},
+            {"event": "some_event"},
+            {"variables": {"x": 1, "y": 2}},
+            {"event": "some_event"},
+        ],
+    }
+    await _setup_automation_or_script(
+        hass,
+        domain,
+        [sun_config],
+        trace_config={"lazy_variables": lazy_variables},
+    )
+    client = await hass_ws_client()
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    run_id = _find_run_id(response["result"], domain, "sun")
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "trace/get",
+            "domain": domain,
+            "item_id": "sun",
+            "run_id": run_id,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    trace = response["result"]["trace"]
+
+    prefix = "action" if domain == "automation" else "sequence"
+    assert trace[f"{prefix}/1"][0]["changed_variables"] == {"x": 1}
+    assert "changed_variables" not in trace[f"{prefix}/2"][0]
+    assert trace[f"{prefix}/3"][0]["changed_variables"] == {"y": 2}
+
+
 @pytest.mark.parametrize(
     ("domain", "num_restored_moon_traces"), [("automation", 3), ("script", 1)]
 )
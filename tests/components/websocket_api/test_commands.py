@@ -14,7 +14,7 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity
@@ -1065,6 +1065,54 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_shared_listener(
+    hass: HomeAssistant, websocket_client, hass_admin_user: MockUser
+) -> None:
+    """Test subscriptions share a listener and follow permission changes."""
+    init_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy(
+        {"entities": {"entity_ids": {"light.one": True, "light.two": True}}}
+    )
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    await websocket_client.send_json(
+        {"id": 8, "type": "subscribe_entities", "entity_ids": ["light.two"]}
+    )
+    for _ in range(4):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] in (7, 8)
+
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == init_count + 1
+
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.two", "on")
+    received = [await websocket_client.receive_json() for _ in range(3)]
+    assert [(msg["id"], *msg["event"]["a"]) for msg in received] == [
+        (7, "light.one"),
+        (7, "light.two"),
+        (8, "light.two"),
+    ]
+
+    # Changing the policy replaces the permissions of the user
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.one": True}}})
+    hass.states.async_set("light.two", "off")
+    hass.states.async_set("light.one", "off")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"]["c"] == {"light.one": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+
+    for msg_id, subscription in ((9, 7), (10, 8)):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "unsubscribe_events", "subscription": subscription}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == init_count
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
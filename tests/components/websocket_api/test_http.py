@@ -13,12 +13,20 @@ from homeassistant.components.websocket_api import (
     http,
     websocket_command,
 )
+from homeassistant.components.websocket_api.auth import (
+    TYPE_AUTH,
+    TYPE_AUTH_OK,
+    TYPE_AUTH_REQUIRED,
+)
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
 from tests.typing import (
+    ClientSessionGenerator,
     MockHAClientWebSocket,
     WebSocketGenerator,
 )
@@ -506,3 +514,114 @@ async def test_binary_message(
     assert "Received binary message for non-existing handler 0" in caplog.text
     assert "Received binary message for non-existing handler 3" in caplog.text
     assert "Received binary message for non-existing handler 10" in caplog.text
+
+
+async def test_large_messages_compressed(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    hass_access_token: str,
+) -> None:
+    """Test only large messages are compressed when compression is negotiated."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    for idx in range(50):
+        hass.states.async_set(f"light.kitchen_{idx}", "on", {"brightness": 255})
+    client = await hass_client_no_auth()
+
+    async with client.ws_connect(const.URL, compress=15) as websocket_client:
+        assert websocket_client.compress == 15
+        msg = await websocket_client.receive_json()
+        assert msg["type"] == TYPE_AUTH_REQUIRED
+        await websocket_client.send_json(
+            {"type": TYPE_AUTH, "access_token": hass_access_token}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["type"] == TYPE_AUTH_OK
+
+        await websocket_client.send_json({"id": 1, "type": "ping"})
+        msg = await websocket_client.receive_json()
+        assert msg["type"] == "pong"
+
+        await websocket_client.send_json({"id": 2, "type": "get_states"})
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 2
+        assert len(msg["result"]) == 50
+
+        await websocket_client.send_json({"id": 3, "type": "send_stats"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["success"]
+    stats = msg["result"]
+    assert stats["large_message_size"] == const.DEFAULT_LARGE_MESSAGE_SIZE
+    assert stats["messages"] == 4
+    assert stats["large_messages"] == 1
+    assert stats["binary_messages"] == 0
+    assert stats["compressed_messages"] == 1
+    assert 0 < stats["compressed_bytes"] < stats["uncompressed_bytes"]
+    assert stats["saved_bytes"] > 0
+    assert stats["compression_ratio"] < 1
+    assert stats["compress_time_ms"] > 0
+
+
+async def test_binary_large_messages(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test large messages are sent as binary frames when supported."""
+    assert await async_setup_component(
+        hass, "websocket_api", {"websocket_api": {"large_message_size": 100}}
+    )
+    for idx in range(5):
+        hass.states.async_set(f"light.kitchen_{idx}", "on")
+    websocket_client = await hass_ws_client(hass)
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_BINARY_LARGE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    await websocket_client.send_json({"id": 2, "type": "ping"})
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.TEXT
+    assert json_loads(msg.data)["type"] == "pong"
+
+    await websocket_client.send_json({"id": 3, "type": "get_states"})
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.BINARY
+    result = json_loads(msg.data)
+    assert result["id"] == 3
+    assert len(result["result"]) == 5
+
+    await websocket_client.send_json({"id": 4, "type": "send_stats"})
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.BINARY
+    stats = json_loads(msg.data)["result"]
+    assert stats["large_message_size"] == 100
+    assert stats["large_messages"] == 1
+    assert stats["binary_messages"] == 1
+    assert stats["compressed_messages"] == 0
+
+
+def test_send_stats_sampling() -> None:
+    """Test the compression of sampled messages is used for the estimates."""
+    send_stats = http.WebSocketSendStats()
+    assert send_stats.as_dict()["compression_ratio"] is None
+
+    data = b'{"state": "on"}' * 100
+    for _ in range(const.SEND_STATS_SAMPLE_INTERVAL + 1):
+        send_stats.record_compressed(data, 15)
+
+    stats = send_stats.as_dict()
+    assert stats["compressed_messages"] == const.SEND_STATS_SAMPLE_INTERVAL + 1
+    assert stats["sampled_messages"] == 2
+    assert stats["uncompressed_bytes"] == len(data) * stats["compressed_messages"]
+    assert stats["compression_ratio"] == round(
+        send_stats.sampled_compressed_bytes / send_stats.sampled_bytes, 3
+    )
+    assert 0 < stats["compressed_bytes"] < stats["uncompressed_bytes"]
+    assert stats["saved_bytes"] == (
+        stats["uncompressed_bytes"] - stats["compressed_bytes"]
+    )
@@ -7,9 +7,17 @@ from unittest.mock import ANY, Mock, patch
 
 import pytest
 
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE
-from homeassistant.core import CoreState, HomeAssistant, callback
-from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_STATE_CHANGED,
+    PERCENTAGE,
+)
+from homeassistant.core import Context, CoreState, HomeAssistant, callback
+from homeassistant.exceptions import (
+    HomeAssistantError,
+    NoEntitySpecifiedError,
+    PlatformNotReady,
+)
 from homeassistant.helpers import (
     device_registry as dr,
     entity_platform,
@@ -33,6 +41,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockPlatform,
+    async_capture_events,
     async_fire_time_changed,
     mock_entity_platform,
     mock_registry,
@@ -551,6 +560,86 @@ async def test_async_remove_with_platform(hass: HomeAssistant) -> None:
     assert len(hass.states.async_entity_ids()) == 0
 
 
+async def test_async_write_ha_states(hass: HomeAssistant) -> None:
+    """Test writing the state of multiple entities in a batch."""
+    platform = MockEntityPlatform(hass)
+    entity1 = MockEntity(name="test_1", state="on")
+    entity2 = MockEntity(name="test_2", state="on")
+    entity3 = MockEntity(name="test_3", state="on")
+    await platform.async_add_entities([entity1, entity2, entity3])
+
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    context = Context()
+    entity3.async_set_context(context)
+    for entity in (entity1, entity2, entity3):
+        entity._values["state"] = "off"
+    platform.async_write_ha_states([entity1, entity2, entity3])
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == [
+        "test_domain.test_1",
+        "test_domain.test_2",
+        "test_domain.test_3",
+    ]
+    assert all(event.data["new_state"].state == "off" for event in events)
+    # Entities without a context share the context and timestamp of the batch
+    assert events[0].context is events[1].context
+    assert events[0].time_fired == events[1].time_fired
+    assert events[2].context is context
+
+    # Unchanged entities are not written
+    platform.async_write_ha_states([entity1, entity2])
+    await hass.async_block_till_done()
+    assert len(events) == 3
+
+    # Removed entities are skipped
+    await entity2.async_remove()
+    await hass.async_block_till_done()
+    entity1._values["state"] = "on"
+    entity2._values["state"] = "on"
+    platform.async_write_ha_states([entity1, entity2])
+    await hass.async_block_till_done()
+    assert len(events) == 5
+    assert events[-1].data["entity_id"] == "test_domain.test_1"
+    assert hass.states.get("test_domain.test_2") is None
+
+
+async def test_async_write_ha_states_errors(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test errors of single entities when writing states in a batch."""
+
+    class FailingEntity(MockEntity):
+        """Entity which fails to calculate its state."""
+
+        @property
+        def state(self):
+            """Raise an error."""
+            raise ValueError("Bad state")
+
+    platform = MockEntityPlatform(hass)
+    entity1 = MockEntity(name="test_1", state="on")
+    entity2 = MockEntity(name="test_2", state="on")
+    await platform.async_add_entities([entity1, entity2])
+    entity1._values["state"] = "off"
+    entity2._values["state"] = "off"
+
+    # Nothing is calculated if an entity is not writable
+    no_entity_id = MockEntity()
+    no_entity_id.hass = hass
+    with pytest.raises(NoEntitySpecifiedError):
+        platform.async_write_ha_states([entity1, no_entity_id])
+    assert hass.states.get("test_domain.test_1").state == "on"
+
+    # An entity whose state fails to calculate does not stop the others
+    failing = FailingEntity(entity_id="test_domain.failing")
+    failing.hass = hass
+    platform.async_write_ha_states([entity1, failing, entity2])
+    assert hass.states.get("test_domain.test_1").state == "off"
+    assert hass.states.get("test_domain.test_2").state == "off"
+    assert "Error calculating the state of test_domain.failing" in caplog.text
+
+
 async def test_async_remove_with_platform_update_finishes(hass: HomeAssistant) -> None:
     """Remove an entity when an update finishes after its been removed."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
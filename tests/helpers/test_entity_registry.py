@@ -1468,6 +1468,56 @@ def test_entity_registry_items() -> None:
     assert entities.get_entry(entry2.id) is None
 
 
+def test_entity_registry_items_secondary_indexes() -> None:
+    """Test the config entry, device and area indexes of EntityRegistryItems."""
+    entities = er.EntityRegistryItems()
+    entry1 = er.RegistryEntry(
+        "test.entity1",
+        "1234",
+        "hue",
+        area_id="kitchen",
+        config_entry_id="entry_a",
+        device_id="device_1",
+    )
+    entry2 = er.RegistryEntry(
+        "test.entity2",
+        "2345",
+        "hue",
+        config_entry_id="entry_a",
+        device_id="device_1",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    entities["test.entity1"] = entry1
+    entities["test.entity2"] = entry2
+
+    assert entities.get_entries_for_config_entry_id("entry_a") == [entry1, entry2]
+    assert entities.get_entries_for_device_id("device_1") == [entry1]
+    assert entities.get_entries_for_device_id("device_1", True) == [entry1, entry2]
+    assert entities.get_entries_for_area_id("kitchen") == [entry1]
+    assert entities.get_entries_for_area_id("unknown") == []
+
+    updated_entry1 = attr.evolve(
+        entry1, area_id="bedroom", config_entry_id=None, device_id="device_2"
+    )
+    entities["test.entity1"] = updated_entry1
+
+    assert entities.get_entries_for_config_entry_id("entry_a") == [entry2]
+    assert entities.get_entries_for_device_id("device_1", True) == [entry2]
+    assert entities.get_entries_for_device_id("device_2") == [updated_entry1]
+    assert entities.get_entries_for_area_id("kitchen") == []
+    assert entities.get_entries_for_area_id("bedroom") == [updated_entry1]
+
+    del entities["test.entity1"]
+    del entities["test.entity2"]
+
+    assert entities.get_entries_for_config_entry_id("entry_a") == []
+    assert entities.get_entries_for_device_id("device_2") == []
+    assert entities.get_entries_for_area_id("bedroom") == []
+    assert not entities._config_entry_id_index
+    assert not entities._device_id_index
+    assert not entities._area_id_index
+
+
 async def test_disabled_by_str_not_allowed(hass: HomeAssistant) -> None:
     """Test we need to pass disabled by type."""
     reg = er.async_get(hass)
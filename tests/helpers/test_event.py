@@ -21,10 +21,14 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    SHARED_TEMPLATE_RENDERS,
+    TRACK_STATE_CHANGE_STATS,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_enable_state_change_dispatch_stats,
+    async_get_state_change_dispatch_diagnostics,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -428,6 +432,74 @@ async def test_async_track_state_change_filtered(hass: HomeAssistant) -> None:
     track_throws.async_remove()
 
 
+async def test_async_track_state_change_event_dispatch_diagnostics(
+    hass: HomeAssistant,
+) -> None:
+    """Test batched dispatch of state changes and its diagnostics."""
+    calls = []
+
+    @ha.callback
+    def callback_listener(event):
+        calls.append(("callback", event.data["entity_id"]))
+
+    async def coroutine_listener(event):
+        calls.append(("coroutine", event.data["entity_id"]))
+
+    unsub_callback = async_track_state_change_event(
+        hass, ["light.bowl", "light.top"], callback_listener
+    )
+    unsub_coroutine = async_track_state_change_event(
+        hass, "light.bowl", coroutine_listener
+    )
+
+    hass.states.async_set("light.bowl", "on")
+    await hass.async_block_till_done()
+    assert calls == [("callback", "light.bowl"), ("coroutine", "light.bowl")]
+
+    # Dispatches are not timed unless the stats are enabled
+    assert TRACK_STATE_CHANGE_STATS not in hass.data
+    assert (
+        async_get_state_change_dispatch_diagnostics(hass)["light.bowl"]["dispatches"]
+        == 0
+    )
+    disable_stats = async_enable_state_change_dispatch_stats(hass)
+    hass.states.async_set("light.bowl", "off")
+    await hass.async_block_till_done()
+
+    # Adding a listener updates the cached listeners of the entity
+    calls.clear()
+    unsub_second = async_track_state_change_event(hass, "light.bowl", callback_listener)
+    hass.states.async_set("light.bowl", "on")
+    await hass.async_block_till_done()
+    assert calls == [
+        ("callback", "light.bowl"),
+        ("callback", "light.bowl"),
+        ("coroutine", "light.bowl"),
+    ]
+
+    diagnostics = async_get_state_change_dispatch_diagnostics(hass)
+    assert diagnostics["light.bowl"]["listeners"] == 3
+    assert diagnostics["light.bowl"]["callbacks"] == 2
+    assert diagnostics["light.bowl"]["dispatches"] == 2
+    assert diagnostics["light.bowl"]["dispatch_time"]["max"] >= 0
+    assert diagnostics["light.top"]["dispatches"] == 0
+
+    # Removing a listener updates the cached listeners of the entity
+    calls.clear()
+    unsub_second()
+    unsub_coroutine()
+    hass.states.async_set("light.bowl", "off")
+    await hass.async_block_till_done()
+    assert calls == [("callback", "light.bowl")]
+
+    unsub_callback()
+    assert async_get_state_change_dispatch_diagnostics(hass) == {}
+    assert "light.bowl" not in hass.data[TRACK_STATE_CHANGE_STATS]
+
+    disable_stats()
+    assert TRACK_STATE_CHANGE_STATS not in hass.data
+
+
 async def test_async_track_state_change_event(hass: HomeAssistant) -> None:
     """Test async_track_state_change_event."""
     single_entity_id_tracker = []
@@ -1038,6 +1110,96 @@ async def test_track_template_result(hass: HomeAssistant) -> None:
     assert len(wildercard_runs) == 4
 
 
+async def test_track_template_result_shared_renders(hass: HomeAssistant) -> None:
+    """Test identical templates are only rendered once per event."""
+    runs = []
+    var_runs = []
+
+    @ha.callback
+    def run_callback(event, updates):
+        runs.append(updates.pop().result)
+
+    @ha.callback
+    def var_run_callback(event, updates):
+        var_runs.append(updates.pop().result)
+
+    for _ in range(3):
+        async_track_template_result(
+            hass,
+            [TrackTemplate(Template("{{ states('sensor.test') }}", hass), None)],
+            run_callback,
+        )
+    async_track_template_result(
+        hass,
+        [
+            TrackTemplate(
+                Template("{{ states('sensor.test') ~ suffix }}", hass),
+                {"suffix": "a"},
+            )
+        ],
+        var_run_callback,
+    )
+    async_track_template_result(
+        hass,
+        [
+            TrackTemplate(
+                Template("{{ states('sensor.test') ~ suffix }}", hass),
+                {"suffix": "b"},
+            )
+        ],
+        var_run_callback,
+    )
+    await hass.async_block_till_done()
+    shared = hass.data[SHARED_TEMPLATE_RENDERS]
+    assert shared.renders == 0
+    assert shared.saved_renders == 0
+
+    hass.states.async_set("sensor.test", "on")
+    await hass.async_block_till_done()
+
+    assert runs == ["on", "on", "on"]
+    assert sorted(var_runs) == ["ona", "onb"]
+    assert shared.renders == 3
+    assert shared.saved_renders == 2
+
+    hass.states.async_set("sensor.test", "off")
+    await hass.async_block_till_done()
+
+    assert runs == ["on", "on", "on", "off", "off", "off"]
+    assert shared.renders == 6
+    assert shared.saved_renders == 4
+
+
+async def test_track_template_result_shared_renders_variable_types(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates with equal variables of different types are not shared."""
+    runs = []
+
+    @ha.callback
+    def run_callback(event, updates):
+        runs.append(updates.pop().result)
+
+    for value in (1, True, 1.0):
+        async_track_template_result(
+            hass,
+            [
+                TrackTemplate(
+                    Template("{{ states('sensor.test') ~ value }}", hass),
+                    {"value": value},
+                )
+            ],
+            run_callback,
+        )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.test", "on")
+    await hass.async_block_till_done()
+
+    assert sorted(runs) == ["on1", "on1.0", "onTrue"]
+    assert hass.data[SHARED_TEMPLATE_RENDERS].saved_renders == 0
+
+
 async def test_track_template_result_none(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
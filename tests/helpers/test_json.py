@@ -20,6 +20,7 @@ from homeassistant.helpers.json import (
     json_dumps,
     json_dumps_sorted,
     save_json,
+    save_json_chunked,
 )
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
@@ -185,6 +186,75 @@ def test_overwrite_and_reload(atomic_writes: bool, tmp_path: Path) -> None:
     assert data == TEST_JSON_B
 
 
+@pytest.mark.parametrize("atomic_writes", [True, False])
+@pytest.mark.parametrize(
+    "data",
+    [
+        TEST_JSON_A,
+        [],
+        {},
+        {
+            "version": 1,
+            "key": "test",
+            "data": {
+                "entities": [
+                    {"id": 1, "options": {"nested": [1, {"deep": ["é"]}]}},
+                    {},
+                ],
+                "deleted": [],
+                "set": {1},
+                "int_keys": {1: "a"},
+                "time": datetime.datetime(2023, 1, 1, tzinfo=dt_util.UTC),
+            },
+        },
+    ],
+)
+def test_save_json_chunked(atomic_writes: bool, data: dict, tmp_path: Path) -> None:
+    """Test saving in chunks writes the same file as saving in one go."""
+    fname = tmp_path / "chunked.json"
+    save_json_chunked(fname, data, atomic_writes=atomic_writes)
+    expected = tmp_path / "expected.json"
+    save_json(expected, data)
+    assert fname.read_bytes() == expected.read_bytes()
+
+
+@pytest.mark.parametrize("atomic_writes", [True, False])
+def test_save_json_chunked_non_str_keys(atomic_writes: bool, tmp_path: Path) -> None:
+    """Test saving in chunks writes non string keys the same as saving in one go."""
+    data = {
+        "keys": {
+            True: "bool",
+            None: "none",
+            2: "int",
+            1.5: "float",
+            datetime.datetime(2023, 1, 1, tzinfo=dt_util.UTC): "datetime",
+            datetime.date(2023, 1, 2): "date",
+            "str": "str",
+        },
+        False: {None: [1]},
+    }
+    fname = tmp_path / "chunked.json"
+    save_json_chunked(fname, data, atomic_writes=atomic_writes)
+    expected = tmp_path / "expected.json"
+    save_json(expected, data)
+    assert fname.read_bytes() == expected.read_bytes()
+    assert load_json(fname)["keys"]["true"] == "bool"
+
+
+def test_save_json_chunked_bad_data(tmp_path: Path) -> None:
+    """Test error from trying to save unserializable data in chunks."""
+
+    class CannotSerializeMe:
+        """Cannot serialize this."""
+
+    fname = tmp_path / "test4"
+    with pytest.raises(SerializationError) as excinfo:
+        save_json_chunked(fname, {"hello": {"there": CannotSerializeMe()}})
+
+    assert "Bad data at $.hello.there=" in str(excinfo.value)
+    assert not os.listdir(tmp_path)
+
+
 def test_save_bad_data() -> None:
     """Test error from trying to save unserializable data."""
 
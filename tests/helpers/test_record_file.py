@@ -0,0 +1,85 @@
+"""Test the record file helper."""
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import record_file
+from homeassistant.util.json import SerializationError
+
+
+def test_save_and_load_records(tmp_path) -> None:
+    """Test a list is saved as records which are decoded when accessed."""
+    fname = tmp_path / "test.storage"
+    data = {"version": 1, "key": "test", "data": [{"id": "a"}, {"id": "b"}]}
+
+    record_file.save_records(str(fname), data, record_key=lambda item: item["id"])
+
+    loaded = record_file.load_file(fname)
+    records = loaded.pop("data")
+    assert loaded == {"version": 1, "key": "test"}
+    assert isinstance(records, record_file.LazyRecords)
+    assert records.keys() == ["a", "b"]
+    assert len(records) == 2
+    assert records[-1] == {"id": "b"}
+    assert records[-1] is records[1]
+    assert records[:1] == [{"id": "a"}]
+    assert list(records) == [{"id": "a"}, {"id": "b"}]
+
+
+@pytest.mark.parametrize("atomic_writes", [False, True])
+def test_save_and_load_value(tmp_path, atomic_writes: bool) -> None:
+    """Test data which is not a list is saved as a single record."""
+    fname = tmp_path / "test.storage"
+    data = {"version": 1, "key": "test", "data": {"entities": [{"id": "a"}]}}
+
+    record_file.save_records(str(fname), data, atomic_writes=atomic_writes)
+
+    assert record_file.load_file(fname) == data
+
+
+def test_save_bad_data(tmp_path) -> None:
+    """Test saving data which can not be serialized."""
+    with pytest.raises(SerializationError):
+        record_file.save_records(
+            str(tmp_path / "test.storage"), {"version": 1, "data": [object()]}
+        )
+
+
+def test_load_bad_file(tmp_path) -> None:
+    """Test loading a file which is not a valid record file."""
+    fname = tmp_path / "test.storage"
+    fname.write_text('{"version": 1}')
+    with pytest.raises(HomeAssistantError):
+        record_file.parse_records(fname.read_bytes())
+
+    record_file.save_records(str(fname), {"version": 1, "data": [1, 2]})
+    fname.write_bytes(fname.read_bytes()[:-1])
+    with pytest.raises(HomeAssistantError):
+        record_file.load_file(fname)
+
+
+def test_load_file(tmp_path) -> None:
+    """Test loading a record file or a JSON file with a single open."""
+    fname = tmp_path / "test.storage"
+    data = {"version": 1, "key": "test", "data": {"id": "a"}}
+
+    assert record_file.load_file(fname) == {}
+
+    fname.write_text('{"version": 1, "key": "test", "data": {"id": "a"}}')
+    with patch("builtins.open", side_effect=open) as mock_open:
+        assert record_file.load_file(fname) == data
+    assert mock_open.call_count == 1
+
+    record_file.save_records(str(fname), data)
+    with patch("builtins.open", side_effect=open) as mock_open:
+        assert record_file.load_file(fname) == data
+    assert mock_open.call_count == 1
+
+    fname.write_text("not json")
+    with pytest.raises(HomeAssistantError):
+        record_file.load_file(fname)
+
+    fname.write_bytes(record_file.MAGIC + b"\x02")
+    with pytest.raises(HomeAssistantError):
+        record_file.load_file(fname)
@@ -1,5 +1,6 @@
 """The tests for the Restore component."""
 from collections.abc import Coroutine
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
 from typing import Any
@@ -16,7 +17,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    JOURNAL_STORAGE_KEY,
     STORAGE_KEY,
+    ExtraStoredData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -124,6 +127,9 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    data.async_restore_entity_added(entity)
+    hass.states.async_set("input_boolean.b1", "on")
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -132,6 +138,8 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "off")
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -190,6 +198,9 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    data.async_restore_entity_added(entity)
+    hass.states.async_set("input_boolean.b1", "on")
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -198,6 +209,8 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     # Verify still saving
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "off")
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -334,6 +347,158 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert written_states[1]["state"]["state"] == "off"
 
 
+async def test_dump_journal(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test only changed states are written to the journal and replayed."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    entity_2 = RestoreEntity()
+    entity_2.hass = hass
+    entity_2.entity_id = "input_boolean.b2"
+    entity_3 = RestoreEntity()
+    entity_3.hass = hass
+    entity_3.entity_id = "input_boolean.b3"
+    await platform.async_add_entities([entity, entity_2, entity_3])
+
+    data = async_get(hass)
+    data.async_setup_dump()
+    await hass.async_block_till_done()
+
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 3
+    assert JOURNAL_STORAGE_KEY not in hass_storage
+
+    # Nothing changed, nothing is written
+    await data.async_dump_journal()
+    assert JOURNAL_STORAGE_KEY not in hass_storage
+
+    hass.states.async_set("input_boolean.b1", "on")
+    await data.async_dump_journal()
+
+    journal = hass_storage[JOURNAL_STORAGE_KEY]["data"]
+    assert len(journal) == 1
+    assert journal[0]["state"]["entity_id"] == "input_boolean.b1"
+    assert journal[0]["state"]["state"] == "on"
+    assert hass_storage[STORAGE_KEY]["data"][0]["state"]["state"] == "unknown"
+
+    # Replay the journal on top of the full dump
+    restored_data = RestoreStateData(hass)
+    await restored_data.async_load()
+    assert restored_data.last_states["input_boolean.b1"].state.state == "on"
+    assert restored_data.last_states["input_boolean.b2"].state.state == "unknown"
+
+    hass.states.async_set("input_boolean.b2", "on")
+    await data.async_dump_journal()
+    assert len(hass_storage[JOURNAL_STORAGE_KEY]["data"]) == 2
+
+    # All states are written once the journal holds the states
+    # of more than half of the entities
+    hass.states.async_set("input_boolean.b3", "on")
+    await data.async_dump_journal()
+
+    assert JOURNAL_STORAGE_KEY not in hass_storage
+    written_states = {
+        item["state"]["entity_id"]: item["state"]["state"]
+        for item in hass_storage[STORAGE_KEY]["data"]
+    }
+    assert written_states == {
+        "input_boolean.b1": "on",
+        "input_boolean.b2": "on",
+        "input_boolean.b3": "on",
+    }
+
+
+async def test_dump_error_keeps_changes(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test changes are written to the journal after a failed full dump."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    entity_2 = RestoreEntity()
+    entity_2.hass = hass
+    entity_2.entity_id = "input_boolean.b2"
+    entity_3 = RestoreEntity()
+    entity_3.hass = hass
+    entity_3.entity_id = "input_boolean.b3"
+    await platform.async_add_entities([entity, entity_2, entity_3])
+
+    data = async_get(hass)
+    data.async_setup_dump()
+    await hass.async_block_till_done()
+
+    hass.states.async_set("input_boolean.b1", "on")
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save",
+        side_effect=HomeAssistantError,
+    ):
+        await data.async_dump_states()
+
+    await data.async_dump_journal()
+    journal = hass_storage[JOURNAL_STORAGE_KEY]["data"]
+    assert len(journal) == 1
+    assert journal[0]["state"]["entity_id"] == "input_boolean.b1"
+    assert journal[0]["state"]["state"] == "on"
+
+
+@dataclass
+class MockExtraData(ExtraStoredData):
+    """Extra data which compares by value."""
+
+    value: int
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the extra data."""
+        return {"value": self.value}
+
+
+class MockExtraDataEntity(RestoreEntity):
+    """Entity with extra data to restore."""
+
+    value = 1
+
+    @property
+    def extra_restore_state_data(self) -> MockExtraData:
+        """Return the extra data."""
+        return MockExtraData(self.value)
+
+
+async def test_dump_journal_extra_data(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test extra data is only converted to a dict when it changed."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for number in range(3):
+        entity = MockExtraDataEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{number}"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+
+    data = async_get(hass)
+    data.async_setup_dump()
+    await hass.async_block_till_done()
+
+    with patch.object(
+        MockExtraData, "as_dict", autospec=True, side_effect=MockExtraData.as_dict
+    ) as mock_as_dict:
+        await data.async_dump_journal()
+        assert not mock_as_dict.called
+        assert JOURNAL_STORAGE_KEY not in hass_storage
+
+        entities[0].value = 2
+        await data.async_dump_journal()
+
+    # Once to compare with the last written dict and once to write it
+    assert mock_as_dict.call_count == 2
+    journal = hass_storage[JOURNAL_STORAGE_KEY]["data"]
+    assert len(journal) == 1
+    assert journal[0]["state"]["entity_id"] == "input_boolean.b0"
+    assert journal[0]["extra_data"] == {"value": 2}
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -13,7 +13,7 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
 )
 from homeassistant.core import CoreState, HomeAssistant
-from homeassistant.helpers import storage
+from homeassistant.helpers import record_file, storage
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -548,3 +548,107 @@ async def test_saving_load_round_trip(tmpdir: py.path.local) -> None:
     }
 
     await hass.async_stop(force=True)
+
+
+async def test_chunked_writes(tmpdir: py.path.local) -> None:
+    """Test a store with chunked writes writes the same file and records timings."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    data = {"entities": [{"id": 1, "set": {1, 2}}, {"id": 2}], "deleted": []}
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+    await store.async_save(data)
+    expected = await hass.async_add_executor_job(
+        (tmpdir / "temp_storage" / ".storage" / MOCK_KEY).read_binary
+    )
+
+    chunked_store = storage.Store(
+        hass, MOCK_VERSION, "storage-test-chunked", chunked_writes=True
+    )
+    chunked_store.async_delay_save(lambda: data, 1)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    written = await hass.async_add_executor_job(
+        (tmpdir / "temp_storage" / ".storage" / "storage-test-chunked").read_binary
+    )
+    assert written == expected.replace(
+        b'"key": "storage-test"', b'"key": "storage-test-chunked"'
+    )
+    assert await chunked_store.async_load() == {
+        "entities": [{"id": 1, "set": [1, 2]}, {"id": 2}],
+        "deleted": [],
+    }
+
+    timings = storage.async_get_write_timings(hass)
+    assert timings[MOCK_KEY].writes == 1
+    timing = timings["storage-test-chunked"]
+    assert timing.writes == 1
+    assert timing.total_time == timing.last_time == timing.max_time > 0
+
+    await hass.async_stop(force=True)
+
+
+async def test_binary_format(tmpdir: py.path.local) -> None:
+    """Test a store in the binary format migrates JSON and loads records lazily."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    path = tmpdir / "temp_storage" / ".storage" / MOCK_KEY
+    data = [{"id": "a", "set": {1}}, {"id": "b"}]
+
+    # A JSON file is loaded and written as a record file on the next save
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+    await store.async_save(data)
+    binary_store = storage.Store(
+        hass,
+        MOCK_VERSION,
+        MOCK_KEY,
+        binary_format=True,
+        record_key=lambda item: item["id"],
+    )
+    assert await binary_store.async_load() == [{"id": "a", "set": [1]}, {"id": "b"}]
+    await binary_store.async_save(data)
+    assert (await hass.async_add_executor_job(path.read_binary)).startswith(
+        record_file.MAGIC
+    )
+
+    loaded = await binary_store.async_load()
+    assert isinstance(loaded, record_file.LazyRecords)
+    assert loaded.keys() == ["a", "b"]
+    assert loaded[1] == {"id": "b"}
+    assert list(loaded) == [{"id": "a", "set": [1]}, {"id": "b"}]
+
+    # A store without the binary format still loads the record file
+    assert list(await store.async_load()) == [{"id": "a", "set": [1]}, {"id": "b"}]
+
+    await hass.async_stop(force=True)
+
+
+async def test_binary_format_migration(tmpdir: py.path.local) -> None:
+    """Test migrating a store in the binary format."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+    await storage.Store(hass, MOCK_VERSION, MOCK_KEY, binary_format=True).async_save(
+        [1, 2]
+    )
+
+    class MigratingStore(storage.Store):
+        async def _async_migrate_func(self, old_major, old_minor, old_data):
+            assert old_data == [1, 2]
+            return [*old_data, 3]
+
+    store = MigratingStore(hass, MOCK_VERSION_2, MOCK_KEY, binary_format=True)
+    assert await store.async_load() == [1, 2, 3]
+
+    await hass.async_stop(force=True)
@@ -11,6 +11,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from lru import LRU  # pylint: disable=no-name-in-module
 import orjson
 import pytest
 import voluptuous as vol
@@ -19,6 +20,7 @@ from homeassistant.components import group
 from homeassistant.config import async_process_ha_core_config
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STARTED,
     LENGTH_METERS,
     LENGTH_MILLIMETERS,
     MASS_GRAMS,
@@ -28,6 +30,7 @@ from homeassistant.const import (
     VOLUME_LITERS,
     UnitOfPressure,
     UnitOfSpeed,
+    __version__,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import TemplateError
@@ -307,6 +310,91 @@ async def test_import_change(hass: HomeAssistant) -> None:
     assert to_test.async_render() == "macro2 variable2"
 
 
+async def test_bytecode_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled templates are saved and loaded by the next run."""
+    await template.async_load_custom_templates(hass)
+    await template.async_load_bytecode_cache(hass)
+    cache = template._get_bytecode_cache(hass)
+    tpl = template.Template("{{ 1 + 1 }}", hass)
+    tpl.ensure_valid()
+    assert cache.misses == 1
+    assert cache.hits == 0
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=2))
+    await hass.async_block_till_done()
+    saved = hass_storage[template.BYTECODE_STORAGE_KEY]
+    assert saved["data"]["ha_version"] == __version__
+    assert len(saved["data"]["bytecode"]) == 1
+
+    # The next run loads the bytecode instead of compiling
+    next_cache = template.TemplateBytecodeCache(hass)
+    next_cache.async_set_custom_templates(template._get_hass_loader(hass).sources)
+    await next_cache.async_load()
+    env = template.TemplateEnvironment(hass)
+    bucket = next_cache.get_source_bucket(env, "{{ 1 + 1 }}")
+    assert bucket.code is not None
+    assert next_cache.hits == 1
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+
+    # Custom template changes invalidate the bytecode
+    next_cache.async_set_custom_templates({"new.jinja": "{% set a = 1 %}"})
+    bucket = next_cache.get_source_bucket(env, "{{ 1 + 1 }}")
+    assert bucket.code is None
+    assert next_cache.misses == 1
+
+    # The bytecode of another version is not used
+    saved["data"]["ha_version"] = "0.1"
+    next_cache = template.TemplateBytecodeCache(hass)
+    await next_cache.async_load()
+    bucket = next_cache.get_source_bucket(env, "{{ 1 + 1 }}")
+    assert bucket.code is None
+
+
+async def test_bytecode_cache_only_saves_startup_templates(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test templates rendered after startup are not saved."""
+    await template.async_load_bytecode_cache(hass)
+    cache = template._get_bytecode_cache(hass)
+    template.Template("{{ 1 + 1 }}", hass).ensure_valid()
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    template.Template("{{ 2 + 2 }}", hass).ensure_valid()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=2))
+    await hass.async_block_till_done()
+    saved = hass_storage[template.BYTECODE_STORAGE_KEY]
+    assert list(saved["data"]["bytecode"]) == [
+        f"source:{cache.get_source_checksum('{{ 1 + 1 }}')}"
+    ]
+
+    # Compiling more templates does not schedule another save
+    hass_storage.pop(template.BYTECODE_STORAGE_KEY)
+    template.Template("{{ 3 + 3 }}", hass).ensure_valid()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=4))
+    await hass.async_block_till_done()
+    assert template.BYTECODE_STORAGE_KEY not in hass_storage
+
+
+async def test_bytecode_cache_size(hass: HomeAssistant) -> None:
+    """Test the bytecode kept in memory is limited."""
+    cache = template._get_bytecode_cache(hass)
+    env = template.TemplateEnvironment(hass)
+    with patch.object(cache, "_bytecode", LRU(2)):
+        for number in range(3):
+            env.compile(f"{{{{ {number} }}}}")
+        assert cache.misses == 3
+        assert len(cache._bytecode) == 2
+        assert env._compile_with_bytecode_cache("{{ 2 }}")
+        assert env._compile_with_bytecode_cache("{{ 0 }}")
+        assert cache.hits == 1
+        assert cache.misses == 4
+
+
 def test_loop_controls(hass: HomeAssistant) -> None:
     """Test that loop controls are enabled."""
     assert (
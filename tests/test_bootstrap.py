@@ -11,9 +11,13 @@ import pytest
 from homeassistant import bootstrap, runner
 import homeassistant.config as config_util
 from homeassistant.config_entries import HANDLERS, ConfigEntry
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STARTED,
+    SIGNAL_BOOTSTRAP_INTEGRATIONS,
+)
 from homeassistant.core import HomeAssistant, async_get_hass, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration
@@ -130,6 +134,72 @@ async def test_setting_up_config(hass: HomeAssistant) -> None:
 
 
 @pytest.mark.parametrize("load_registries", [False])
+async def test_startup_trace(hass: HomeAssistant) -> None:
+    """Test the startup timeline is written as a Chrome trace once started."""
+
+    async def async_setup(hass, config):
+        return True
+
+    async def async_setup_entry(hass, entry):
+        return True
+
+    mock_integration(
+        hass,
+        MockModule(
+            domain="root", async_setup=async_setup, async_setup_entry=async_setup_entry
+        ),
+    )
+    mock_entity_platform(hass, "config_flow.root", None)
+    MockConfigEntry(domain="root", title="Root entry").add_to_hass(hass)
+
+    class MockConfigFlow:
+        """Mock the root config flow."""
+
+        VERSION = 1
+
+    bootstrap.async_record_startup_timeline(hass)
+    with patch.dict(HANDLERS, {"root": MockConfigFlow}), patch(
+        "homeassistant.components.logger.async_setup", return_value=True
+    ), patch("homeassistant.bootstrap.save_json") as mock_save_json:
+        await bootstrap._async_set_up_integrations(hass, {"root": {}, "logger": {}})
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+
+    assert "root" in hass.config.components
+    path, trace = mock_save_json.mock_calls[0][1]
+    assert path == hass.config.path(bootstrap.STARTUP_TRACE_FILENAME)
+
+    lanes = {
+        event["args"]["name"]: event["tid"]
+        for event in trace["traceEvents"]
+        if event["name"] == "thread_name"
+    }
+    spans = {
+        (event["name"], event["tid"])
+        for event in trace["traceEvents"]
+        if event["ph"] == "X"
+    }
+    for name, lane in (
+        ("startup", "bootstrap"),
+        ("resolve dependencies", "bootstrap"),
+        ("logging", "bootstrap"),
+        ("stage 2", "bootstrap"),
+        ("wrap up", "bootstrap"),
+        ("dependencies", "root"),
+        ("requirements", "root"),
+        ("import", "root"),
+        ("config", "root"),
+        ("async_setup", "root"),
+        ("setup", "root"),
+        ("async_setup_entry", "root: Root entry"),
+    ):
+        assert (name, lanes[lane]) in spans
+
+    # Spans are no longer recorded once started
+    timeline = hass.data[bootstrap.loader.DATA_STARTUP_TIMELINE]
+    assert not timeline.recording
+
+
 async def test_setup_after_deps_all_present(hass: HomeAssistant) -> None:
     """Test after_dependencies when all present."""
     order = []
@@ -221,6 +291,50 @@ async def test_setup_after_deps_in_stage_1_ignored(hass: HomeAssistant) -> None:
     assert order == ["cloud", "an_after_dep", "normal_integration"]
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_stage_1_setup_does_not_wait_for_stage_2_imports(
+    hass: HomeAssistant,
+) -> None:
+    """Test stage 1 is set up while the stage 2 integrations are imported."""
+    order = []
+    stage_1_set_up = asyncio.Event()
+
+    async def mock_import_integrations(hass, integrations, platforms):
+        domains = {integration.domain for integration in integrations}
+        order.append(("import", domains))
+        if "normal_integration" in domains:
+            await stage_1_set_up.wait()
+
+    def gen_domain_setup(domain):
+        async def async_setup(hass, config):
+            order.append(("setup", domain))
+            if domain == "cloud":
+                stage_1_set_up.set()
+            return True
+
+        return async_setup
+
+    for domain in ("cloud", "normal_integration"):
+        mock_integration(
+            hass, MockModule(domain=domain, async_setup=gen_domain_setup(domain))
+        )
+
+    with patch(
+        "homeassistant.bootstrap.loader.async_import_integrations_in_executor",
+        mock_import_integrations,
+    ):
+        await bootstrap._async_set_up_integrations(
+            hass, {"cloud": {}, "normal_integration": {}}
+        )
+
+    assert order == [
+        ("import", {"cloud"}),
+        ("import", {"normal_integration"}),
+        ("setup", "cloud"),
+        ("setup", "normal_integration"),
+    ]
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_frontend_before_recorder(hass: HomeAssistant) -> None:
     """Test frontend is setup before recorder."""
@@ -959,3 +1073,21 @@ async def test_bootstrap_dependencies(
     assert (
         f"Dependency {integration} will wait for dependencies ['mqtt']" in caplog.text
     )
+
+
+async def test_integration_platforms_to_import(hass: HomeAssistant) -> None:
+    """Test only the platforms an integration is expected to set up are imported."""
+    entity_registry = er.async_get(hass)
+    entity_registry.async_get_or_create("sensor", "sun", "elevation")
+    entity_registry.async_get_or_create("binary_sensor", "sun", "solar_rising")
+    config = {
+        "light": [{"platform": "demo"}],
+        "switch 2": {"platform": "demo"},
+        "sensor": None,
+        "sun": {},
+    }
+
+    assert bootstrap._async_get_integration_platforms(hass, config) == {
+        "sun": {"sensor", "binary_sensor"},
+        "demo": {"light", "switch"},
+    }
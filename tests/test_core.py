@@ -634,6 +634,72 @@ async def test_eventbus_run_immediately(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_unsubscribe_during_dispatch(hass: HomeAssistant) -> None:
+    """Test a listener unsubscribing while an event is dispatched."""
+    calls = []
+
+    @ha.callback
+    def listener_1(event):
+        """Mock listener that unsubscribes itself."""
+        calls.append(1)
+        unsub_1()
+
+    @ha.callback
+    def listener_2(event):
+        """Mock listener."""
+        calls.append(2)
+
+    unsub_1 = hass.bus.async_listen("test", listener_1, run_immediately=True)
+    unsub_2 = hass.bus.async_listen("test", listener_2, run_immediately=True)
+
+    hass.bus.async_fire("test")
+    assert calls == [1, 2]
+
+    hass.bus.async_fire("test")
+    assert calls == [1, 2, 2]
+
+    unsub_2()
+    assert "test" not in hass.bus.async_listeners()
+
+
+async def test_eventbus_listeners_changed_after_fire(hass: HomeAssistant) -> None:
+    """Test listeners added after an event type was fired are dispatched to."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(("test", event.event_type))
+
+    @ha.callback
+    def match_all_listener(event):
+        """Mock MATCH_ALL listener which subscribes another listener."""
+        calls.append((MATCH_ALL, event.event_type))
+        unsubs.append(hass.bus.async_listen("test", listener, run_immediately=True))
+
+    unsubs = [
+        hass.bus.async_listen(MATCH_ALL, match_all_listener, run_immediately=True)
+    ]
+    hass.bus.async_fire("test")
+    # The listener subscribed during dispatch only sees the next event
+    assert calls == [(MATCH_ALL, "test")]
+
+    hass.bus.async_fire("test")
+    assert calls == [(MATCH_ALL, "test"), (MATCH_ALL, "test"), ("test", "test")]
+
+    unsubs.pop(0)()
+    calls.clear()
+    hass.bus.async_fire("test")
+    assert calls == [("test", "test"), ("test", "test")]
+
+    for unsub in unsubs:
+        unsub()
+    calls.clear()
+    hass.bus.async_fire("test")
+    assert calls == []
+    assert "test" not in hass.bus.async_listeners()
+
+
 async def test_eventbus_unsubscribe_listener(hass: HomeAssistant) -> None:
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -932,6 +998,49 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_shares_attributes(hass: HomeAssistant) -> None:
+    """Test identical attributes are shared between states."""
+    attributes = {"unit_of_measurement": "W", "device_class": "power"}
+    hass.states.async_set("sensor.one", "1", attributes)
+    hass.states.async_set("sensor.two", "2", dict(attributes))
+    one = hass.states.get("sensor.one")
+    two = hass.states.get("sensor.two")
+    assert one.attributes is two.attributes
+    assert one.attributes == attributes
+
+    # A new state with the same attributes keeps them
+    hass.states.async_set("sensor.one", "3", attributes)
+    assert hass.states.get("sensor.one").attributes is one.attributes
+
+    # Values of different types or keys in a different order are not shared
+    hass.states.async_set("sensor.three", "3", {"value": 1})
+    hass.states.async_set("sensor.four", "4", {"value": True})
+    assert hass.states.get("sensor.four").attributes["value"] is True
+    hass.states.async_set(
+        "sensor.five", "5", {"device_class": "power", "unit_of_measurement": "W"}
+    )
+    assert list(hass.states.get("sensor.five").attributes) == [
+        "device_class",
+        "unit_of_measurement",
+    ]
+
+    # Mutable values are not shared
+    hass.states.async_set("sensor.six", "6", {"options": ["a"]})
+    hass.states.async_set("sensor.seven", "7", {"options": ["a"]})
+    assert (
+        hass.states.get("sensor.six").attributes
+        is not hass.states.get("sensor.seven").attributes
+    )
+
+
+def test_state_domain_and_object_id_shared() -> None:
+    """Test the domain and object_id of a state."""
+    state = ha.State("light.bowl", "on")
+    assert state.domain == "light"
+    assert state.object_id == "bowl"
+    assert state.domain is ha.State("light.kitchen", "on").domain
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -1763,6 +1872,76 @@ async def test_async_entity_ids_count(hass: HomeAssistant) -> None:
     assert hass.states.async_entity_ids_count("light") == 3
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states in one batch."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    await hass.async_block_till_done()
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set_many(
+        [
+            ("light.Bowl", "on", {"brightness": 100}),
+            ("light.frog", "off", None),
+            ("switch.link", "on", {"friendly_name": "Link"}),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    # The unchanged light.bowl is not written
+    assert [event.data["entity_id"] for event in events] == [
+        "light.frog",
+        "switch.link",
+    ]
+    assert events[0].context is events[1].context
+    assert events[0].time_fired == events[1].time_fired
+    assert hass.states.get("light.frog").last_updated == events[0].time_fired
+    assert hass.states.get("switch.link").attributes == {"friendly_name": "Link"}
+
+    context = ha.Context()
+    hass.states.async_set_many(
+        [("light.bowl", "on", {"brightness": 100})], force_update=True, context=context
+    )
+    await hass.async_block_till_done()
+
+    assert len(events) == 3
+    assert events[2].context is context
+    assert events[2].data["old_state"].last_changed != (
+        events[2].data["new_state"].last_changed
+    )
+
+
+async def test_statemachine_domain_index(hass: HomeAssistant) -> None:
+    """Test the domain index is kept in sync with the state machine."""
+    hass.states.async_set("switch.link", "on")
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.frog", "on")
+    hass.states.async_set("light.bowl", "off")
+
+    assert hass.states.async_entity_ids("light") == ["light.bowl", "light.frog"]
+    assert hass.states.async_entity_ids("LIGHT") == ["light.bowl", "light.frog"]
+    assert [state.state for state in hass.states.async_all("light")] == ["off", "on"]
+    assert hass.states.async_all("light")[0] is hass.states.get("light.bowl")
+    assert hass.states.async_entity_ids_count(["light", "switch"]) == 3
+    assert set(hass.states.async_entity_ids(["light", "switch"])) == {
+        "switch.link",
+        "light.bowl",
+        "light.frog",
+    }
+
+    assert hass.states.async_remove("light.bowl")
+    assert hass.states.async_entity_ids("light") == ["light.frog"]
+    assert hass.states.async_entity_ids_count("light") == 1
+
+    assert hass.states.async_remove("light.frog")
+    assert hass.states.async_entity_ids("light") == []
+    assert hass.states.async_all("light") == []
+    assert hass.states.async_entity_ids_count("light") == 0
+
+    # Querying a domain that was never set must not create an index entry
+    assert hass.states.async_all("vacuum") == []
+    assert "vacuum" not in hass.states._states._domain_index
+
+
 async def test_hassjob_forbid_coroutine() -> None:
     """Test hassjob forbids coroutines."""
 
@@ -726,3 +726,43 @@ async def test_loggers(hass: HomeAssistant) -> None:
         },
     )
     assert integration.loggers == ["name1", "name2"]
+
+
+async def test_import_integrations_in_executor(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test importing integrations and their platforms in the import executor."""
+    sun = await loader.async_get_integration(hass, "sun")
+    custom = await loader.async_get_integration(hass, "test")
+    opted_out = await loader.async_get_integration(hass, "zone")
+    opted_out.manifest["import_executor"] = False
+
+    await loader.async_import_integrations_in_executor(
+        hass,
+        [sun, custom, opted_out],
+        {"sun": ["sensor", "light"], "test": ["light"], "zone": ["sensor"]},
+    )
+
+    cache = hass.data[loader.DATA_COMPONENTS]
+    assert "sun" in cache
+    assert "sun.sensor" in cache
+    assert "sun.light" not in cache
+    assert "sun.config_flow" not in cache
+    assert "test" not in cache
+    assert "zone" not in cache
+    assert sun.get_component() is cache["sun"]
+
+
+async def test_import_integrations_in_executor_failure(hass: HomeAssistant) -> None:
+    """Test integrations which fail to import are left to the event loop."""
+    sun = await loader.async_get_integration(hass, "sun")
+
+    with patch(
+        "homeassistant.loader.importlib.import_module", side_effect=RuntimeError
+    ):
+        await loader.async_import_integrations_in_executor(
+            hass, [sun], {"sun": ["sensor"]}
+        )
+
+    assert "sun" not in hass.data[loader.DATA_COMPONENTS]
+    assert sun.get_component().DOMAIN == "sun"
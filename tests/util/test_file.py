@@ -6,7 +6,13 @@ from unittest.mock import patch
 import py
 import pytest
 
-from homeassistant.util.file import WriteError, write_utf8_file, write_utf8_file_atomic
+from homeassistant.util.file import (
+    WriteError,
+    write_utf8_chunks,
+    write_utf8_chunks_atomic,
+    write_utf8_file,
+    write_utf8_file_atomic,
+)
 
 
 @pytest.mark.parametrize("func", [write_utf8_file, write_utf8_file_atomic])
@@ -26,6 +32,18 @@ def test_write_utf8_file_atomic_private(tmpdir: py.path.local, func) -> None:
     assert os.stat(test_file).st_mode & 0o777 == 0o600
 
 
+@pytest.mark.parametrize("func", [write_utf8_chunks, write_utf8_chunks_atomic])
+def test_write_utf8_chunks(tmpdir: py.path.local, func) -> None:
+    """Test chunks are written to one file."""
+    test_dir = tmpdir.mkdir("files")
+    test_file = Path(test_dir / "test.json")
+
+    func(test_file, iter((b'{"some":', '"dätä"}'.encode())), False)
+    with open(test_file, encoding="utf-8") as fh:
+        assert fh.read() == '{"some":"dätä"}'
+    assert os.stat(test_file).st_mode & 0o777 == 0o644
+
+
 def test_write_utf8_file_fails_at_creation(tmpdir: py.path.local) -> None:
     """Test that failed creation of the temp file does not create an empty file."""
     test_dir = tmpdir.mkdir("files")
@@ -0,0 +1,81 @@
+"""Test the timeline util."""
+from unittest.mock import patch
+
+from homeassistant.util.timeline import Timeline
+
+
+def test_timeline() -> None:
+    """Test spans are exported as Chrome trace events."""
+    with patch("homeassistant.util.timeline.time.monotonic", return_value=10.0):
+        timeline = Timeline()
+
+    timeline.add_span("setup", "setup", "light", 10.5, 12.0, {"key": "value"})
+    with patch(
+        "homeassistant.util.timeline.time.monotonic", side_effect=[11.0, 11.25]
+    ), timeline.span("import", "import", "light"):
+        pass
+    timeline.add_span("stage 1", "bootstrap", "bootstrap", 10.0, 13.0)
+    timeline.stop()
+    timeline.add_span("ignored", "setup", "light", 14.0, 15.0)
+
+    assert timeline.as_trace() == {
+        "displayTimeUnit": "ms",
+        "traceEvents": [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 1,
+                "args": {"name": "light"},
+            },
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 2,
+                "args": {"name": "bootstrap"},
+            },
+            {
+                "name": "thread_sort_index",
+                "ph": "M",
+                "pid": 1,
+                "tid": 1,
+                "args": {"sort_index": 1},
+            },
+            {
+                "name": "thread_sort_index",
+                "ph": "M",
+                "pid": 1,
+                "tid": 2,
+                "args": {"sort_index": 2},
+            },
+            {
+                "name": "setup",
+                "cat": "setup",
+                "ph": "X",
+                "ts": 500000,
+                "dur": 1500000,
+                "pid": 1,
+                "tid": 1,
+                "args": {"key": "value"},
+            },
+            {
+                "name": "import",
+                "cat": "import",
+                "ph": "X",
+                "ts": 1000000,
+                "dur": 250000,
+                "pid": 1,
+                "tid": 1,
+            },
+            {
+                "name": "stage 1",
+                "cat": "bootstrap",
+                "ph": "X",
+                "ts": 0,
+                "dur": 3000000,
+                "pid": 1,
+                "tid": 2,
+            },
+        ],
+    }